@@ -7,6 +7,8 @@ from src.auth.login_callbacks import register_login_callbacks
 from src.auth.layout_callbacks import register_layout_callbacks
 from src.components.sidebar_callbacks import register_sidebar_callbacks
 from src.core.cache import init_cache
+from src.core.version_watch import init_version_watch
+from src.core.warmup import init_warmup
 from src.layout import create_layout
 from src.data.config import settings
 
@@ -42,6 +44,12 @@ register_sidebar_callbacks(app)
 # Initialize cache
 init_cache(app.server)
 
+# Preload dashboard datasets in the background; /readyz reports progress
+init_warmup(app.server)
+
+# Refresh datasets as soon as an ETL load publishes a new version
+init_version_watch(app.server)
+
 # Set layout
 app.layout = create_layout()
 
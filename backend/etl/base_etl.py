@@ -1,12 +1,30 @@
 """Base ETL class for common ETL operations."""
 from abc import ABC, abstractmethod
+from datetime import datetime, timezone
 from typing import Optional
 import io
+import logging
+import math
 import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
+from botocore.exceptions import ClientError
 from src.data.s3_client import get_s3_client
 from src.data.config import settings
+from src.data.manifest import (
+    LAYOUT_PARTITIONED,
+    LAYOUT_SINGLE,
+    DatasetManifest,
+    ManifestFile,
+    manifest_file_from_upload,
+    manifest_key,
+    partition_from_key,
+    schema_entries,
+)
+from src.data.dataset_version import PublishedVersion, version_key
+from src.data.object_cache import normalize_etag
+
+logger = logging.getLogger(__name__)
 
 
 class BaseETL(ABC):
@@ -41,7 +59,12 @@ class BaseETL(ABC):
 
         S3 path:
             Non-partitioned: datasets/{id}/data/part-0000.parquet
-            Partitioned: datasets/{id}/partitions/date=YYYY-MM-DD/part-0000.parquet
+            Partitioned: datasets/{id}/partitions/date=YYYY-MM-DD/part-NNNN.parquet
+                         (split into several parts when larger than
+                         settings.etl_part_target_bytes)
+            Manifest: datasets/{id}/_manifest.json (written after all data)
+            Version marker: _dataset_versions/{id}.json (written last; see
+                            src.data.dataset_version)
         """
         client = get_s3_client()
         bucket = settings.s3_bucket
@@ -49,29 +72,250 @@ class BaseETL(ABC):
         if partition_column and partition_column in df.columns:
             # Partitioned upload
             df[partition_column] = pd.to_datetime(df[partition_column])
+            written = []
             for date_value, partition_df in df.groupby(df[partition_column].dt.date):
                 date_str = date_value.isoformat()
-                s3_key = (
-                    f"datasets/{dataset_id}/partitions/date={date_str}/part-0000.parquet"
+                written.extend(
+                    self._upload_partition(client, bucket, dataset_id, date_str, partition_df)
                 )
-                self._upload_parquet(client, bucket, s3_key, partition_df)
+            layout = LAYOUT_PARTITIONED
+            files = self._collect_partition_files(client, bucket, dataset_id, written)
         else:
             # Non-partitioned upload
             s3_key = f"datasets/{dataset_id}/data/part-0000.parquet"
-            self._upload_parquet(client, bucket, s3_key, df)
+            layout = LAYOUT_SINGLE
+            files = [self._upload_parquet(client, bucket, s3_key, df)]
+
+        manifest = DatasetManifest(
+            dataset_id=dataset_id,
+            layout=layout,
+            files=files,
+            schema=schema_entries(pa.Schema.from_pandas(df, preserve_index=False)),
+            created_at=datetime.now(timezone.utc).isoformat(),
+        )
+        response = client.put_object(
+            Bucket=bucket,
+            Key=manifest_key(dataset_id),
+            Body=manifest.to_json().encode("utf-8"),
+            ContentType="application/json",
+        )
+        self._publish_version(client, bucket, dataset_id, normalize_etag(response["ETag"]))
+
+    def _publish_version(
+        self, client, bucket: str, dataset_id: str, manifest_etag: str
+    ) -> PublishedVersion:
+        """Write the dataset's version marker with the next version number.
+
+        Dashboards poll the markers and refresh only the datasets whose marker
+        changed, so this is written after everything else of the load.
+
+        Returns:
+            The published marker.
+        """
+        previous = self._read_published_version(client, bucket, dataset_id)
+        published = PublishedVersion(
+            dataset_id=dataset_id,
+            version=previous.version + 1 if previous else 1,
+            published_at=datetime.now(timezone.utc).isoformat(),
+            manifest_etag=manifest_etag,
+        )
+        client.put_object(
+            Bucket=bucket,
+            Key=version_key(dataset_id),
+            Body=published.to_json().encode("utf-8"),
+            ContentType="application/json",
+        )
+        logger.info("Published dataset %s version %d", dataset_id, published.version)
+        return published
 
     def _upload_parquet(
-        self, client, bucket: str, key: str, df: pd.DataFrame
-    ) -> None:
-        """Helper to upload DataFrame as Parquet to S3."""
+        self,
+        client,
+        bucket: str,
+        key: str,
+        df: pd.DataFrame,
+        partition: Optional[str] = None,
+    ) -> ManifestFile:
+        """Helper to upload DataFrame as Parquet to S3.
+
+        Returns:
+            Manifest entry (size, ETag, row count, statistics) for the object.
+        """
         table = pa.Table.from_pandas(df)
-        buf = io.BytesIO()
-        pq.write_table(table, buf)
-        buf.seek(0)
-        client.put_object(Bucket=bucket, Key=key, Body=buf.read())
+        return self._put_table(client, bucket, key, table, _parquet_bytes(table), partition)
+
+    def _upload_partition(
+        self,
+        client,
+        bucket: str,
+        dataset_id: str,
+        date_str: str,
+        df: pd.DataFrame,
+    ) -> list[ManifestFile]:
+        """Upload one partition as part-NNNN files of about etl_part_target_bytes.
+
+        A partition that encodes larger than the target is split by rows into
+        equally sized parts, so each object stays bounded and readers can fetch
+        the parts in parallel. Parts left over from an earlier, larger load of
+        the same date are deleted afterwards.
+
+        Returns:
+            Manifest entries of the uploaded parts, in part order.
+        """
+        prefix = f"datasets/{dataset_id}/partitions/date={date_str}/"
+        table = pa.Table.from_pandas(df)
+        body = _parquet_bytes(table)
+        part_count = min(
+            max(1, math.ceil(len(body) / max(settings.etl_part_target_bytes, 1))),
+            max(table.num_rows, 1),
+        )
+
+        if part_count == 1:
+            files = [
+                self._put_table(client, bucket, f"{prefix}part-0000.parquet", table, body, date_str)
+            ]
+        else:
+            del body
+            rows_per_part = math.ceil(table.num_rows / part_count)
+            files = []
+            for index, offset in enumerate(range(0, table.num_rows, rows_per_part)):
+                part = table.slice(offset, rows_per_part)
+                files.append(self._put_table(
+                    client, bucket, f"{prefix}part-{index:04d}.parquet",
+                    part, _parquet_bytes(part), date_str,
+                ))
+            logger.info(
+                "Split partition %s of dataset %s into %d parts", date_str, dataset_id, len(files)
+            )
+
+        self._delete_stale_parts(client, bucket, prefix, {f.key for f in files})
+        return files
+
+    def _put_table(
+        self,
+        client,
+        bucket: str,
+        key: str,
+        table: pa.Table,
+        body: bytes,
+        partition: Optional[str] = None,
+    ) -> ManifestFile:
+        """Upload encoded Parquet bytes and describe the object for the manifest."""
+        response = client.put_object(Bucket=bucket, Key=key, Body=body)
+        return manifest_file_from_upload(key, table, len(body), response["ETag"], partition)
+
+    def _delete_stale_parts(self, client, bucket: str, prefix: str, keep: set[str]) -> None:
+        """Delete Parquet objects under *prefix* that are not in *keep*."""
+        stale = []
+        paginator = client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+            for obj in page.get("Contents", []):
+                if obj["Key"].endswith(".parquet") and obj["Key"] not in keep:
+                    stale.append({"Key": obj["Key"]})
+        for start in range(0, len(stale), 1000):
+            client.delete_objects(
+                Bucket=bucket, Delete={"Objects": stale[start:start + 1000], "Quiet": True}
+            )
+
+    def _collect_partition_files(
+        self,
+        client,
+        bucket: str,
+        dataset_id: str,
+        written: list[ManifestFile],
+    ) -> list[ManifestFile]:
+        """Describe every partition object of the dataset, not only this load's.
+
+        Partitions left over from earlier loads stay readable (as they are when
+        listing), so they are kept in the manifest. Their row counts and
+        statistics are carried over from the previous manifest when the object
+        is unchanged, and left unknown otherwise.
+        """
+        written_by_key = {f.key: f for f in written}
+        previous = self._read_previous_manifest(client, bucket, dataset_id)
+        previous_by_key = {f.key: f for f in previous.files} if previous else {}
+
+        files = []
+        paginator = client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(
+            Bucket=bucket, Prefix=f"datasets/{dataset_id}/partitions/"
+        ):
+            for obj in page.get("Contents", []):
+                key = obj["Key"]
+                if not key.endswith(".parquet"):
+                    continue
+                if key in written_by_key:
+                    files.append(written_by_key[key])
+                    continue
+                etag = normalize_etag(obj["ETag"])
+                carried = previous_by_key.get(key)
+                if carried is not None and carried.etag == etag:
+                    files.append(carried)
+                else:
+                    files.append(ManifestFile(
+                        key=key,
+                        size=obj["Size"],
+                        etag=etag,
+                        partition=partition_from_key(key),
+                    ))
+        return files
+
+    def _read_previous_manifest(
+        self, client, bucket: str, dataset_id: str
+    ) -> Optional[DatasetManifest]:
+        """Return the currently published manifest, or None if absent/unreadable.
+
+        Raises:
+            ClientError: For S3 errors other than a missing manifest (e.g.
+                throttling, AccessDenied), so that a transient failure does not
+                publish a manifest without the carried-over partition entries.
+        """
+        try:
+            response = client.get_object(Bucket=bucket, Key=manifest_key(dataset_id))
+            return DatasetManifest.from_json(response["Body"].read().decode("utf-8"))
+        except ClientError as e:
+            if _is_not_found(e):
+                return None
+            raise
+        except ValueError:
+            logger.warning("Ignoring invalid manifest for dataset %s", dataset_id)
+            return None
+
+    def _read_published_version(
+        self, client, bucket: str, dataset_id: str
+    ) -> Optional[PublishedVersion]:
+        """Return the currently published version marker, or None if absent/unreadable.
+
+        Raises:
+            ClientError: For S3 errors other than a missing marker (e.g.
+                throttling, AccessDenied), so that a transient failure does not
+                republish the dataset as version 1.
+        """
+        try:
+            response = client.get_object(Bucket=bucket, Key=version_key(dataset_id))
+            return PublishedVersion.from_json(response["Body"].read().decode("utf-8"))
+        except ClientError as e:
+            if _is_not_found(e):
+                return None
+            raise
+        except ValueError:
+            logger.warning("Ignoring invalid version marker for dataset %s", dataset_id)
+            return None
 
     def run(self, dataset_id: str) -> None:
         """Execute extract -> transform -> load."""
         df = self.extract()
         df = self.transform(df)
         self.load(df, dataset_id)
+
+
+def _parquet_bytes(table: pa.Table) -> bytes:
+    """Encode an Arrow table as a Parquet file."""
+    buf = io.BytesIO()
+    pq.write_table(table, buf)
+    return buf.getvalue()
+
+
+def _is_not_found(error: ClientError) -> bool:
+    """Return True if a botocore ClientError means the object does not exist."""
+    return error.response["Error"]["Code"] in ("NoSuchKey", "404", "NotFound")
@@ -4,6 +4,7 @@ import requests
 import pandas as pd
 from typing import Optional
 from backend.etl.base_etl import BaseETL
+from src.data.derived_columns import DERIVED_COLUMN_SETS, apply_derived_columns
 from src.data.type_inferrer import infer_schema, apply_types
 
 
@@ -17,6 +18,9 @@ class DomoApiETL(BaseETL):
         client_id: DOMO API Client ID (from .env)
         client_secret: DOMO API Client Secret (from .env)
         partition_column: Optional date column name for partitioning
+        exclude_filter: Optional {"column", "keep_value"} row filter
+        derived_columns: Optional derived column set to materialize
+            (see src.data.derived_columns.DERIVED_COLUMN_SETS)
     """
 
     def __init__(
@@ -26,6 +30,7 @@ class DomoApiETL(BaseETL):
         client_secret: Optional[str] = None,
         partition_column: Optional[str] = None,
         exclude_filter: Optional[dict] = None,
+        derived_columns: Optional[str] = None,
     ):
         self.dataset_id = dataset_id
         # Strip quotes if present (for .env files with quoted values)
@@ -35,12 +40,18 @@ class DomoApiETL(BaseETL):
         ).strip('"')
         self.partition_column = partition_column
         self.exclude_filter = exclude_filter
+        self.derived_columns = derived_columns
         self.access_token: Optional[str] = None
 
         if not self.client_id or not self.client_secret:
             raise ValueError(
                 "DOMO_CLIENT_ID and DOMO_CLIENT_SECRET must be set in .env"
             )
+        if derived_columns and derived_columns not in DERIVED_COLUMN_SETS:
+            raise ValueError(
+                f"Unknown derived_columns '{derived_columns}' "
+                f"(known: {sorted(DERIVED_COLUMN_SETS)})"
+            )
 
     def _get_access_token(self) -> str:
         """Get OAuth2 access token from DOMO API.
@@ -128,7 +139,7 @@ class DomoApiETL(BaseETL):
         return df
 
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Transform data with type inference and optional filtering.
+        """Transform data with type inference, optional filtering and derived columns.
         
         Args:
             df: Raw DataFrame from DOMO
@@ -160,6 +171,13 @@ class DomoApiETL(BaseETL):
             else:
                 print(f"⚠ Exclude filter skipped (column '{column}' not found or invalid config)")
 
+        # ダッシュボード用の派生カラムを事前計算
+        if self.derived_columns:
+            columns_before = set(df.columns)
+            df = apply_derived_columns(df, self.derived_columns)
+            added = [c for c in df.columns if c not in columns_before]
+            print(f"✓ Materialized derived columns ({self.derived_columns}): {len(added)} columns")
+
         print("✓ Data transformation complete")
         print(f"  Final shape: {df.shape}")
 
@@ -103,6 +103,7 @@ def load_dataset(config: Dict, dry_run: bool = False) -> bool:
     minio_dataset_id = config["minio_dataset_id"]
     partition_column = config.get("partition_column")
     exclude_filter = config.get("exclude_filter")
+    derived_columns = config.get("derived_columns")
 
     print(f"\n{'='*60}")
     print(f"DataSet: {name}")
@@ -114,6 +115,8 @@ def load_dataset(config: Dict, dry_run: bool = False) -> bool:
     # 除外フィルター情報を表示
     if exclude_filter:
         print(f"Exclude Filter: {exclude_filter['column']} == '{exclude_filter['keep_value']}'")
+    if derived_columns:
+        print(f"Derived Columns: {derived_columns}")
     
     print()
 
@@ -127,6 +130,7 @@ def load_dataset(config: Dict, dry_run: bool = False) -> bool:
             dataset_id=domo_dataset_id,
             partition_column=partition_column,
             exclude_filter=exclude_filter,
+            derived_columns=derived_columns,
         )
 
         # Run ETL pipeline
@@ -1,50 +1,776 @@
-"""TTL cache for dataset caching."""
+"""Dataset cache with version-aware, stale-while-revalidate refresh."""
+import json
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Callable, Optional, TypeVar
+from flask import current_app
 from flask_caching import Cache
 import pandas as pd
+import pyarrow as pa
+from src.core.memory_cache import enable_copy_on_write, protect
+from src.core.prepared_views import prepare_view
+from src.core.shared_cache import SharedDatasetStore, SharedFrame, get_shared_store
+from src.data.config import settings
 from src.data.parquet_reader import ParquetReader
+from src.exceptions import DatasetFileNotFoundError
+
+logger = logging.getLogger(__name__)
 
 cache = Cache()
 
+# Revalidation bookkeeping (per process). Kept outside the cache so that
+# refreshing a timestamp never re-serializes the cached DataFrame.
+# _checked_at: last check attempt; _verified_at: last time the entry was
+# known to be current (loaded, or its version confirmed); _forced_failed_at:
+# last failed synchronous revalidation of an entry past the maximum staleness.
+_checked_at: dict[str, float] = {}
+_verified_at: dict[str, float] = {}
+_forced_failed_at: dict[str, float] = {}
+_revalidating: set[str] = set()
+# In-flight operations (single-flight): concurrent callers wait on the first
+# caller's operation instead of repeating it. Keys are "<operation>:<cache key>"
+# (see _flight_key), so a load never receives a revalidation's result.
+_inflight: dict[str, Future] = {}
+FLIGHT_LOAD = "load"
+FLIGHT_REVALIDATE = "revalidate"
+FLIGHT_INDEX = "index"
+# Dataset ID -> key of its most recently loaded entry (get_cached_version)
+_version_keys: dict[str, str] = {}
+# Dataset ID -> keys of all its dataset reads and partition index (refresh_dataset)
+_dataset_keys: dict[str, set[str]] = {}
+_state_lock = threading.Lock()
+# Called with the dataset ID after an entry was refreshed to a new version
+_refresh_listeners: list[Callable[[str], None]] = []
+
+T = TypeVar("T")
+
+
+@dataclass
+class CachedDataset:
+    """Cache entry: dataset contents plus the version they were read at.
+
+    columns/categories/view are the read options, kept so that a background
+    refresh can re-read (and re-prepare) the entry in the same shape.
+    mapped_nbytes is the part of df's column data memory-mapped from the
+    shared store, which the memory budget does not count.
+    """
+
+    df: pd.DataFrame
+    version: Optional[str]
+    columns: Optional[list[str]] = None
+    categories: Optional[list[str]] = None
+    view: Optional[str] = None
+    mapped_nbytes: int = 0
+
+
+@dataclass
+class PartitionIndex:
+    """Cache entry: partition versions of a dataset (None: not partitioned)."""
 
-def init_cache(server) -> None:
+    partitions: Optional[dict[str, str]]
+    version: Optional[str]
+
+
+def init_cache(server, max_bytes: Optional[int] = None) -> None:
     """
     Initialize cache on Flask server.
 
+    Entries have no time-based expiry; freshness is handled by version
+    revalidation in get_cached_dataset (see settings.cache_revalidate_seconds).
+    The InProcessCache backend stores entries without pickling, so a hit
+    returns the cached DataFrame itself (as a copy-on-write shallow copy).
+    Memory is bounded by a byte budget with LRU eviction.
+
     Args:
         server: Flask server instance (app.server)
+        max_bytes: Budget for the estimated size of all entries
+                   (default: settings.cache_max_bytes; 0: unbounded)
     """
+    enable_copy_on_write()
     cache.init_app(server, config={
-        "CACHE_TYPE": "SimpleCache",
-        "CACHE_DEFAULT_TIMEOUT": 300,  # 5 minutes
+        "CACHE_TYPE": "src.core.memory_cache.InProcessCache",
+        "CACHE_DEFAULT_TIMEOUT": 0,  # never expire; revalidated by version
+        "CACHE_MAX_BYTES": settings.cache_max_bytes if max_bytes is None else max_bytes,
     })
 
 
-def get_cached_dataset(reader: ParquetReader, dataset_id: str) -> pd.DataFrame:
+def build_cache_key(
+    dataset_id: str,
+    columns: Optional[list[str]] = None,
+    categories: Optional[list[str]] = None,
+    view: Optional[str] = None,
+) -> str:
+    """
+    Build the cache key for a dataset read.
+
+    The column projection, categorical columns and prepared view are part of
+    the key so that reads with different shapes or dtypes of the same dataset
+    never shadow each other.
+
+    Args:
+        dataset_id: Dataset ID
+        columns: Optional column projection
+        categories: Optional columns loaded as category dtype
+        view: Optional prepared view name (see src.core.prepared_views)
+
+    Returns:
+        Cache key string
+    """
+    key = f"dataset:{dataset_id}"
+    if columns is not None:
+        key += f":columns={json.dumps(list(columns))}"
+    if categories:
+        key += f":categories={json.dumps(list(categories))}"
+    if view is not None:
+        key += f":view={view}"
+    return key
+
+
+def build_partition_cache_key(
+    dataset_id: str,
+    partition: str,
+    columns: Optional[list[str]] = None,
+    categories: Optional[list[str]] = None,
+    view: Optional[str] = None,
+) -> str:
+    """
+    Build the cache key for one partition of a dataset read.
+
+    Args:
+        dataset_id: Dataset ID
+        partition: Partition date (YYYY-MM-DD)
+        columns: Optional column projection
+        categories: Optional columns loaded as category dtype
+        view: Optional prepared view name
+
+    Returns:
+        Cache key string
+    """
+    return f"{build_cache_key(dataset_id, columns, categories, view)}:partition={partition}"
+
+
+def get_cached_dataset(
+    reader: ParquetReader,
+    dataset_id: str,
+    columns: Optional[list[str]] = None,
+    categories: Optional[list[str]] = None,
+    date_range: Optional[tuple[str, str]] = None,
+    view: Optional[str] = None,
+) -> pd.DataFrame:
     """
     Get dataset through cache.
     On cache miss, reads from ParquetReader and stores in cache.
 
-    Cache key: dataset_id only
+    Cache key: dataset_id + column projection + categorical columns + view
     (Filters are applied in memory, so cache key doesn't include filter conditions)
 
+    With *view*, the prepare step registered under that name
+    (src.core.prepared_views) runs once per dataset version, or once per
+    partition version, and its result is what gets cached; callers receive
+    copy-on-write views of it and must not prepare or copy it again.
+
+    Entries are kept until the underlying data changes (stale-while-revalidate).
+    A hit on an entry that has not been checked for
+    ``settings.cache_revalidate_seconds`` is served immediately and starts a
+    background version check, which re-reads the entry if the data changed.
+    Only an entry not known to be current for longer than
+    ``settings.cache_max_stale_seconds`` (e.g. refreshes keep failing) is
+    revalidated synchronously before it is served; if that fails too, the
+    stale entry is served and the synchronous retry waits
+    ``settings.cache_revalidate_seconds``.
+
+    Concurrent misses on the same key are coalesced: the first caller loads,
+    the others wait for it and get its result (or its exception).
+
+    With ``settings.cache_shared_dir`` set, a miss first looks for the
+    current version in the shared directory (written by any worker) and
+    memory-maps it instead of reading S3; data read from S3 is written there
+    for the other workers.
+
     Args:
         reader: ParquetReader instance
         dataset_id: Dataset ID
+        columns: Optional column projection passed to ParquetReader.read_dataset.
+                 None reads (and caches) every column.
+        categories: Optional string columns loaded as pandas ``category``
+                    (see ParquetReader.read_dataset).
+        date_range: Optional (start_date, end_date), inclusive, YYYY-MM-DD.
+                    For partitioned datasets only the partitions inside the
+                    range are loaded; each is cached on its own, so
+                    overlapping ranges reuse them. Rows are not filtered
+                    beyond partition granularity. Ignored for
+                    non-partitioned datasets (the full dataset is returned).
+        view: Optional prepared view name (see register_prepared_view).
 
     Returns:
         DataFrame
     """
-    cache_key = f"dataset:{dataset_id}"
+    if date_range is not None:
+        partitions = _get_partition_index(reader, dataset_id).partitions
+        if partitions is not None:
+            return _get_cached_partitions(
+                reader, dataset_id, partitions, date_range, columns, categories, view
+            )
+
+    cache_key = build_cache_key(dataset_id, columns, categories, view)
 
     # Try to get from cache
-    cached_df = cache.get(cache_key)
-    if cached_df is not None:
-        return cached_df
+    entry = _get_entry(reader, dataset_id, cache_key)
+    if entry is not None:
+        return protect(entry.df)
+
+    df = _single_flight(
+        FLIGHT_LOAD,
+        cache_key,
+        lambda: _load_dataset(reader, dataset_id, cache_key, columns, categories, view),
+    )
+    return protect(df)
+
 
-    # Cache miss: read from S3
-    df = reader.read_dataset(dataset_id)
+def _load_dataset(
+    reader: ParquetReader,
+    dataset_id: str,
+    cache_key: str,
+    columns: Optional[list[str]],
+    categories: Optional[list[str]],
+    view: Optional[str] = None,
+) -> pd.DataFrame:
+    """Load a dataset on a cache miss and store it (run by the single-flight leader)."""
+    # A load that finished between the caller's miss and its claim
+    entry = cache.get(cache_key)
+    if entry is not None:
+        return entry.df
+
+    # Cache miss: read from S3. The version is taken before the data so that a
+    # concurrent ETL write shows up as a version change on the next check.
+    version = _fetch_version(reader, dataset_id)
+    shared = _read_dataset(reader, dataset_id, cache_key, version, columns, categories, view)
 
     # Store in cache
-    cache.set(cache_key, df)
+    cache.set(cache_key, CachedDataset(
+        df=shared.df, version=version, columns=columns, categories=categories, view=view,
+        mapped_nbytes=shared.mapped_nbytes,
+    ))
+    _mark_checked(cache_key)
+    _track_version_key(dataset_id, cache_key)
+    return shared.df
+
+
+def _read_dataset(
+    reader: ParquetReader,
+    dataset_id: str,
+    cache_key: str,
+    version: Optional[str],
+    columns: Optional[list[str]],
+    categories: Optional[list[str]],
+    view: Optional[str] = None,
+) -> SharedFrame:
+    """Read one version of a dataset (prepared for *view*) from the shared store or S3."""
+    shared = _load_shared(cache_key, version)
+    if shared is not None:
+        return shared
+    read_kwargs = {}
+    if columns is not None:
+        read_kwargs["columns"] = columns
+    if categories:
+        read_kwargs["categories"] = categories
+    df = _prepare(view, reader.read_dataset(dataset_id, **read_kwargs))
+    return _store_shared(cache_key, version, df)
+
+
+def _get_entry(reader: ParquetReader, dataset_id: str, cache_key: str):
+    """Return a cached entry (None on miss), scheduling or forcing its revalidation.
+
+    Entries past the maximum staleness are revalidated (and refreshed if
+    changed) before they are returned; others are returned as they are. If
+    that revalidation fails the stale entry is served, and callers do not
+    retry it synchronously for cache_revalidate_seconds.
+    """
+    entry = cache.get(cache_key)
+    if entry is None:
+        return None
+    if not _is_past_max_staleness(cache_key) or _forced_check_failed_recently(cache_key):
+        _schedule_revalidation_if_due(reader, dataset_id, cache_key)
+        return entry
+
+    logger.info("Cache entry %s exceeded the maximum staleness; revalidating", cache_key)
+    try:
+        _single_flight(
+            FLIGHT_REVALIDATE, cache_key, lambda: revalidate_dataset(reader, dataset_id, cache_key)
+        )
+    except Exception:
+        # Serving stale data beats failing the request while S3 is unavailable
+        logger.warning(
+            "Revalidation failed for %s; serving the stale entry", cache_key, exc_info=True
+        )
+        _mark_checked(cache_key, verified=False)
+        with _state_lock:
+            _forced_failed_at[cache_key] = time.monotonic()
+        return entry
+    return cache.get(cache_key)
+
+
+def get_cached_version(reader: ParquetReader, dataset_id: str) -> Optional[str]:
+    """
+    Return the version of a dataset as currently served from the cache.
+
+    Looks at the dataset's most recently loaded entry (a dataset read or its
+    partition index) without touching S3; like a cache hit, this schedules
+    the entry's revalidation when it is due, so the returned version moves
+    on once a refresh has picked up new data.
+
+    Args:
+        reader: ParquetReader instance (used by the revalidation)
+        dataset_id: Dataset ID
+
+    Returns:
+        The cached version, or None if the dataset is not cached or its
+        version is unknown.
+    """
+    with _state_lock:
+        cache_key = _version_keys.get(dataset_id)
+    if cache_key is None:
+        return None
+    entry = _get_entry(reader, dataset_id, cache_key)
+    return entry.version if entry is not None else None
+
+
+def _track_version_key(dataset_id: str, cache_key: str) -> None:
+    with _state_lock:
+        _version_keys[dataset_id] = cache_key
+        _dataset_keys.setdefault(dataset_id, set()).add(cache_key)
+
+
+def refresh_dataset(reader: ParquetReader, dataset_id: str) -> int:
+    """
+    Revalidate every cached entry of one dataset now.
+
+    Used when the dataset is known to have been republished (see
+    src.core.version_watch). Each cached read of the dataset and its
+    partition index is compared with the current version and, if changed,
+    re-read and re-prepared in place like a background revalidation; the
+    partitions whose version changed are re-read on their next use. Entries
+    of other datasets are not touched. Must run inside an app context.
+
+    Args:
+        reader: ParquetReader instance
+        dataset_id: Dataset ID
+
+    Returns:
+        Number of entries that were refreshed to a new version.
+    """
+    with _state_lock:
+        keys = sorted(_dataset_keys.get(dataset_id, ()))
+    refreshed = 0
+    for cache_key in keys:
+        if not cache.has(cache_key):
+            # Evicted since it was loaded
+            with _state_lock:
+                _dataset_keys.get(dataset_id, set()).discard(cache_key)
+            continue
+        try:
+            current = _single_flight(
+                FLIGHT_REVALIDATE,
+                cache_key,
+                lambda key=cache_key: revalidate_dataset(reader, dataset_id, key),
+            )
+            if not current:
+                refreshed += 1
+        except Exception:
+            logger.warning("Refresh failed for %s", cache_key, exc_info=True)
+            _mark_checked(cache_key, verified=False)
+    return refreshed
+
 
+def add_refresh_listener(listener: Callable[[str], None]) -> None:
+    """
+    Call *listener(dataset_id)* whenever a cached entry of the dataset was
+    refreshed to a new version (e.g. to drop outputs derived from the old one).
+
+    Listener errors are logged and do not affect the refresh.
+    """
+    with _state_lock:
+        if listener not in _refresh_listeners:
+            _refresh_listeners.append(listener)
+
+
+def _notify_refreshed(dataset_id: str) -> None:
+    with _state_lock:
+        listeners = list(_refresh_listeners)
+    for listener in listeners:
+        try:
+            listener(dataset_id)
+        except Exception:
+            logger.warning("Refresh listener failed for dataset %s", dataset_id, exc_info=True)
+
+
+def _get_partition_index(reader: ParquetReader, dataset_id: str) -> PartitionIndex:
+    """Get the dataset's partition versions through the cache.
+
+    The index is revalidated like a dataset entry: when the dataset version
+    changes it is dropped and re-read, and partitions whose own version
+    changed are reloaded on their next use.
+    """
+    cache_key = f"partitions:{dataset_id}"
+    entry = _get_entry(reader, dataset_id, cache_key)
+    if entry is not None:
+        return entry
+
+    def _load() -> PartitionIndex:
+        loaded = cache.get(cache_key)
+        if loaded is not None:
+            return loaded
+        version = _fetch_version(reader, dataset_id)
+        loaded = PartitionIndex(
+            partitions=reader.get_partition_versions(dataset_id),
+            version=version,
+        )
+        cache.set(cache_key, loaded)
+        _mark_checked(cache_key)
+        _track_version_key(dataset_id, cache_key)
+        return loaded
+
+    return _single_flight(FLIGHT_INDEX, cache_key, _load)
+
+
+def _get_cached_partitions(
+    reader: ParquetReader,
+    dataset_id: str,
+    partitions: dict[str, str],
+    date_range: tuple[str, str],
+    columns: Optional[list[str]],
+    categories: Optional[list[str]],
+    view: Optional[str] = None,
+) -> pd.DataFrame:
+    """Assemble the partitions inside *date_range*, loading only uncached ones."""
+    start_date, end_date = date_range
+    selected = [p for p in partitions if start_date <= p <= end_date]
+    if not selected:
+        # Keep the schema: an empty slice of the latest partition
+        latest = list(partitions)[-1:]
+        frames = _cached_partition_frames(
+            reader, dataset_id, partitions, latest, columns, categories, view
+        )
+        if not frames:
+            raise DatasetFileNotFoundError(
+                s3_path=f"datasets/{dataset_id}/partitions/",
+                dataset_id=dataset_id,
+            )
+        return protect(frames[0].iloc[0:0])
+
+    frames = _cached_partition_frames(
+        reader, dataset_id, partitions, selected, columns, categories, view
+    )
+    if not frames:
+        raise DatasetFileNotFoundError(
+            s3_path=f"datasets/{dataset_id}/partitions/",
+            dataset_id=dataset_id,
+        )
+    return _concat_partitions(frames)
+
+
+def _cached_partition_frames(
+    reader: ParquetReader,
+    dataset_id: str,
+    partitions: dict[str, str],
+    selected: list[str],
+    columns: Optional[list[str]],
+    categories: Optional[list[str]],
+    view: Optional[str] = None,
+) -> list[pd.DataFrame]:
+    """Return the frames of *selected* partitions in order, reading misses in one batch."""
+    frames: dict[str, pd.DataFrame] = {}
+    missing = []
+    for partition in selected:
+        cache_key = build_partition_cache_key(dataset_id, partition, columns, categories, view)
+        entry = cache.get(cache_key)
+        if entry is not None and entry.version == partitions[partition]:
+            frames[partition] = entry.df
+            continue
+        shared = _load_shared(cache_key, partitions[partition])
+        if shared is None:
+            missing.append(partition)
+            continue
+        cache.set(cache_key, CachedDataset(
+            df=shared.df, version=partitions[partition], mapped_nbytes=shared.mapped_nbytes,
+        ))
+        frames[partition] = shared.df
+
+    # Single-flight per partition: read the ones nobody is loading in one
+    # batch, then wait for the ones other callers are already loading
+    keys = {
+        partition: build_partition_cache_key(dataset_id, partition, columns, categories, view)
+        for partition in missing
+    }
+    leading: dict[str, Future] = {}
+    waiting: dict[str, Future] = {}
+    for partition in missing:
+        future, is_leader = _begin_load(_flight_key(FLIGHT_LOAD, keys[partition]))
+        (leading if is_leader else waiting)[partition] = future
+
+    if leading:
+        try:
+            loaded = reader.read_partitions(
+                dataset_id, list(leading), columns=columns, categories=categories
+            )
+            prepared = {
+                partition: _prepare(view, df) for partition, df in loaded.items()
+            }
+        except BaseException as e:
+            for partition, future in leading.items():
+                _end_load(_flight_key(FLIGHT_LOAD, keys[partition]), future, error=e)
+            raise
+        for partition, future in leading.items():
+            df = prepared.get(partition)
+            if df is not None:
+                shared = _store_shared(keys[partition], partitions[partition], df)
+                df = shared.df
+                cache.set(keys[partition], CachedDataset(
+                    df=df, version=partitions[partition], mapped_nbytes=shared.mapped_nbytes,
+                ))
+                frames[partition] = df
+            _end_load(_flight_key(FLIGHT_LOAD, keys[partition]), future, result=df)
+
+    for partition, future in waiting.items():
+        df = future.result()
+        if df is not None:
+            frames[partition] = df
+
+    return [frames[p] for p in selected if p in frames]
+
+
+def _concat_partitions(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate partition frames, keeping category columns categorical."""
+    if len(frames) == 1:
+        return protect(frames[0])
+    df = pd.concat(frames, ignore_index=True)
+    for name in frames[0].columns:
+        # Categories differ between partitions, which pd.concat turns into object
+        if isinstance(frames[0][name].dtype, pd.CategoricalDtype) and not isinstance(
+            df[name].dtype, pd.CategoricalDtype
+        ):
+            df[name] = df[name].astype("category")
     return df
+
+
+def _flight_key(operation: str, cache_key: str) -> str:
+    """Return the single-flight key of one operation (FLIGHT_*) on a cache key."""
+    return f"{operation}:{cache_key}"
+
+
+def _single_flight(operation: str, cache_key: str, load: Callable[[], T]) -> T:
+    """Run *load* once per operation and key at a time; concurrent callers share its outcome.
+
+    The first caller for *operation* on *cache_key* runs *load*; callers
+    arriving while it runs block until it finishes and receive the same
+    result, or the same exception re-raised. Different operations on the same
+    key (e.g. a load and a revalidation) do not wait on each other.
+    """
+    flight_key = _flight_key(operation, cache_key)
+    future, is_leader = _begin_load(flight_key)
+    if not is_leader:
+        return future.result()
+    try:
+        result = load()
+    except BaseException as e:
+        _end_load(flight_key, future, error=e)
+        raise
+    _end_load(flight_key, future, result=result)
+    return result
+
+
+def _begin_load(cache_key: str) -> tuple[Future, bool]:
+    """Claim the load of *cache_key* (a single-flight key, see _flight_key).
+
+    Returns:
+        (future, True) if the caller must load and then call _end_load, or
+        (future of the load already in flight, False).
+    """
+    with _state_lock:
+        future = _inflight.get(cache_key)
+        if future is not None:
+            return future, False
+        future = Future()
+        _inflight[cache_key] = future
+        return future, True
+
+
+def _end_load(
+    cache_key: str,
+    future: Future,
+    result=None,
+    error: Optional[BaseException] = None,
+) -> None:
+    """Release a claimed load and hand its outcome to the waiting callers."""
+    with _state_lock:
+        _inflight.pop(cache_key, None)
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+def _prepare(view: Optional[str], df: pd.DataFrame) -> pd.DataFrame:
+    """Apply the prepare step of *view* to a freshly read frame (None: as read)."""
+    if view is None:
+        return df
+    return prepare_view(view, df)
+
+
+def _shared_store() -> Optional[SharedDatasetStore]:
+    """Return the cross-worker store, or None when sharing is disabled."""
+    if not settings.cache_shared_dir:
+        return None
+    return get_shared_store(settings.cache_shared_dir)
+
+
+def _load_shared(cache_key: str, version: Optional[str]) -> Optional[SharedFrame]:
+    """Memory-map a version another worker already stored (None: not available)."""
+    store = _shared_store()
+    if store is None or version is None:
+        return None
+    try:
+        return store.load(cache_key, version)
+    except (OSError, pa.ArrowInvalid):
+        logger.warning("Ignoring unreadable shared file for %s", cache_key, exc_info=True)
+        return None
+
+
+def _store_shared(cache_key: str, version: Optional[str], df: pd.DataFrame) -> SharedFrame:
+    """Share a freshly read version with the other workers (unknown versions are not shared)."""
+    store = _shared_store()
+    if store is None or version is None:
+        return SharedFrame(df)
+    return store.store(cache_key, version, df)
+
+
+def revalidate_dataset(reader: ParquetReader, dataset_id: str, cache_key: str) -> bool:
+    """
+    Compare a cached entry with the dataset's current version.
+
+    Unchanged entries are marked as checked. Changed entries are re-read and
+    replaced in place, so callers keep being served the previous data until
+    the new version is ready. If the re-read fails the previous entry stays.
+
+    Args:
+        reader: ParquetReader instance
+        dataset_id: Dataset ID
+        cache_key: Cache key of the entry to check
+
+    Returns:
+        True if the entry is still current (or already gone), False if it was refreshed.
+    """
+    entry = cache.get(cache_key)
+    if entry is None:
+        return True
+
+    current_version = reader.get_dataset_version(dataset_id)
+    if current_version == entry.version:
+        _mark_checked(cache_key)
+        return True
+
+    logger.info(
+        "Dataset %s changed (%s -> %s); refreshing cache entry %s",
+        dataset_id, entry.version, current_version, cache_key,
+    )
+    if isinstance(entry, PartitionIndex):
+        refreshed = PartitionIndex(
+            partitions=reader.get_partition_versions(dataset_id),
+            version=current_version,
+        )
+    else:
+        shared = _read_dataset(
+            reader, dataset_id, cache_key, current_version,
+            entry.columns, entry.categories, entry.view,
+        )
+        refreshed = CachedDataset(
+            df=shared.df,
+            version=current_version,
+            columns=entry.columns,
+            categories=entry.categories,
+            view=entry.view,
+            mapped_nbytes=shared.mapped_nbytes,
+        )
+    cache.set(cache_key, refreshed)
+    _mark_checked(cache_key)
+    _notify_refreshed(dataset_id)
+    return False
+
+
+def _fetch_version(reader: ParquetReader, dataset_id: str) -> Optional[str]:
+    """Get the dataset version, tolerating lookup failures (None = unknown)."""
+    try:
+        return reader.get_dataset_version(dataset_id)
+    except Exception:
+        logger.warning("Version lookup failed for dataset %s", dataset_id, exc_info=True)
+        return None
+
+
+def _mark_checked(cache_key: str, verified: bool = True) -> None:
+    """Record a check of *cache_key* (verified: the entry is known to be current)."""
+    now = time.monotonic()
+    with _state_lock:
+        _checked_at[cache_key] = now
+        if verified:
+            _verified_at[cache_key] = now
+
+
+def _is_past_max_staleness(cache_key: str) -> bool:
+    """True if the entry has not been known current for cache_max_stale_seconds."""
+    if settings.cache_max_stale_seconds <= 0:
+        return False
+    with _state_lock:
+        verified_at = _verified_at.get(cache_key, 0.0)
+    return time.monotonic() - verified_at > settings.cache_max_stale_seconds
+
+
+def _forced_check_failed_recently(cache_key: str) -> bool:
+    """True if a synchronous revalidation of the entry failed within cache_revalidate_seconds."""
+    with _state_lock:
+        failed_at = _forced_failed_at.get(cache_key)
+    return failed_at is not None and (
+        time.monotonic() - failed_at < settings.cache_revalidate_seconds
+    )
+
+
+def _schedule_revalidation_if_due(
+    reader: ParquetReader,
+    dataset_id: str,
+    cache_key: str,
+) -> None:
+    """Start a background revalidation (and refresh) if the entry is due and none is running."""
+    now = time.monotonic()
+    with _state_lock:
+        last_checked = _checked_at.get(cache_key, 0.0)
+        if now - last_checked < settings.cache_revalidate_seconds:
+            return
+        if cache_key in _revalidating:
+            return
+        _revalidating.add(cache_key)
+
+    app = current_app._get_current_object()
+
+    def _run() -> None:
+        try:
+            with app.app_context():
+                _single_flight(
+                    FLIGHT_REVALIDATE,
+                    cache_key,
+                    lambda: revalidate_dataset(reader, dataset_id, cache_key),
+                )
+        except Exception:
+            # Keep serving the entry and retry after the next interval
+            logger.warning("Revalidation failed for %s", cache_key, exc_info=True)
+            _mark_checked(cache_key, verified=False)
+        finally:
+            with _state_lock:
+                _revalidating.discard(cache_key)
+
+    threading.Thread(
+        target=_run,
+        name=f"revalidate-{dataset_id}",
+        daemon=True,
+    ).start()
@@ -0,0 +1,202 @@
+"""Memoization of page callback outputs keyed by dataset version and filter state."""
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import pickle
+import threading
+from typing import Any, Callable, Optional, Sequence
+
+from flask import has_app_context
+
+from src.core.cache import add_refresh_listener, get_cached_version
+from src.core.memory_cache import InProcessCache
+from src.data.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Per-process store of pickled outputs (created on first use from settings)
+_store: Optional[InProcessCache] = None
+# Memoized function -> (dataset IDs, their versions, memo keys stored for them)
+_generations: dict[str, tuple[tuple[str, ...], tuple[str, ...], set[str]]] = {}
+_lock = threading.Lock()
+
+
+def memoize_callback(dataset_params: Sequence[str] = ("dataset_id",)) -> Callable:
+    """
+    Memoize a page's render function by dataset version and filter inputs.
+
+    Decorates a pure function that takes a ``reader`` argument, the dataset
+    IDs named by *dataset_params* and the (filter) inputs of a callback, and
+    returns the callback outputs (or other values derived from the datasets
+    only, such as a layout's filter options). The memo key combines the cached versions
+    of those datasets (get_cached_version) with a canonical hash of the other
+    arguments (see normalize_callback_value), so repeated views of the same
+    filter state are served from the store until a dataset changes; the
+    entries of older versions are dropped as soon as the dataset cache
+    refreshes one of the datasets (see invalidate_callback_memo).
+
+    Outputs are stored pickled, so every hit returns fresh objects. Nothing
+    is stored while a dataset is not cached yet, for outputs that cannot be
+    pickled, or when the function raises; keep error handling in the
+    callback around the memoized function so error outputs are not cached.
+
+    Args:
+        dataset_params: Names of the parameters holding dataset IDs. A
+            parameter that is None (an optional dataset) is skipped.
+
+    Returns:
+        Decorator.
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # Versions come from the dataset cache, which needs the app context
+            if not settings.callback_memo_enabled or not has_app_context():
+                return func(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            reader = bound.arguments["reader"]
+            dataset_ids = tuple(
+                bound.arguments[param] for param in dataset_params
+                if bound.arguments[param] is not None
+            )
+            inputs = {k: v for k, v in bound.arguments.items() if k != "reader"}
+
+            versions = _cached_versions(reader, dataset_ids)
+            if versions is not None:
+                payload = _get_store().get(_memo_key(name, versions, inputs))
+                if payload is not None:
+                    logger.debug("Memoized output hit for %s", name)
+                    return pickle.loads(payload)
+
+            result = func(*args, **kwargs)
+
+            # Store under the version the data was read at (known by now)
+            after = _cached_versions(reader, dataset_ids)
+            if after is not None and versions in (None, after):
+                _remember(name, dataset_ids, after, _memo_key(name, after, inputs), result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def normalize_callback_value(value: Any) -> Any:
+    """
+    Canonical form of one callback input for the memo key.
+
+    None and empty lists are the same (no selection); lists, tuples and sets
+    become sorted lists without duplicates. Other values are kept as they are.
+    """
+    if isinstance(value, (list, tuple, set, frozenset)):
+        if not value:
+            return None
+        unique = {json.dumps(item, sort_keys=True, default=str): item for item in value}
+        return [unique[k] for k in sorted(unique)]
+    return value
+
+
+def invalidate_callback_memo(dataset_id: str) -> int:
+    """
+    Drop the memoized outputs computed from *dataset_id*.
+
+    Registered as a refresh listener of the dataset cache, so outputs of a
+    refreshed dataset are freed right away; outputs of other datasets stay.
+
+    Returns:
+        Number of memo entries dropped.
+    """
+    with _lock:
+        names = [name for name, generation in _generations.items() if dataset_id in generation[0]]
+        dropped = [key for name in names for key in _generations.pop(name)[2]]
+        store = _store
+    if store is not None:
+        for key in dropped:
+            store.delete(key)
+    if names:
+        logger.info("Dataset %s refreshed; dropped %d memoized outputs of %s",
+                    dataset_id, len(dropped), ", ".join(sorted(names)))
+    return len(dropped)
+
+
+def reset_callback_memo() -> None:
+    """Drop all memoized outputs (tests; settings are re-read on next use)."""
+    global _store
+    with _lock:
+        _store = None
+        _generations.clear()
+
+
+def _get_store() -> InProcessCache:
+    global _store
+    with _lock:
+        if _store is None:
+            _store = InProcessCache(
+                threshold=settings.callback_memo_max_entries,
+                default_timeout=0,
+                max_bytes=settings.callback_memo_max_bytes,
+            )
+        return _store
+
+
+def _cached_versions(reader, dataset_ids: tuple[str, ...]) -> Optional[tuple[str, ...]]:
+    """Cached versions of *dataset_ids*, or None if any is not cached or unknown."""
+    versions = []
+    for dataset_id in dataset_ids:
+        version = get_cached_version(reader, dataset_id)
+        if version is None:
+            return None
+        versions.append(str(version))
+    return tuple(versions)
+
+
+def _memo_key(name: str, versions: tuple[str, ...], inputs: dict[str, Any]) -> str:
+    canonical = json.dumps(
+        [name, list(versions), {k: normalize_callback_value(v) for k, v in inputs.items()}],
+        sort_keys=True,
+        default=str,
+    )
+    return f"callback:{name}:{hashlib.sha256(canonical.encode('utf-8')).hexdigest()}"
+
+
+def _remember(
+    name: str,
+    dataset_ids: tuple[str, ...],
+    versions: tuple[str, ...],
+    key: str,
+    result: Any,
+) -> None:
+    """Store *result* for *key*, dropping the entries of older dataset versions."""
+    try:
+        payload = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        logger.debug("Not memoizing %s: output cannot be pickled", name, exc_info=True)
+        return
+
+    store = _get_store()
+    with _lock:
+        generation = _generations.get(name)
+        if generation is None or generation[:2] != (dataset_ids, versions):
+            if generation is not None:
+                for old_key in generation[2]:
+                    store.delete(old_key)
+                logger.info("Dataset version changed; dropped %d memoized outputs of %s",
+                            len(generation[2]), name)
+            generation = (dataset_ids, versions, set())
+            _generations[name] = generation
+        keys = generation[2]
+        if len(keys) > 2 * settings.callback_memo_max_entries:
+            # Forget keys the store has evicted meanwhile
+            keys.intersection_update(k for k in list(keys) if store.has(k))
+        keys.add(key)
+    store.set(key, payload)
+
+
+add_refresh_listener(invalidate_callback_memo)
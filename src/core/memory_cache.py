@@ -0,0 +1,218 @@
+"""In-process flask-caching backend that stores objects without serialization."""
+import dataclasses
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+import pandas as pd
+import pyarrow as pa
+from flask_caching.backends.base import BaseCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_THRESHOLD = 500
+
+
+def enable_copy_on_write() -> None:
+    """Turn on pandas Copy-on-Write where it is not already the default.
+
+    Cached frames are handed out as shallow copies; with Copy-on-Write any
+    write through such a copy allocates new memory instead of modifying the
+    cached data. pandas 3 always behaves this way (and deprecates the option).
+    """
+    if int(pd.__version__.split(".")[0]) < 3:
+        pd.set_option("mode.copy_on_write", True)
+
+
+def protect(value: Any) -> Any:
+    """Return a view of *value* that callers may modify without touching the cache.
+
+    DataFrames and Series become shallow copies: metadata changes (adding or
+    replacing columns, renaming) stay local and data writes are copied on
+    write. Other values (Arrow tables are immutable) are returned as-is.
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=False)
+    return value
+
+
+def estimate_nbytes(value: Any) -> int:
+    """Estimate the memory held by a cached value.
+
+    DataFrames/Series are measured with ``memory_usage(deep=True)`` (string
+    contents included). Arrow tables are measured by their buffer size.
+    Dataclasses, dicts, lists and tuples are measured by their contents;
+    anything else by ``sys.getsizeof``. A dataclass with a ``mapped_nbytes``
+    field (e.g. a CachedDataset served from the shared store) is measured
+    without those bytes, which live in a memory-mapped file rather than in
+    this process.
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    if isinstance(value, pa.Table):
+        return value.nbytes
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        total = sys.getsizeof(value) + sum(
+            estimate_nbytes(getattr(value, f.name)) for f in dataclasses.fields(value)
+        )
+        return max(total - getattr(value, "mapped_nbytes", 0), 0)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_nbytes(k) + estimate_nbytes(v) for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_nbytes(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class InProcessCache(BaseCache):
+    """Memory cache for a single process that returns stored objects directly.
+
+    Unlike SimpleCache, values are not pickled on ``set`` or unpickled on
+    ``get``: a hit costs a dict lookup. Bare DataFrames/Series are returned
+    through :func:`protect`; other objects (e.g. cache entry dataclasses) are
+    shared, and code reading DataFrames out of them must protect them itself.
+
+    Entries are bounded by count (*threshold*) and by estimated size
+    (*max_bytes*, see :func:`estimate_nbytes`); when either is exceeded the
+    least recently used entries are evicted. A value larger than the whole
+    byte budget is still cached, alone: every other entry is evicted and a
+    warning is logged, since dropping it would make every request reload it.
+
+    All operations are guarded by a lock, so an instance can be shared by
+    callback threads.
+    """
+
+    def __init__(
+        self,
+        threshold: int = DEFAULT_THRESHOLD,
+        default_timeout: int = 300,
+        ignore_delete_many_errors: bool = False,
+        max_bytes: int = 0,
+    ) -> None:
+        """
+        Args:
+            threshold: Maximum number of entries.
+            default_timeout: Default timeout in seconds (0: never expire).
+            ignore_delete_many_errors: See flask_caching BaseCache.
+            max_bytes: Budget for the estimated size of all entries (0: unbounded).
+        """
+        super().__init__(
+            default_timeout=default_timeout,
+            ignore_delete_many_errors=ignore_delete_many_errors,
+        )
+        # key -> (expires_at, value, nbytes), least recently used first
+        self._cache: "OrderedDict[str, tuple[float, Any, int]]" = OrderedDict()
+        self._threshold = threshold or DEFAULT_THRESHOLD
+        self._max_bytes = max_bytes
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+
+    @classmethod
+    def factory(cls, app, config, args, kwargs) -> "InProcessCache":
+        kwargs.update({
+            "threshold": config.get("CACHE_THRESHOLD", DEFAULT_THRESHOLD),
+            "default_timeout": config.get("CACHE_DEFAULT_TIMEOUT", 300),
+            "max_bytes": config.get("CACHE_MAX_BYTES", 0),
+        })
+        return cls(*args, **kwargs)
+
+    @property
+    def total_bytes(self) -> int:
+        """Estimated size of all entries."""
+        return self._total_bytes
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            item = self._cache.get(key)
+            if item is None or not self._is_live(item[0]):
+                return None
+            self._cache.move_to_end(key)
+            return protect(item[1])
+
+    def has(self, key: str) -> bool:
+        with self._lock:
+            item = self._cache.get(key)
+            return item is not None and self._is_live(item[0])
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        nbytes = estimate_nbytes(value) if self._max_bytes else 0
+        with self._lock:
+            self._pop(key)
+            if self._max_bytes and nbytes > self._max_bytes:
+                logger.warning(
+                    "Caching %s alone: %d bytes exceeds the cache budget of %d bytes "
+                    "(raise CACHE_MAX_BYTES)",
+                    key, nbytes, self._max_bytes,
+                )
+            self._cache[key] = (self._expires_at(timeout), value, nbytes)
+            self._total_bytes += nbytes
+            self._prune()
+            return True
+
+    def add(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        with self._lock:
+            if self.has(key):
+                return False
+            return self.set(key, value, timeout)
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            return self._pop(key)
+
+    def clear(self) -> bool:
+        with self._lock:
+            self._cache.clear()
+            self._total_bytes = 0
+            return True
+
+    def inc(self, key: str, delta: int = 1) -> Optional[int]:
+        with self._lock:
+            return super().inc(key, delta)
+
+    def dec(self, key: str, delta: int = 1) -> Optional[int]:
+        with self._lock:
+            return super().dec(key, delta)
+
+    def _expires_at(self, timeout: Optional[int]) -> float:
+        timeout = self._normalize_timeout(timeout)
+        return 0 if timeout == 0 else time.time() + timeout
+
+    @staticmethod
+    def _is_live(expires_at: float) -> bool:
+        return expires_at == 0 or expires_at > time.time()
+
+    def _pop(self, key: str) -> bool:
+        item = self._cache.pop(key, None)
+        if item is None:
+            return False
+        self._total_bytes -= item[2]
+        return True
+
+    def _over_budget(self) -> bool:
+        return len(self._cache) > self._threshold or (
+            bool(self._max_bytes) and self._total_bytes > self._max_bytes
+        )
+
+    def _prune(self) -> None:
+        """Drop expired entries, then least recently used ones, until within limits.
+
+        The most recently set entry is kept even if it alone exceeds the budget.
+        """
+        if not self._over_budget():
+            return
+        now = time.time()
+        for key in [k for k, (expires_at, _, _) in self._cache.items() if 0 < expires_at <= now]:
+            self._pop(key)
+        while self._over_budget() and len(self._cache) > 1:
+            key, (_, _, nbytes) = next(iter(self._cache.items()))
+            self._pop(key)
+            logger.info(
+                "Evicted %s from dataset cache (%d bytes; %d bytes in %d entries remain)",
+                key, nbytes, self._total_bytes, len(self._cache),
+            )
@@ -0,0 +1,69 @@
+"""Registry of per-dashboard prepare steps applied once per cached dataset version."""
+import logging
+import threading
+import time
+from typing import Callable
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+PrepareFunc = Callable[[pd.DataFrame], pd.DataFrame]
+
+_views: dict[str, PrepareFunc] = {}
+_views_lock = threading.Lock()
+
+
+def register_prepared_view(name: str, prepare: PrepareFunc) -> str:
+    """
+    Register a prepare step under *name*.
+
+    get_cached_dataset(..., view=name) runs *prepare* on each freshly read
+    dataset version (or on each partition) and caches its result instead of
+    the raw read; every callback then gets a copy-on-write view of it.
+
+    *prepare* must be pure and row-local: it may not modify its input and
+    each output row may depend only on the matching input row, so that it can
+    be applied to partitions separately. Returning the input unchanged is
+    allowed.
+
+    Args:
+        name: View name (part of the cache key; usually the dashboard ID)
+        prepare: DataFrame -> DataFrame
+
+    Returns:
+        *name*, so pages can keep it as a module constant.
+
+    Raises:
+        ValueError: If another function is already registered under *name*
+            (re-registering the same function, e.g. on module reload, is fine).
+    """
+    with _views_lock:
+        registered = _views.get(name)
+        if registered is not None and _qualified_name(registered) != _qualified_name(prepare):
+            raise ValueError(
+                f"Prepared view '{name}' is already registered to {_qualified_name(registered)}"
+            )
+        _views[name] = prepare
+    return name
+
+
+def prepare_view(name: str, df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Run the prepare step registered under *name*.
+
+    Raises:
+        ValueError: If no view is registered under *name*.
+    """
+    with _views_lock:
+        prepare = _views.get(name)
+    if prepare is None:
+        raise ValueError(f"Unknown prepared view '{name}' (registered: {sorted(_views)})")
+    started = time.monotonic()
+    result = prepare(df)
+    logger.debug("Prepared view %s (%d rows) in %.3fs", name, len(result), time.monotonic() - started)
+    return result
+
+
+def _qualified_name(func: PrepareFunc) -> str:
+    return f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', repr(func))}"
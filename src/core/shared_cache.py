@@ -0,0 +1,176 @@
+"""Dataset versions shared between worker processes as memory-mapped Arrow IPC files."""
+import hashlib
+import logging
+import os
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, NamedTuple, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+from src.data.config import settings
+
+logger = logging.getLogger(__name__)
+
+SHARED_FILE_SUFFIX = ".arrow"
+
+
+class SharedFrame(NamedTuple):
+    """A dataset frame plus the bytes of its column data in a mapped shared file.
+
+    Mapped pages belong to the OS page cache and are shared by all workers,
+    so they are not part of a worker's own memory (0 for unshared frames).
+    """
+
+    df: pd.DataFrame
+    mapped_nbytes: int = 0
+
+
+class SharedDatasetStore:
+    """Directory of Arrow IPC files, one per cache key and dataset version.
+
+    The first worker that loads a dataset version writes it once; every
+    worker then memory-maps the file and converts it to pandas zero-copy, so
+    the column data lives in the OS page cache (``/dev/shm`` keeps it in RAM)
+    and is shared by all workers instead of being held once per process.
+
+    File names are derived from the cache key and version, so a changed
+    dataset is never served from a stale file. Files are written to a
+    temporary name and renamed into place; writing a new version removes the
+    older versions of the same key (workers still mapping them keep their
+    mapping until they drop it).
+    """
+
+    def __init__(self, root: str) -> None:
+        """
+        Args:
+            root: Shared directory (created if missing), e.g. /dev/shm/bi-dash.
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, cache_key: str, version: str) -> Path:
+        """Return the file path for one version of a cache entry."""
+        return self.root / f"{_key_prefix(cache_key)}-{_digest(version, 16)}{SHARED_FILE_SUFFIX}"
+
+    def load(self, cache_key: str, version: str) -> Optional[SharedFrame]:
+        """Memory-map a stored dataset version.
+
+        Returns:
+            SharedFrame whose DataFrame is backed by the mapped file
+            (read-only buffers), or None if the version has not been stored.
+        """
+        path = self.path_for(cache_key, version)
+        try:
+            source = pa.memory_map(str(path))
+        except FileNotFoundError:
+            return None
+        region = source.read_buffer()  # zero-copy view of the whole mapping
+        source.seek(0)
+        df = _to_pandas(ipc.open_file(source).read_all())
+        mapped = _mapped_column_nbytes(df, region.address, region.address + region.size)
+        return SharedFrame(df, mapped)
+
+    def store(self, cache_key: str, version: str, df: pd.DataFrame) -> SharedFrame:
+        """Write *df* as a dataset version and return its memory-mapped copy.
+
+        The caller should keep the returned frame and drop *df*, so that the
+        process holds only the shared copy. The index is stored along with the
+        columns (a RangeIndex as metadata only). Frames Arrow cannot represent
+        (e.g. object columns with mixed types) and write errors are logged
+        and *df* is returned unchanged (with no mapped bytes).
+        """
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=None)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+            logger.warning("Not sharing %s: cannot convert to Arrow (%s)", cache_key, e)
+            return SharedFrame(df)
+
+        path = self.path_for(cache_key, version)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+            os.close(fd)
+            try:
+                with pa.OSFile(tmp_path, "wb") as sink:
+                    with ipc.new_file(sink, table.schema) as writer:
+                        writer.write_table(table)
+                os.replace(tmp_path, path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+        except OSError:
+            logger.warning("Could not write shared dataset file for %s", cache_key, exc_info=True)
+            return SharedFrame(df)
+
+        self._remove_other_versions(cache_key, keep=path)
+        logger.info("Shared %s as %s (%d bytes)", cache_key, path.name, path.stat().st_size)
+        return self.load(cache_key, version)
+
+    def _remove_other_versions(self, cache_key: str, keep: Path) -> None:
+        for path in self.root.glob(f"{_key_prefix(cache_key)}-*{SHARED_FILE_SUFFIX}"):
+            if path == keep:
+                continue
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+@lru_cache(maxsize=8)
+def get_shared_store(root: str) -> SharedDatasetStore:
+    """Return the process-wide SharedDatasetStore for a directory."""
+    return SharedDatasetStore(root)
+
+
+def _mapped_column_nbytes(df: pd.DataFrame, start: int, end: int) -> int:
+    """Return how many of *df*'s column bytes lie in the mapping [start, end)."""
+    return sum(
+        size
+        for _, column in df.items()
+        for address, size in _column_buffers(column.array)
+        if start <= address < end
+    )
+
+
+def _column_buffers(values: Any) -> list[tuple[int, int]]:
+    """(address, size) of the data buffers behind a column's array.
+
+    Columns pandas had to convert (e.g. strings to objects) point to heap
+    memory and so fall outside the mapping.
+    """
+    if isinstance(values, pd.arrays.ArrowExtensionArray):
+        return [
+            (buf.address, buf.size)
+            for chunk in pa.chunked_array(values).chunks
+            for buf in chunk.buffers()
+            if buf is not None
+        ]
+    if isinstance(values, pd.Categorical):
+        arrays = [values.codes]
+    elif isinstance(values, (pd.arrays.DatetimeArray, pd.arrays.TimedeltaArray)):
+        arrays = [values.asi8]
+    elif isinstance(values, pd.arrays.NumpyExtensionArray):
+        arrays = [values.to_numpy()]
+    else:
+        return []
+    return [(a.__array_interface__["data"][0], a.nbytes) for a in arrays]
+
+
+def _digest(value: str, length: int) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()[:length]
+
+
+def _key_prefix(cache_key: str) -> str:
+    return _digest(cache_key, 32)
+
+
+def _to_pandas(table: pa.Table) -> pd.DataFrame:
+    """Convert a mapped table without copying column buffers where possible."""
+    options: dict[str, Any] = {"split_blocks": True}
+    if settings.parquet_arrow_dtypes:
+        options["types_mapper"] = pd.ArrowDtype
+    return table.to_pandas(**options)
@@ -0,0 +1,121 @@
+"""Polling of published dataset versions (ETL-to-dashboard change signal).
+
+Every ETL load publishes a version marker per dataset
+(src.data.dataset_version). A background thread lists the markers every
+``settings.cache_version_poll_seconds`` and refreshes the cached entries of
+exactly the datasets whose marker changed (src.core.cache.refresh_dataset),
+so new data shows up within one poll interval instead of after the
+per-entry revalidation interval. Derived views are re-prepared by the
+refresh and memoized outputs of the dataset are dropped with it.
+"""
+import logging
+import threading
+import time
+from typing import Optional
+
+from src.core.cache import refresh_dataset
+from src.data.config import settings
+from src.data.parquet_reader import ParquetReader, get_reader
+
+logger = logging.getLogger(__name__)
+
+# Per-process marker token per dataset, as of the last poll
+_seen: dict[str, str] = {}
+_seen_lock = threading.Lock()
+_stop = threading.Event()
+
+
+def init_version_watch(server, reader: Optional[ParquetReader] = None) -> Optional[threading.Thread]:
+    """
+    Start polling the published dataset versions in the background.
+
+    Must be called after init_cache. Like the warmup, each worker process
+    polls for itself (start threads after fork, not with ``--preload``).
+
+    Args:
+        server: Flask server instance (app.server)
+        reader: ParquetReader to list and refresh with (default: the shared reader, get_reader())
+
+    Returns:
+        The polling (daemon) thread, or None if polling is disabled
+        (settings.cache_version_poll_seconds <= 0).
+    """
+    if settings.cache_version_poll_seconds <= 0:
+        return None
+    _stop.clear()
+    thread = threading.Thread(
+        target=_run,
+        args=(server, reader or get_reader()),
+        name="version-watch",
+        daemon=True,
+    )
+    thread.start()
+    return thread
+
+
+def stop_version_watch() -> None:
+    """Stop the polling thread after its current poll (tests, shutdown)."""
+    _stop.set()
+
+
+def poll_published_versions(server, reader: ParquetReader) -> list[str]:
+    """
+    List the published versions once and refresh the datasets that changed.
+
+    A dataset seen for the first time is refreshed too, since it may have
+    been republished between its load and this poll; refreshing an entry
+    that is still current only confirms its version (nothing is re-read).
+
+    Args:
+        server: Flask server instance (app.server)
+        reader: ParquetReader to list and refresh with
+
+    Returns:
+        IDs of the datasets whose marker changed (or appeared) since the
+        last poll; empty if the listing failed.
+    """
+    try:
+        published = reader.get_published_versions()
+    except Exception:
+        logger.warning("Listing published dataset versions failed", exc_info=True)
+        return []
+
+    with _seen_lock:
+        changed = sorted(
+            dataset_id for dataset_id, token in published.items()
+            if _seen.get(dataset_id) != token
+        )
+
+    for dataset_id in changed:
+        started = time.monotonic()
+        try:
+            with server.app_context():
+                refreshed = refresh_dataset(reader, dataset_id)
+        except Exception:
+            # Not marked as seen, so the next poll retries it
+            logger.exception("Refreshing republished dataset %s failed", dataset_id)
+            continue
+        if refreshed:
+            logger.info(
+                "Dataset %s was republished; refreshed %d cache entries in %.1fs",
+                dataset_id, refreshed, time.monotonic() - started,
+            )
+        with _seen_lock:
+            _seen[dataset_id] = published[dataset_id]
+    return changed
+
+
+def reset_version_watch() -> None:
+    """Forget the markers seen so far (tests)."""
+    with _seen_lock:
+        _seen.clear()
+
+
+def _run(server, reader: ParquetReader) -> None:
+    while not _stop.is_set():
+        try:
+            poll_published_versions(server, reader)
+        except Exception:
+            # Keep polling: one bad poll must not stop refreshes for good
+            logger.exception("Polling published dataset versions failed")
+        _stop.wait(settings.cache_version_poll_seconds)
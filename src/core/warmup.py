@@ -0,0 +1,175 @@
+"""Startup cache warmup and readiness reporting.
+
+At startup every dashboard listed by a ``src/pages/*/data_sources.yml`` is
+preloaded in the background, so the first user after a deploy does not pay
+the cold S3 load. ``/readyz`` reports the warm/cold status of each dataset
+and answers 503 until the warmup has finished.
+"""
+import importlib
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from flask import jsonify
+
+from src.data.config import settings
+from src.data.data_loader import DatasetLoad, load_many
+from src.data.data_source_registry import (
+    get_categorical_columns,
+    get_dataset_ids,
+    list_dashboard_ids,
+)
+from src.data.parquet_reader import ParquetReader, get_reader
+
+logger = logging.getLogger(__name__)
+
+STATUS_COLD = "cold"
+STATUS_WARMING = "warming"
+STATUS_WARM = "warm"
+STATUS_FAILED = "failed"
+
+READINESS_PATH = "/readyz"
+
+# Per-process warmup status per dataset ID
+_status: dict[str, str] = {}
+_status_lock = threading.Lock()
+
+
+def init_warmup(server, reader: Optional[ParquetReader] = None) -> Optional[threading.Thread]:
+    """
+    Register the readiness endpoint and start the background warmup.
+
+    Must be called after init_cache and after the page packages are imported.
+
+    Args:
+        server: Flask server instance (app.server)
+        reader: ParquetReader to load with (default: the shared reader, get_reader())
+
+    Returns:
+        The warmup thread, or None if warmup is disabled
+        (settings.cache_warmup_enabled); the endpoint then reports ready.
+    """
+    server.add_url_rule(READINESS_PATH, "readiness", _readiness_view)
+    if not settings.cache_warmup_enabled:
+        return None
+    return start_warmup(server, reader or get_reader())
+
+
+def start_warmup(server, reader: ParquetReader) -> threading.Thread:
+    """
+    Preload every dashboard's datasets in a background thread.
+
+    Dashboards are warmed concurrently (settings.cache_warmup_concurrency).
+    A page package can define ``warmup(reader)`` in its ``_data_loader`` to
+    load its datasets exactly as the page does (column projection, filter
+    options); otherwise each dataset is loaded in full with its categorical
+    columns.
+
+    Args:
+        server: Flask server instance (app.server)
+        reader: ParquetReader to load with
+
+    Returns:
+        The started (daemon) thread.
+    """
+    plan = {dashboard_id: get_dataset_ids(dashboard_id) for dashboard_id in list_dashboard_ids()}
+    with _status_lock:
+        for dataset_ids in plan.values():
+            for dataset_id in dataset_ids:
+                _status.setdefault(dataset_id, STATUS_COLD)
+
+    thread = threading.Thread(
+        target=_run_warmup,
+        args=(server, reader, plan),
+        name="cache-warmup",
+        daemon=True,
+    )
+    thread.start()
+    return thread
+
+
+def readiness() -> dict:
+    """
+    Return the warmup status.
+
+    Returns:
+        {"ready": True once no dataset is cold or warming,
+         "datasets": {dataset_id: "cold" | "warming" | "warm" | "failed"}}.
+        Failed datasets do not hold readiness back; they are loaded on demand.
+    """
+    with _status_lock:
+        datasets = dict(sorted(_status.items()))
+    ready = all(s in (STATUS_WARM, STATUS_FAILED) for s in datasets.values())
+    return {"ready": ready, "datasets": datasets}
+
+
+def reset_warmup_status() -> None:
+    """Forget all warmup status (tests)."""
+    with _status_lock:
+        _status.clear()
+
+
+def _readiness_view():
+    report = readiness()
+    return jsonify(report), 200 if report["ready"] else 503
+
+
+def _run_warmup(server, reader: ParquetReader, plan: dict[str, list[str]]) -> None:
+    started = time.monotonic()
+    max_workers = max(1, min(settings.cache_warmup_concurrency, len(plan) or 1))
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cache-warmup") as pool:
+        for dashboard_id, dataset_ids in plan.items():
+            pool.submit(_warm_dashboard, server, reader, dashboard_id, dataset_ids)
+    logger.info("Cache warmup finished in %.1fs: %s", time.monotonic() - started, readiness())
+
+
+def _warm_dashboard(
+    server,
+    reader: ParquetReader,
+    dashboard_id: str,
+    dataset_ids: list[str],
+) -> None:
+    """Warm one dashboard and record the outcome for its datasets."""
+    _set_status(dataset_ids, STATUS_WARMING)
+    started = time.monotonic()
+    try:
+        with server.app_context():
+            hook = _page_warmup_hook(dashboard_id)
+            if hook is not None:
+                hook(reader)
+            else:
+                load_many(reader, [
+                    DatasetLoad(dataset_id, categories=get_categorical_columns(dashboard_id, dataset_id))
+                    for dataset_id in dataset_ids
+                ])
+    except Exception:
+        logger.warning("Cache warmup failed for dashboard %s", dashboard_id, exc_info=True)
+        _set_status(dataset_ids, STATUS_FAILED)
+        return
+    _set_status(dataset_ids, STATUS_WARM)
+    logger.info(
+        "Warmed dashboard %s (%s) in %.1fs",
+        dashboard_id, ", ".join(dataset_ids), time.monotonic() - started,
+    )
+
+
+def _page_warmup_hook(dashboard_id: str) -> Optional[Callable[[ParquetReader], None]]:
+    """Return the page's ``_data_loader.warmup`` function, if it has one."""
+    module_name = f"src.pages.{dashboard_id}._data_loader"
+    try:
+        module = importlib.import_module(module_name)
+    except ModuleNotFoundError as e:
+        if e.name is not None and module_name.startswith(e.name):
+            return None
+        raise
+    return getattr(module, "warmup", None)
+
+
+def _set_status(dataset_ids: list[str], status: str) -> None:
+    """Update dataset status; a dataset warmed by any dashboard stays warm."""
+    with _status_lock:
+        for dataset_id in dataset_ids:
+            if _status.get(dataset_id) != STATUS_WARM:
+                _status[dataset_id] = status
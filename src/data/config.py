@@ -12,6 +12,64 @@ class Settings(BaseSettings):
     s3_bucket: str = "bi-datasets"
     s3_access_key: Optional[str] = None
     s3_secret_key: Optional[str] = None
+    # Shared S3 client (connection pool reused across callbacks). The pool
+    # should cover parquet_read_concurrency x concurrent requests per worker.
+    s3_max_pool_connections: int = 32
+    s3_connect_timeout: float = 5.0  # seconds
+    s3_read_timeout: float = 60.0  # seconds
+    s3_tcp_keepalive: bool = True
+
+    # Parquet reader
+    # Max number of partition files fetched/decoded concurrently (1 = sequential)
+    parquet_read_concurrency: int = 8
+    # Local on-disk cache for downloaded Parquet objects (keyed by ETag).
+    # Disabled when unset; files are memory-mapped on read.
+    parquet_cache_dir: Optional[str] = None
+    parquet_cache_max_bytes: int = 2 * 1024 ** 3  # 2 GiB
+    # Objects at least this large are read with ranged GETs (footer first, then
+    # only the needed column chunks) when a projection or filters are given and
+    # the local object cache is disabled. Smaller objects are fetched whole.
+    parquet_range_read_min_bytes: int = 8 * 1024 ** 2  # 8 MiB
+    # Keep loaded columns Arrow-backed (pd.ArrowDtype) instead of NumPy dtypes.
+    # Saves the Arrow->NumPy copy, but pages must support ArrowDtype columns.
+    parquet_arrow_dtypes: bool = False
+
+    # ETL writer
+    # Partitions whose Parquet file would exceed this size are split into
+    # part-0000, part-0001, ... files of roughly this size, read in parallel.
+    etl_part_target_bytes: int = 128 * 1024 ** 2  # 128 MiB
+
+    # Dataset cache
+    # Cached datasets never expire by time. Once an entry has gone this many
+    # seconds without a check, the next hit triggers a background version
+    # check (ETag/listing) and the entry is dropped only if the data changed.
+    cache_revalidate_seconds: int = 300
+    # Changed data is re-read in the background while the previous entry keeps
+    # being served. An entry not confirmed current for this long (e.g. because
+    # refreshes keep failing) is revalidated before it is served; 0 = no limit.
+    cache_max_stale_seconds: int = 3600
+    # Poll the version markers published by ETL loads (src/core/version_watch.py)
+    # this often and refresh only the datasets that were republished; 0 disables.
+    # Datasets without a marker still rely on cache_revalidate_seconds.
+    cache_version_poll_seconds: int = 30
+    # Preload every dashboard's datasets in the background at startup
+    # (src/core/warmup.py); /readyz answers 503 until it has finished.
+    cache_warmup_enabled: bool = True
+    cache_warmup_concurrency: int = 4  # dashboards warmed in parallel
+    # Per-worker budget for the estimated in-memory size of cached entries
+    # (deep DataFrame memory usage). Least recently used entries are evicted
+    # beyond it; 0 disables the byte limit.
+    cache_max_bytes: int = 2 * 1024 ** 3  # 2 GiB
+    # Directory shared by all workers (e.g. /dev/shm/bi-dash). When set, each
+    # dataset version is written once as an Arrow IPC file and memory-mapped
+    # by every worker, so N workers hold roughly one copy of the data.
+    cache_shared_dir: Optional[str] = None
+    # Memoized page callback outputs (src/core/callback_memo.py), keyed by
+    # dataset version + normalized filter inputs. Per-worker bounds; 0 disables
+    # the byte limit.
+    callback_memo_enabled: bool = True
+    callback_memo_max_entries: int = 256
+    callback_memo_max_bytes: int = 256 * 1024 ** 2  # 256 MiB
 
     # Auth
     basic_auth_username: str = "admin"
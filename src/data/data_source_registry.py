@@ -36,7 +36,35 @@ def load_dashboard_config(dashboard_id: str) -> dict:
     if not isinstance(charts, dict):
         raise ValueError("Dashboard config 'charts' must be a mapping")
 
-    return {"charts": charts}
+    datasets = data.get("datasets") or {}
+    if not isinstance(datasets, dict):
+        raise ValueError("Dashboard config 'datasets' must be a mapping")
+    for dataset_id, options in datasets.items():
+        if not isinstance(options, dict):
+            raise ValueError(f"Dashboard config for dataset '{dataset_id}' must be a mapping")
+        categorical = options.get("categorical_columns", [])
+        if not isinstance(categorical, list) or not all(isinstance(c, str) for c in categorical):
+            raise ValueError(
+                f"'categorical_columns' of dataset '{dataset_id}' must be a list of strings"
+            )
+
+    return {"charts": charts, "datasets": datasets}
+
+
+def list_dashboard_ids() -> list[str]:
+    """Return the IDs of all dashboards that have a data_sources.yml, sorted."""
+    return sorted(
+        path.parent.name
+        for path in DASHBOARD_PAGES_DIR.glob(f"*/{DASHBOARD_CONFIG_FILENAME}")
+    )
+
+
+def get_dataset_ids(dashboard_id: str) -> list[str]:
+    """Return every dataset ID a dashboard uses (chart mappings and dataset options), sorted."""
+    config = load_dashboard_config(dashboard_id)
+    dataset_ids = {v for v in config["charts"].values() if isinstance(v, str)}
+    dataset_ids.update(config["datasets"])
+    return sorted(dataset_ids)
 
 
 def get_dataset_id(dashboard_id: str, chart_id: str) -> Optional[str]:
@@ -56,6 +84,21 @@ def get_dataset_id(dashboard_id: str, chart_id: str) -> Optional[str]:
     return None
 
 
+def get_categorical_columns(dashboard_id: str, dataset_id: str) -> Optional[list[str]]:
+    """Return the columns a dashboard loads as pandas ``category`` for a dataset.
+
+    Configured per dataset under ``datasets.<dataset_id>.categorical_columns``
+    in the dashboard's data_sources.yml.
+
+    Returns:
+        List of column names, or None if none are configured.
+    """
+    config = load_dashboard_config(dashboard_id)
+    options = config.get("datasets", {}).get(dataset_id) or {}
+    columns = options.get("categorical_columns")
+    return list(columns) if columns else None
+
+
 def resolve_dataset_id(
     dashboard_id: str,
     chart_id: str,
@@ -5,6 +5,7 @@ import logging
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
 
 from src.data.parquet_reader import ParquetReader
 
@@ -81,7 +82,7 @@ class DatasetSummarizer:
         """Generate a dataset summary from a Parquet file in S3.
 
         Processing flow:
-          1. Read a sample via read_dataset
+          1. Stream the leading rows via iter_batches (the full dataset is never loaded)
           2. Extract schema: column name, dtype, nullable
           3. Compute per-column statistics:
              - Numeric: min, max, mean, std, null_count
@@ -94,10 +95,7 @@ class DatasetSummarizer:
         Returns:
             Dict with keys: schema, statistics, row_count, column_count.
         """
-        df = self.parquet_reader.read_dataset(dataset_id)
-        # Limit rows for preview
-        if len(df) > GENERATE_SUMMARY_PREVIEW_ROWS:
-            df = df.head(GENERATE_SUMMARY_PREVIEW_ROWS)
+        df = self._read_preview(dataset_id, GENERATE_SUMMARY_PREVIEW_ROWS)
 
         schema = self._build_generate_schema(df)
         statistics = self._build_generate_statistics(df)
@@ -113,6 +111,38 @@ class DatasetSummarizer:
     # Private helpers for generate_summary
     # ------------------------------------------------------------------
 
+    def _read_preview(self, dataset_id: str, max_rows: int) -> pd.DataFrame:
+        """Read at most *max_rows* leading rows, stopping the stream early.
+
+        Args:
+            dataset_id: Dataset ID
+            max_rows: Maximum number of rows to return.
+
+        Returns:
+            DataFrame with up to max_rows rows.
+        """
+        batches: list[pa.RecordBatch] = []
+        row_count = 0
+        stream = self.parquet_reader.iter_batches(dataset_id, batch_size=max_rows)
+        try:
+            for batch in stream:
+                batches.append(batch)
+                row_count += batch.num_rows
+                if row_count >= max_rows:
+                    break
+        finally:
+            stream.close()
+
+        if not batches:
+            # Empty file: read_dataset still yields the typed empty frame
+            return self.parquet_reader.read_dataset(dataset_id)
+
+        table = pa.concat_tables(
+            [pa.Table.from_batches([batch]) for batch in batches],
+            promote_options="permissive",
+        )
+        return table.slice(0, max_rows).to_pandas()
+
     def _build_generate_schema(self, df: pd.DataFrame) -> list[dict[str, Any]]:
         """Build schema information for generate_summary.
 
@@ -0,0 +1,68 @@
+"""Published dataset versions: the ETL-to-dashboard change signal.
+
+BaseETL.load writes ``_dataset_versions/{id}.json`` after the data and the
+manifest of a load are in place. Every load increments the version number,
+so the marker object changes exactly when new data has been published. All
+markers live under one prefix, so a dashboard process sees the state of
+every dataset with a single listing (ParquetReader.get_published_versions).
+"""
+import json
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+VERSIONS_PREFIX = "_dataset_versions/"
+VERSION_SUFFIX = ".json"
+
+
+def version_key(dataset_id: str) -> str:
+    """Return the S3 key of a dataset's published version marker."""
+    return f"{VERSIONS_PREFIX}{dataset_id}{VERSION_SUFFIX}"
+
+
+def dataset_id_from_version_key(key: str) -> Optional[str]:
+    """Extract the dataset ID from a marker key (None for other keys)."""
+    if not key.startswith(VERSIONS_PREFIX) or not key.endswith(VERSION_SUFFIX):
+        return None
+    dataset_id = key[len(VERSIONS_PREFIX):-len(VERSION_SUFFIX)]
+    return dataset_id if dataset_id and "/" not in dataset_id else None
+
+
+@dataclass
+class PublishedVersion:
+    """Version marker of one dataset.
+
+    Attributes:
+        dataset_id: Dataset ID.
+        version: Load counter, incremented by every ETL load (starts at 1).
+        published_at: ISO 8601 UTC timestamp of the load.
+        manifest_etag: ETag of the manifest written by the load.
+    """
+    dataset_id: str
+    version: int
+    published_at: str = ""
+    manifest_etag: str = ""
+
+    def to_json(self) -> str:
+        """Serialize to JSON."""
+        return json.dumps(asdict(self), ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, text: str) -> "PublishedVersion":
+        """Parse a marker.
+
+        Raises:
+            ValueError: If the JSON is malformed or the version is not a positive integer.
+        """
+        try:
+            payload = json.loads(text)
+            version = payload["version"]
+            if not isinstance(version, int) or isinstance(version, bool) or version < 1:
+                raise ValueError(f"Invalid published version: {version!r}")
+            return cls(
+                dataset_id=payload["dataset_id"],
+                version=version,
+                published_at=payload.get("published_at", ""),
+                manifest_etag=payload.get("manifest_etag", ""),
+            )
+        except (KeyError, TypeError, json.JSONDecodeError) as e:
+            raise ValueError(f"Invalid published version marker: {e}") from e
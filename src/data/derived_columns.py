@@ -0,0 +1,173 @@
+"""Derived columns that are materialized at ETL time.
+
+Dashboards that derive columns from the raw data on every callback (date
+parsing, label formatting) can have the ETL compute them once and store them
+in the Parquet file. The same functions are used by the pages as a fallback
+for datasets that were loaded before the columns were materialized.
+
+ETL configs select a set by name (``derived_columns: hamm_overview`` in
+backend/config/domo_datasets.yaml); see DERIVED_COLUMN_SETS.
+"""
+from typing import Callable
+
+import pandas as pd
+
+# ---- Hamm Overview -------------------------------------------------------
+
+# Source columns
+HAMM_ID = "id"
+HAMM_CREATED_AT = "created_at"
+HAMM_COMPLETED_AT = "completed_at"
+HAMM_VIDEO_DURATION = "video_duration"
+
+# Derived columns
+HAMM_VIDEO_DURATION_SECONDS = "_video_duration_seconds"
+HAMM_YEAR = "_year"
+HAMM_MONTH = "_month"
+HAMM_FISCAL_YEAR = "_fiscal_year"
+HAMM_FISCAL_QUARTER = "_fiscal_quarter"
+HAMM_ISO_WEEK = "_iso_week"
+HAMM_START_DATE = "_start_date"
+HAMM_END_DATE = "_end_date"
+
+CADENCE_WEEKLY = "weekly"
+CADENCE_MONTHLY = "monthly"
+CADENCE_QUARTERLY = "quarterly"
+CADENCE_YEARLY = "yearly"
+CADENCES = (CADENCE_WEEKLY, CADENCE_MONTHLY, CADENCE_QUARTERLY, CADENCE_YEARLY)
+
+NULL_LABEL = "Null"
+
+
+def hamm_cadence_column(name: str, cadence: str) -> str:
+    """Name of the materialized per-cadence variant of a label column."""
+    return f"{name}_{cadence}"
+
+
+# Columns written by add_hamm_derived_columns (besides the normalized sources)
+HAMM_MATERIALIZED_COLUMNS: list[str] = [
+    HAMM_VIDEO_DURATION_SECONDS,
+    HAMM_YEAR,
+    HAMM_MONTH,
+    HAMM_FISCAL_YEAR,
+    HAMM_FISCAL_QUARTER,
+    hamm_cadence_column(HAMM_ISO_WEEK, CADENCE_WEEKLY),
+] + [
+    hamm_cadence_column(name, cadence)
+    for cadence in CADENCES
+    for name in (HAMM_START_DATE, HAMM_END_DATE)
+]
+
+
+def has_hamm_derived_columns(df: pd.DataFrame) -> bool:
+    """True if *df* already carries the materialized Hamm columns."""
+    return all(column in df.columns for column in HAMM_MATERIALIZED_COLUMNS)
+
+
+def prepare_hamm_base(df: pd.DataFrame) -> pd.DataFrame:
+    """Normalize Hamm source columns and add the cadence-independent columns.
+
+    Returns a new frame (*df* is not modified; untouched columns are not
+    copied): ``id`` as string, timestamps parsed as UTC and made naive, video
+    duration in seconds, and ``_year``/``_month`` labels of the creation date.
+    """
+    created = pd.to_datetime(df[HAMM_CREATED_AT], utc=True).dt.tz_convert(None)
+    return df.assign(**{
+        HAMM_ID: df[HAMM_ID].astype(str),
+        HAMM_CREATED_AT: created,
+        HAMM_COMPLETED_AT: pd.to_datetime(df[HAMM_COMPLETED_AT], utc=True).dt.tz_convert(None),
+        # "HH:MM:SS" string to seconds (float)
+        HAMM_VIDEO_DURATION_SECONDS: pd.to_timedelta(
+            df[HAMM_VIDEO_DURATION], errors="coerce"
+        ).dt.total_seconds(),
+        HAMM_YEAR: created.dt.strftime("%Y"),
+        HAMM_MONTH: created.dt.strftime("%b"),
+    })
+
+
+def hamm_fiscal_labels(created: pd.Series) -> tuple[pd.Series, pd.Series]:
+    """Fiscal year and quarter labels (fiscal year starts in October)."""
+    shifted = created + pd.DateOffset(months=3)
+    fiscal_year = shifted.dt.strftime("%Y").fillna(NULL_LABEL)
+    fiscal_quarter = (
+        "Q" + shifted.dt.quarter.astype("Int64").astype(str)
+    ).where(~shifted.isna(), NULL_LABEL)
+    return fiscal_year, fiscal_quarter
+
+
+def hamm_period_labels(created: pd.Series, cadence: str) -> tuple[pd.Series, pd.Series, pd.Series]:
+    """ISO week, period start and period end labels for one cadence.
+
+    Weekly periods run Tuesday to Monday and carry the ISO week number; other
+    cadences have an empty ISO week. Dates are formatted like ``1-Jan-26``
+    and missing timestamps become ``"Null"``.
+
+    Returns:
+        (iso_week, start_date, end_date) Series aligned with *created*.
+    """
+    if cadence == CADENCE_WEEKLY:
+        iso_week = created.dt.strftime("%V").fillna(NULL_LABEL)
+        weekday = created.dt.weekday
+        start_offsets = weekday.map({0: -6, 1: 0, 2: -1, 3: -2, 4: -3, 5: -4, 6: -5})
+        end_offsets = weekday.map({0: 0, 1: 6, 2: 5, 3: 4, 4: 3, 5: 2, 6: 1})
+        start = (created + pd.to_timedelta(start_offsets, unit="D")).dt.strftime("%d-%b-%y")
+        end = (created + pd.to_timedelta(end_offsets, unit="D")).dt.strftime("%d-%b-%y")
+        return iso_week, start.fillna(NULL_LABEL), end.fillna(NULL_LABEL)
+
+    iso_week = pd.Series("", index=created.index)
+    if cadence == CADENCE_MONTHLY:
+        start = created.dt.strftime("1-%b-%y")
+        end = created.dt.to_period("M").dt.end_time.dt.strftime("%d-%b-%y")
+    elif cadence == CADENCE_QUARTERLY:
+        quarters = created.dt.to_period("Q")
+        start = quarters.dt.start_time.dt.strftime("1-%b-%y")
+        end = quarters.dt.end_time.dt.strftime("%d-%b-%y")
+    else:
+        start = created.dt.strftime("1-Jan-%y")
+        end = created.dt.strftime("31-Dec-%y")
+    return iso_week, start.fillna(NULL_LABEL), end.fillna(NULL_LABEL)
+
+
+def add_hamm_derived_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Materialize every Hamm Overview derived column (ETL step).
+
+    Adds the base columns of prepare_hamm_base, the fiscal labels and the
+    ISO week/start/end labels of every cadence (see hamm_cadence_column).
+    Label columns are stored as ``category``, which Parquet keeps dictionary
+    encoded and the reader loads back as category.
+    """
+    df = prepare_hamm_base(df)
+    created = df[HAMM_CREATED_AT]
+
+    labels: dict[str, pd.Series] = {}
+    labels[HAMM_FISCAL_YEAR], labels[HAMM_FISCAL_QUARTER] = hamm_fiscal_labels(created)
+    for cadence in CADENCES:
+        iso_week, start, end = hamm_period_labels(created, cadence)
+        if cadence == CADENCE_WEEKLY:
+            labels[hamm_cadence_column(HAMM_ISO_WEEK, cadence)] = iso_week
+        labels[hamm_cadence_column(HAMM_START_DATE, cadence)] = start
+        labels[hamm_cadence_column(HAMM_END_DATE, cadence)] = end
+
+    for name in (HAMM_YEAR, HAMM_MONTH):
+        labels[name] = df[name]
+    return df.assign(**{name: values.astype("category") for name, values in labels.items()})
+
+
+DERIVED_COLUMN_SETS: dict[str, Callable[[pd.DataFrame], pd.DataFrame]] = {
+    "hamm_overview": add_hamm_derived_columns,
+}
+
+
+def apply_derived_columns(df: pd.DataFrame, name: str) -> pd.DataFrame:
+    """Apply the derived column set *name* to *df*.
+
+    Raises:
+        ValueError: If *name* is not a known derived column set.
+    """
+    try:
+        derive = DERIVED_COLUMN_SETS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown derived column set '{name}' (known: {sorted(DERIVED_COLUMN_SETS)})"
+        ) from None
+    return derive(df)
@@ -2,6 +2,9 @@
 from dataclasses import dataclass, field
 from typing import Optional
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from datetime import datetime
 
 
@@ -51,46 +54,239 @@ def apply_filters(df: pd.DataFrame, filter_set: FilterSet) -> pd.DataFrame:
         filter_set: Set of filters to apply
 
     Returns:
-        Filtered DataFrame (original df is not modified)
+        Filtered DataFrame (original df is not modified). The rows are
+        selected once with the combined mask; the source is not copied first.
+        Without any applicable filter the result is a shallow copy under
+        Copy-on-Write and a deep copy otherwise, so it never aliases df.
     """
-    result = df.copy()
+    mask: Optional[pd.Series] = None
+
+    def _and(condition: pd.Series) -> None:
+        nonlocal mask
+        mask = condition if mask is None else mask & condition
 
     # Apply category filters
     for cat_filter in filter_set.category_filters:
-        if cat_filter.column not in result.columns:
+        if cat_filter.column not in df.columns:
             continue
 
         if cat_filter.include_null:
             # Include NULL values
-            mask = (
-                result[cat_filter.column].isin(cat_filter.values)
-                | result[cat_filter.column].isna()
-            )
+            _and(df[cat_filter.column].isin(cat_filter.values) | df[cat_filter.column].isna())
         else:
             # Exclude NULL values
-            mask = result[cat_filter.column].isin(cat_filter.values)
-
-        result = result[mask]
+            _and(df[cat_filter.column].isin(cat_filter.values))
 
     # Apply date filters
     for date_filter in filter_set.date_filters:
-        if date_filter.column not in result.columns:
+        if date_filter.column not in df.columns:
             continue
 
         # Convert date strings to datetime for comparison
-        start_dt = pd.to_datetime(date_filter.start_date)
-        end_dt = pd.to_datetime(date_filter.end_date)
-
-        # Set time to end of day for end_date (23:59:59)
-        end_dt = end_dt.replace(hour=23, minute=59, second=59)
+        # (end_date is extended to end of day, 23:59:59)
+        start_dt, end_dt = _date_filter_bounds(
+            date_filter, tz_aware=isinstance(df[date_filter.column].dtype, pd.DatetimeTZDtype)
+        )
 
         # Apply filter (boundaries inclusive)
-        mask = (result[date_filter.column] >= start_dt) & (
-            result[date_filter.column] <= end_dt
+        _and((df[date_filter.column] >= start_dt) & (df[date_filter.column] <= end_dt))
+
+    if mask is None:
+        # No applicable filter: a shallow copy is only safe to hand out when
+        # writes through it are copied (Copy-on-Write); df may be a cached frame
+        return df.copy(deep=not _copy_on_write_enabled())
+    return df[mask]
+
+
+def _copy_on_write_enabled() -> bool:
+    """Return True if pandas Copy-on-Write is active (always on with pandas >= 3)."""
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    return pd.get_option("mode.copy_on_write") is True
+
+
+def _date_filter_bounds(
+    date_filter: DateRangeFilter,
+    tz_aware: bool = False,
+) -> tuple[pd.Timestamp, pd.Timestamp]:
+    """Inclusive [start 00:00:00, end 23:59:59] bounds of a date filter.
+
+    Shared by apply_filters and to_arrow_filter so both paths select the same
+    rows. For tz-aware columns (*tz_aware*) naive bounds are interpreted as
+    UTC, matching the pages that strip timezones with ``tz_convert(None)``
+    before filtering.
+    """
+    start_dt = pd.to_datetime(date_filter.start_date)
+    end_dt = pd.to_datetime(date_filter.end_date).replace(hour=23, minute=59, second=59)
+    if tz_aware:
+        start_dt, end_dt = (
+            bound.tz_localize("UTC") if bound.tz is None else bound for bound in (start_dt, end_dt)
+        )
+    return start_dt, end_dt
+
+
+def _timestamp_scalar(value: pd.Timestamp, arrow_type: pa.DataType) -> pa.Scalar:
+    """Build an Arrow scalar comparable with a timestamp column."""
+    return pa.scalar(value).cast(arrow_type)
+
+
+def to_arrow_filter(
+    filter_set: FilterSet,
+    schema: pa.Schema,
+) -> tuple[Optional[pc.Expression], FilterSet]:
+    """
+    Translate the pushable part of a FilterSet into an Arrow expression.
+
+    Used by ParquetReader for predicate pushdown: row groups whose min/max
+    statistics cannot match are skipped (matching_row_groups) and the
+    expression is evaluated on the rest. Filters that cannot be expressed with identical semantics
+    to apply_filters are returned as a residual FilterSet to be applied
+    in memory afterwards.
+
+    Pushdown rules:
+    - CategoryFilter on a string/dictionary column with string values
+      -> isin(values) (| is_null() when include_null)
+    - DateRangeFilter on a timestamp column -> start <= column <= end
+    - Filters on columns missing from *schema* are dropped, matching
+      apply_filters which skips missing columns
+    - Anything else stays in the residual FilterSet
+
+    Args:
+        filter_set: Filters to translate
+        schema: Arrow schema of the file being read
+
+    Returns:
+        (expression or None when nothing was pushed, residual FilterSet)
+    """
+    expressions = []
+    residual = FilterSet()
+
+    for cat_filter in filter_set.category_filters:
+        if cat_filter.column not in schema.names:
+            continue
+        if not _is_pushable_category(cat_filter, schema):
+            residual.category_filters.append(cat_filter)
+            continue
+
+        expression = pc.field(cat_filter.column).isin(list(cat_filter.values))
+        if cat_filter.include_null:
+            expression = expression | pc.field(cat_filter.column).is_null()
+        expressions.append(expression)
+
+    for date_filter in filter_set.date_filters:
+        if date_filter.column not in schema.names:
+            continue
+        if not _is_pushable_date(date_filter, schema):
+            residual.date_filters.append(date_filter)
+            continue
+
+        arrow_type = schema.field(date_filter.column).type
+        start_dt, end_dt = _date_filter_bounds(date_filter, tz_aware=arrow_type.tz is not None)
+        column = pc.field(date_filter.column)
+        expressions.append(
+            (column >= _timestamp_scalar(start_dt, arrow_type))
+            & (column <= _timestamp_scalar(end_dt, arrow_type))
         )
-        result = result[mask]
 
-    return result
+    if not expressions:
+        return None, residual
+
+    combined = expressions[0]
+    for expression in expressions[1:]:
+        combined = combined & expression
+    return combined, residual
+
+
+def matching_row_groups(
+    filter_set: FilterSet,
+    metadata: pq.FileMetaData,
+    schema: pa.Schema,
+) -> list[int]:
+    """
+    Return the row groups of a Parquet file that may hold matching rows.
+
+    Only the filters to_arrow_filter pushes down are checked, against each
+    row group's min/max statistics: a category filter needs one value within
+    [min, max] (or nulls when include_null), a date filter an overlap with
+    [start, end]. Columns without statistics never exclude a row group.
+
+    Args:
+        filter_set: Filters being applied
+        metadata: Parquet footer of the file
+        schema: Arrow schema of the file (as in to_arrow_filter)
+
+    Returns:
+        Indices of the row groups to read, in file order.
+    """
+    if metadata.num_row_groups == 0:
+        return []
+    first = metadata.row_group(0)
+    positions = {first.column(i).path_in_schema: i for i in range(first.num_columns)}
+
+    checks = []
+    for cat_filter in filter_set.category_filters:
+        if cat_filter.column in positions and _is_pushable_category(cat_filter, schema):
+            checks.append((positions[cat_filter.column], _category_may_match(cat_filter)))
+    for date_filter in filter_set.date_filters:
+        if date_filter.column in positions and _is_pushable_date(date_filter, schema):
+            tz_aware = schema.field(date_filter.column).type.tz is not None
+            start_dt, end_dt = _date_filter_bounds(date_filter, tz_aware=tz_aware)
+            checks.append((positions[date_filter.column], _range_may_match(start_dt, end_dt)))
+
+    selected = []
+    for index in range(metadata.num_row_groups):
+        row_group = metadata.row_group(index)
+        if all(
+            _may_match(row_group.column(position).statistics, check)
+            for position, check in checks
+        ):
+            selected.append(index)
+    return selected
+
+
+def _is_pushable_category(cat_filter: CategoryFilter, schema: pa.Schema) -> bool:
+    """Category filters on string/dictionary columns with string values are pushed down."""
+    arrow_type = schema.field(cat_filter.column).type
+    if pa.types.is_dictionary(arrow_type):
+        arrow_type = arrow_type.value_type
+    is_string = pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type)
+    return is_string and all(isinstance(v, str) for v in cat_filter.values)
+
+
+def _is_pushable_date(date_filter: DateRangeFilter, schema: pa.Schema) -> bool:
+    """Date filters on timestamp columns are pushed down."""
+    return pa.types.is_timestamp(schema.field(date_filter.column).type)
+
+
+def _category_may_match(cat_filter: CategoryFilter):
+    def check(stats) -> bool:
+        if cat_filter.include_null and stats.null_count != 0:
+            return True
+        return any(stats.min <= value <= stats.max for value in cat_filter.values)
+    return check
+
+
+def _range_may_match(start_dt: pd.Timestamp, end_dt: pd.Timestamp):
+    def check(stats) -> bool:
+        return not (pd.Timestamp(stats.max) < start_dt or pd.Timestamp(stats.min) > end_dt)
+    return check
+
+
+def _may_match(stats, check) -> bool:
+    """Apply *check* to column chunk statistics; missing or odd statistics never prune."""
+    if stats is None or not stats.has_min_max:
+        return True
+    try:
+        return check(stats)
+    except (TypeError, ValueError):
+        return True
+
+
+def filter_columns(filter_set: FilterSet) -> list[str]:
+    """Return the column names referenced by a FilterSet, in order, without duplicates."""
+    columns = [f.column for f in filter_set.category_filters]
+    columns += [f.column for f in filter_set.date_filters]
+    return list(dict.fromkeys(columns))
 
 
 def extract_unique_values(df: pd.DataFrame, column: str) -> list:
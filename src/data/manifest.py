@@ -0,0 +1,235 @@
+"""Dataset manifest: a small JSON object describing a dataset's Parquet layout.
+
+Written by BaseETL.load to ``datasets/{id}/_manifest.json`` and read by
+ParquetReader to plan reads without listing the bucket.
+"""
+import datetime
+import json
+import math
+from dataclasses import asdict, dataclass, field
+from decimal import Decimal
+from typing import Any, Optional
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from src.data.object_cache import normalize_etag
+
+MANIFEST_FORMAT_VERSION = 1
+MANIFEST_FILENAME = "_manifest.json"
+
+LAYOUT_SINGLE = "single"
+LAYOUT_PARTITIONED = "partitioned"
+
+
+def manifest_key(dataset_id: str) -> str:
+    """Return the S3 key of a dataset's manifest."""
+    return f"datasets/{dataset_id}/{MANIFEST_FILENAME}"
+
+
+def partition_from_key(key: str) -> Optional[str]:
+    """Extract the partition date from a ``.../date=YYYY-MM-DD/...`` key."""
+    for segment in key.split("/"):
+        if segment.startswith("date="):
+            return segment.split("=", 1)[1]
+    return None
+
+
+@dataclass(frozen=True)
+class ManifestFile:
+    """One Parquet object of a dataset.
+
+    Attributes:
+        key: S3 object key.
+        size: Object size in bytes.
+        etag: Object ETag (without quotes).
+        row_count: Number of rows, or None if unknown.
+        partition: Partition date (YYYY-MM-DD) for partitioned datasets.
+        statistics: Per-column {min, max, null_count}, or None if unknown.
+    """
+    key: str
+    size: int
+    etag: str
+    row_count: Optional[int] = None
+    partition: Optional[str] = None
+    statistics: Optional[dict[str, dict[str, Any]]] = None
+
+
+@dataclass
+class DatasetManifest:
+    """Layout, files, schema and statistics of one dataset.
+
+    Attributes:
+        dataset_id: Dataset ID.
+        layout: LAYOUT_SINGLE or LAYOUT_PARTITIONED.
+        files: Parquet objects, in partition order.
+        schema: Column definitions ({name, type} per column).
+        created_at: ISO 8601 UTC timestamp of the load that wrote the manifest.
+        format_version: Manifest format version.
+    """
+    dataset_id: str
+    layout: str
+    files: list[ManifestFile]
+    schema: list[dict[str, str]] = field(default_factory=list)
+    created_at: str = ""
+    format_version: int = MANIFEST_FORMAT_VERSION
+
+    @property
+    def row_count(self) -> Optional[int]:
+        """Total rows, or None if any file's row count is unknown."""
+        counts = [f.row_count for f in self.files]
+        if any(c is None for c in counts):
+            return None
+        return sum(counts)
+
+    def partitions(self) -> list[str]:
+        """Sorted distinct partition dates."""
+        return sorted({f.partition for f in self.files if f.partition is not None})
+
+    def file_keys(self, date_range: Optional[tuple[str, str]] = None) -> list[str]:
+        """Object keys in partition order, optionally pruned to *date_range*.
+
+        Args:
+            date_range: Optional (start_date, end_date), inclusive, YYYY-MM-DD.
+                        Ignored for non-partitioned datasets.
+        """
+        files = sorted(self.files, key=lambda f: (f.partition or "", f.key))
+        if date_range and self.layout == LAYOUT_PARTITIONED:
+            start_date, end_date = date_range
+            files = [f for f in files if start_date <= (f.partition or "") <= end_date]
+        return [f.key for f in files]
+
+    def column_statistics(self) -> Optional[dict[str, dict[str, Any]]]:
+        """Dataset-wide column statistics, or None if any file lacks them."""
+        if any(f.statistics is None for f in self.files):
+            return None
+        return merge_statistics([f.statistics for f in self.files])
+
+    def to_json(self) -> str:
+        """Serialize to JSON (statistics and row_count are included for readers)."""
+        payload = asdict(self)
+        payload["row_count"] = self.row_count
+        payload["statistics"] = self.column_statistics()
+        return json.dumps(payload, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def from_json(cls, text: str) -> "DatasetManifest":
+        """Parse a manifest.
+
+        Raises:
+            ValueError: If the JSON is malformed or the format version is unsupported.
+        """
+        try:
+            payload = json.loads(text)
+            version = payload.get("format_version")
+            if version != MANIFEST_FORMAT_VERSION:
+                raise ValueError(f"Unsupported manifest format version: {version}")
+            if payload["layout"] not in (LAYOUT_SINGLE, LAYOUT_PARTITIONED):
+                raise ValueError(f"Unknown manifest layout: {payload['layout']}")
+            return cls(
+                dataset_id=payload["dataset_id"],
+                layout=payload["layout"],
+                files=[ManifestFile(**f) for f in payload["files"]],
+                schema=payload.get("schema", []),
+                created_at=payload.get("created_at", ""),
+                format_version=version,
+            )
+        except (KeyError, TypeError, json.JSONDecodeError) as e:
+            raise ValueError(f"Invalid dataset manifest: {e}") from e
+
+
+def manifest_file_from_upload(
+    key: str,
+    table: pa.Table,
+    size: int,
+    etag: str,
+    partition: Optional[str] = None,
+) -> ManifestFile:
+    """Describe an uploaded Parquet object from the Arrow table that was written."""
+    return ManifestFile(
+        key=key,
+        size=size,
+        etag=normalize_etag(etag),
+        row_count=table.num_rows,
+        partition=partition,
+        statistics=compute_statistics(table),
+    )
+
+
+def schema_entries(schema: pa.Schema) -> list[dict[str, str]]:
+    """Return {name, type} entries for the data columns of *schema*.
+
+    pandas index columns (``__index_level_N__``) are skipped.
+    """
+    return [
+        {"name": f.name, "type": str(f.type)}
+        for f in schema
+        if not f.name.startswith("__index_level_")
+    ]
+
+
+def compute_statistics(table: pa.Table) -> dict[str, dict[str, Any]]:
+    """Compute {min, max, null_count} per column.
+
+    min/max are only recorded for orderable scalar types (numbers, strings,
+    dates, timestamps); other columns get null_count only.
+    """
+    stats: dict[str, dict[str, Any]] = {}
+    for name, column in zip(table.column_names, table.columns):
+        if name.startswith("__index_level_"):
+            continue
+        entry: dict[str, Any] = {"null_count": column.null_count}
+        if pa.types.is_dictionary(column.type):
+            column = column.cast(column.type.value_type)
+        if _is_orderable(column.type) and column.null_count < len(column):
+            min_max = pc.min_max(column)
+            entry["min"] = _json_scalar(min_max["min"].as_py())
+            entry["max"] = _json_scalar(min_max["max"].as_py())
+        stats[name] = entry
+    return stats
+
+
+def merge_statistics(
+    per_file: list[dict[str, dict[str, Any]]],
+) -> dict[str, dict[str, Any]]:
+    """Merge per-file statistics into dataset-wide statistics."""
+    merged: dict[str, dict[str, Any]] = {}
+    unknown: set[tuple[str, str]] = set()
+    for stats in per_file:
+        for name, entry in stats.items():
+            target = merged.setdefault(name, {"null_count": 0})
+            target["null_count"] += entry.get("null_count", 0)
+            for bound, pick in (("min", min), ("max", max)):
+                value = entry.get(bound)
+                if value is None or (name, bound) in unknown:
+                    continue
+                current = target.get(bound)
+                try:
+                    target[bound] = value if current is None else pick(current, value)
+                except TypeError:
+                    # Mixed types across files (schema drift): bound is unknown
+                    unknown.add((name, bound))
+                    target.pop(bound, None)
+    return merged
+
+
+def _is_orderable(arrow_type: pa.DataType) -> bool:
+    return (
+        pa.types.is_integer(arrow_type)
+        or pa.types.is_floating(arrow_type)
+        or pa.types.is_string(arrow_type)
+        or pa.types.is_large_string(arrow_type)
+        or pa.types.is_date(arrow_type)
+        or pa.types.is_timestamp(arrow_type)
+    )
+
+
+def _json_scalar(value: Any) -> Any:
+    """Convert a Python scalar from Arrow into a JSON-serializable value."""
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
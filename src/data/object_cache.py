@@ -0,0 +1,162 @@
+"""Local on-disk cache for S3 objects, keyed by bucket/key/ETag."""
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE_SUFFIX = ".obj"
+# Re-scan the directory after this many puts to pick up files written (or
+# removed) by other worker processes sharing the directory
+RESCAN_INTERVAL_PUTS = 256
+
+
+def normalize_etag(etag: str) -> str:
+    """Strip the surrounding quotes S3 puts around ETag values."""
+    return etag.strip('"')
+
+
+class LocalObjectCache:
+    """Byte-size bounded LRU cache of downloaded S3 objects.
+
+    Each object version is stored as one file whose name is derived from
+    bucket, key and ETag, so a changed object can never be served from a stale
+    file. Files are written to a temporary name and renamed into place, which
+    makes the cache safe to share between threads and worker processes.
+    Recency and sizes are kept in an in-memory LRU index, so a put costs
+    O(1) plus the evictions it causes. The index is rebuilt from the
+    directory (ordered by mtime, which every hit refreshes) on first use and
+    every RESCAN_INTERVAL_PUTS puts, to account for other processes. When the
+    total size exceeds *max_bytes* the least recently used files are removed.
+    """
+
+    def __init__(self, root: str, max_bytes: int) -> None:
+        """
+        Args:
+            root: Cache directory (created if missing).
+            max_bytes: Upper bound for the total size of cached files.
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Path -> size, least recently used first (None: not scanned yet)
+        self._index: Optional[OrderedDict[Path, int]] = None
+        self._total = 0
+        self._puts_since_scan = 0
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, bucket: str, key: str, etag: str) -> Path:
+        """Return the cache file path for an object version."""
+        digest = hashlib.sha256(
+            f"{bucket}/{key}@{normalize_etag(etag)}".encode("utf-8")
+        ).hexdigest()
+        return self.root / f"{digest}{CACHE_FILE_SUFFIX}"
+
+    def get(self, bucket: str, key: str, etag: str) -> Optional[Path]:
+        """Return the cached file path on hit (and mark it recently used), else None."""
+        path = self.path_for(bucket, key, etag)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        with self._lock:
+            index = self._load_index()
+            if path in index:
+                index.move_to_end(path)
+            else:
+                # Written by another process since the last scan
+                self._add(path, _file_size(path))
+        return path
+
+    def put(self, bucket: str, key: str, etag: str, body: BinaryIO) -> Path:
+        """Stream *body* into the cache and return the cached file path.
+
+        Args:
+            bucket: S3 bucket name.
+            key: S3 object key.
+            etag: ETag of the object version being stored.
+            body: Readable binary stream (e.g. a get_object ``Body``).
+        """
+        path = self.path_for(bucket, key, etag)
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                shutil.copyfileobj(body, f, length=1024 * 1024)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        with self._lock:
+            self._puts_since_scan += 1
+            if self._puts_since_scan >= RESCAN_INTERVAL_PUTS:
+                self._index = None
+            self._load_index()
+            self._add(path, _file_size(path))
+            self._evict(keep=path)
+        return path
+
+    def total_bytes(self) -> int:
+        """Total size of the cached files (as tracked by the index)."""
+        with self._lock:
+            self._load_index()
+            return self._total
+
+    def _load_index(self) -> OrderedDict[Path, int]:
+        """Return the LRU index, scanning the directory if needed (lock held)."""
+        if self._index is None:
+            entries = []
+            for path in self.root.glob(f"*{CACHE_FILE_SUFFIX}"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, path, stat.st_size))
+            entries.sort(key=lambda entry: entry[0])
+            self._index = OrderedDict((path, size) for _, path, size in entries)
+            self._total = sum(self._index.values())
+            self._puts_since_scan = 0
+        return self._index
+
+    def _add(self, path: Path, size: int) -> None:
+        """Record *path* as most recently used (lock held)."""
+        index = self._load_index()
+        self._total += size - index.pop(path, 0)
+        index[path] = size
+
+    def _evict(self, keep: Path) -> None:
+        """Remove least recently used files until the cache fits in max_bytes (lock held)."""
+        index = self._load_index()
+        for path in list(index):
+            if self._total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            size = index.pop(path)
+            self._total -= size
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                continue  # already removed by another process
+            logger.info("Evicted %s (%d bytes) from local object cache", path.name, size)
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+@lru_cache(maxsize=8)
+def get_object_cache(root: str, max_bytes: int) -> LocalObjectCache:
+    """Return the process-wide LocalObjectCache for a directory."""
+    return LocalObjectCache(root, max_bytes)
@@ -1,25 +1,90 @@
-import io
-from typing import Optional
+import hashlib
+import logging
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Iterator, Optional
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pyarrow.parquet as pq
 from botocore.exceptions import ClientError
 
-from src.data.s3_client import get_s3_client
+from src.data.dataset_version import VERSIONS_PREFIX, dataset_id_from_version_key
+from src.data.manifest import (
+    LAYOUT_PARTITIONED,
+    DatasetManifest,
+    ManifestFile,
+    manifest_key,
+    partition_from_key,
+)
+from src.data.object_cache import get_object_cache, normalize_etag
+from src.data.s3_range_file import open_parquet_range_file
+from src.data.s3_client import get_shared_s3_client
 from src.data.config import settings
+from src.data.filter_engine import (
+    FilterSet,
+    apply_filters,
+    filter_columns,
+    matching_row_groups,
+    to_arrow_filter,
+)
 from src.exceptions import DatasetFileNotFoundError
 
+logger = logging.getLogger(__name__)
+
+# Rows per record batch yielded by ParquetReader.iter_batches
+DEFAULT_BATCH_SIZE = 65_536
+
+_shared_reader: Optional["ParquetReader"] = None
+_shared_reader_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class LoadStats:
+    """Size and timing figures for one dataset load.
+
+    Attributes:
+        dataset_id: Dataset identifier.
+        files: Number of Parquet objects read.
+        rows: Rows in the returned DataFrame.
+        columns: Columns in the returned DataFrame.
+        arrow_bytes: Size of the decoded Arrow tables before conversion.
+        pandas_bytes: Size of the returned DataFrame (deep memory usage).
+        seconds: Wall-clock duration of the load.
+    """
+    dataset_id: str
+    files: int
+    rows: int
+    columns: int
+    arrow_bytes: int
+    pandas_bytes: int
+    seconds: float
+
 
 class ParquetReader:
     """Reads Parquet files from S3 with automatic partition detection."""
 
-    def __init__(self):
-        self.client = get_s3_client()
+    def __init__(self, client=None):
+        """
+        Args:
+            client: Optional boto3 S3 client. Defaults to the process-wide shared
+                    client, so constructing a reader per callback is cheap and
+                    reuses pooled connections.
+        """
+        self.client = client if client is not None else get_shared_s3_client()
         self.bucket = settings.s3_bucket
 
     def read_dataset(
         self,
         dataset_id: str,
         date_range: Optional[tuple[str, str]] = None,
+        columns: Optional[list[str]] = None,
+        filters: Optional[FilterSet] = None,
+        categories: Optional[list[str]] = None,
     ) -> pd.DataFrame:
         """Read dataset with automatic partition detection and filtering.
 
@@ -27,13 +92,300 @@ class ParquetReader:
             dataset_id: Dataset identifier
             date_range: Optional (start_date, end_date) in ISO 8601 format (YYYY-MM-DD).
                        Used for partition pruning.
+            columns: Optional column projection. Only these columns are decoded;
+                     names missing from the file are ignored. None reads all columns.
+            filters: Optional FilterSet pushed down to the Parquet scan. Row groups
+                     whose statistics exclude the predicates are skipped, and the
+                     result equals apply_filters(read_dataset(dataset_id), filters).
+            categories: Optional string columns to load as pandas ``category``
+                        (decoded straight into Arrow dictionary arrays). Columns
+                        stored as dictionaries in the Arrow schema (e.g. written
+                        from pandas categoricals) are always loaded as category.
 
         Returns:
             Combined DataFrame from all matching partitions or single file.
         """
+        df, _ = self.read_dataset_with_stats(dataset_id, date_range, columns, filters, categories)
+        return df
+
+    def read_dataset_with_stats(
+        self,
+        dataset_id: str,
+        date_range: Optional[tuple[str, str]] = None,
+        columns: Optional[list[str]] = None,
+        filters: Optional[FilterSet] = None,
+        categories: Optional[list[str]] = None,
+    ) -> tuple[pd.DataFrame, LoadStats]:
+        """Read a dataset like read_dataset and report its memory figures.
+
+        Args:
+            dataset_id: Dataset identifier
+            date_range: Optional (start_date, end_date) for partition pruning.
+            columns: Optional column projection.
+            filters: Optional FilterSet for predicate pushdown.
+            categories: Optional string columns to load as category dtype.
+
+        Returns:
+            (DataFrame, LoadStats)
+        """
+        manifest = self.get_manifest(dataset_id)
+        objects = _manifest_objects(manifest)
+        if self._is_partitioned(dataset_id, manifest):
+            s3_paths = self._partition_paths(dataset_id, date_range, manifest)
+            return self._load(
+                dataset_id, s3_paths, columns, filters, partitioned=True,
+                categories=categories, objects=objects,
+            )
+        s3_path = f"datasets/{dataset_id}/data/part-0000.parquet"
+        return self._load(
+            dataset_id, [s3_path], columns, filters, partitioned=False,
+            categories=categories, objects=objects,
+        )
+
+    def iter_batches(
+        self,
+        dataset_id: str,
+        columns: Optional[list[str]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        date_range: Optional[tuple[str, str]] = None,
+    ) -> Iterator[pa.RecordBatch]:
+        """Stream a dataset as Arrow record batches, one file at a time.
+
+        Each object is spooled to a local file (or memory-mapped from the local
+        object cache) instead of being held in memory, and decoded row group by
+        row group. Peak memory is therefore bounded by roughly one row group plus
+        one batch, independent of the dataset size.
+
+        Args:
+            dataset_id: Dataset identifier
+            columns: Optional column projection (names missing from a file are ignored).
+            batch_size: Maximum number of rows per yielded batch.
+            date_range: Optional (start_date, end_date) for partition pruning.
+
+        Yields:
+            pyarrow.RecordBatch objects in partition order.
+
+        Raises:
+            DatasetFileNotFoundError: If the dataset (or every selected partition)
+                does not exist.
+        """
+        manifest = self.get_manifest(dataset_id)
+        if self._is_partitioned(dataset_id, manifest):
+            s3_paths = self._partition_paths(dataset_id, date_range, manifest)
+            skip_missing = True
+        else:
+            s3_paths = [f"datasets/{dataset_id}/data/part-0000.parquet"]
+            skip_missing = False
+
+        files_read = 0
+        for s3_path in s3_paths:
+            try:
+                source = self._open_stream(s3_path)
+            except DatasetFileNotFoundError:
+                if skip_missing:
+                    continue
+                raise
+            files_read += 1
+            try:
+                parquet_file = pq.ParquetFile(source)
+                projection = _project_columns(parquet_file.schema_arrow, columns)
+                yield from parquet_file.iter_batches(
+                    batch_size=batch_size,
+                    columns=projection,
+                    use_pandas_metadata=True,
+                )
+            finally:
+                source.close()
+
+        if files_read == 0:
+            raise DatasetFileNotFoundError(
+                s3_path=f"datasets/{dataset_id}/partitions/",
+                dataset_id=dataset_id,
+            )
+
+    def get_dataset_version(self, dataset_id: str) -> Optional[str]:
+        """Return a cheap version token for the dataset's current contents.
+
+        Datasets with a manifest use the manifest's ETag (one HEAD request); the
+        manifest is rewritten by every ETL load. Without a manifest,
+        non-partitioned datasets use the ETag of the data file (one HEAD request)
+        and partitioned datasets hash the key/ETag pairs of all partition objects
+        (one paginated listing, no data transfer). The token changes whenever
+        any object is rewritten, added or removed.
+
+        Returns:
+            Version string, or None if the dataset does not exist.
+        """
+        try:
+            head = self.client.head_object(Bucket=self.bucket, Key=manifest_key(dataset_id))
+            return f"manifest:{normalize_etag(head['ETag'])}"
+        except ClientError as e:
+            if not _is_not_found(e):
+                raise
+
         if self._has_partitions(dataset_id):
-            return self._read_partitioned(dataset_id, date_range)
-        return self._read_single(dataset_id)
+            prefix = f"datasets/{dataset_id}/partitions/"
+            digest = hashlib.sha256()
+            found = False
+            paginator = self.client.get_paginator("list_objects_v2")
+            for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+                for obj in page.get("Contents", []):
+                    digest.update(f"{obj['Key']}:{obj['ETag']}\n".encode("utf-8"))
+                    found = True
+            return digest.hexdigest() if found else None
+
+        s3_path = f"datasets/{dataset_id}/data/part-0000.parquet"
+        try:
+            head = self.client.head_object(Bucket=self.bucket, Key=s3_path)
+        except ClientError as e:
+            if _is_not_found(e):
+                return None
+            raise
+        return head["ETag"].strip('"')
+
+    def get_published_versions(self) -> dict[str, str]:
+        """Return a change token per dataset with a published version marker.
+
+        One paginated listing of the marker prefix covers every dataset (no
+        data transfer). The token is the marker's ETag, which changes with
+        every ETL load of the dataset (see src.data.dataset_version).
+
+        Returns:
+            Dict of dataset ID -> token; datasets loaded before markers were
+            published are absent.
+        """
+        published = {}
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=VERSIONS_PREFIX):
+            for obj in page.get("Contents", []):
+                dataset_id = dataset_id_from_version_key(obj["Key"])
+                if dataset_id is not None:
+                    published[dataset_id] = normalize_etag(obj["ETag"])
+        return published
+
+    def get_manifest(self, dataset_id: str) -> Optional[DatasetManifest]:
+        """Fetch the dataset manifest written by the ETL (datasets/{id}/_manifest.json).
+
+        Returns:
+            Parsed manifest, or None if the dataset has no usable manifest, in
+            which case callers fall back to listing the bucket.
+        """
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=manifest_key(dataset_id))
+            return DatasetManifest.from_json(response["Body"].read().decode("utf-8"))
+        except ClientError as e:
+            if not _is_not_found(e):
+                logger.warning("Manifest lookup failed for dataset %s: %s", dataset_id, e)
+            return None
+        except ValueError as e:
+            logger.warning("Ignoring invalid manifest for dataset %s: %s", dataset_id, e)
+            return None
+
+    def get_partition_versions(self, dataset_id: str) -> Optional[dict[str, str]]:
+        """Return a version token per partition of a partitioned dataset.
+
+        Uses the manifest when present, otherwise one paginated listing of the
+        partition prefix. A partition's token changes whenever any of its
+        objects is rewritten, added or removed, so callers can cache partitions
+        independently of each other.
+
+        Returns:
+            Dict of partition date (YYYY-MM-DD) -> version, sorted by date, or
+            None if the dataset is not partitioned (or does not exist).
+        """
+        manifest = self.get_manifest(dataset_id)
+        if manifest is not None:
+            if manifest.layout != LAYOUT_PARTITIONED:
+                return None
+            objects = [(f.partition, f.key, f.etag) for f in manifest.files if f.partition]
+        else:
+            objects = []
+            paginator = self.client.get_paginator("list_objects_v2")
+            prefix = f"datasets/{dataset_id}/partitions/"
+            for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+                for obj in page.get("Contents", []):
+                    partition = partition_from_key(obj["Key"])
+                    if partition and obj["Key"].endswith(".parquet"):
+                        objects.append((partition, obj["Key"], normalize_etag(obj["ETag"])))
+            if not objects:
+                return None
+
+        grouped: dict[str, list[str]] = {}
+        for partition, key, etag in sorted(objects):
+            grouped.setdefault(partition, []).append(f"{key}:{etag}")
+        return {
+            partition: hashlib.sha256("\n".join(entries).encode("utf-8")).hexdigest()
+            for partition, entries in grouped.items()
+        }
+
+    def read_partitions(
+        self,
+        dataset_id: str,
+        partitions: list[str],
+        columns: Optional[list[str]] = None,
+        categories: Optional[list[str]] = None,
+    ) -> dict[str, pd.DataFrame]:
+        """Read the given partitions of a partitioned dataset, one DataFrame each.
+
+        All files are fetched concurrently (as in read_dataset); the tables are
+        then converted per partition so that callers can cache them separately.
+
+        Args:
+            dataset_id: Dataset identifier
+            partitions: Partition dates (YYYY-MM-DD) to read.
+            columns: Optional column projection.
+            categories: Optional string columns to load as category dtype.
+
+        Returns:
+            Dict of partition date -> DataFrame, in the order given. Partitions
+            without any readable object are omitted.
+        """
+        manifest = self.get_manifest(dataset_id)
+        wanted = list(dict.fromkeys(partitions))
+        if manifest is not None:
+            by_partition: dict[str, list[str]] = {}
+            for f in sorted(manifest.files, key=lambda f: (f.partition or "", f.key)):
+                by_partition.setdefault(f.partition, []).append(f.key)
+            planned = [(p, key) for p in wanted for key in by_partition.get(p, [])]
+        else:
+            partition_files = self._list_partition_files(dataset_id)
+            planned = [(p, key) for p in wanted for key in partition_files.get(p, [])]
+
+        started = time.perf_counter()
+        parts = self._read_tables(
+            [key for _, key in planned], columns, None, categories, _manifest_objects(manifest)
+        )
+        tables: dict[str, list[pa.Table]] = {}
+        for (partition, _), part in zip(planned, parts):
+            if part is not None:
+                tables.setdefault(partition, []).append(part[0])
+        del parts
+
+        frames = {}
+        for partition in wanted:
+            if partition not in tables:
+                continue
+            df = _tables_to_pandas(tables.pop(partition)).reset_index(drop=True)
+            if columns is not None:
+                keep = [c for c in columns if c in df.columns]
+                if list(df.columns) != keep:
+                    df = df[keep]
+            frames[partition] = df
+        logger.info(
+            "Loaded %d of %d partitions of dataset %s in %.2fs",
+            len(frames), len(wanted), dataset_id, time.perf_counter() - started,
+        )
+        return frames
+
+    def _is_partitioned(
+        self,
+        dataset_id: str,
+        manifest: Optional[DatasetManifest] = None,
+    ) -> bool:
+        """Return the dataset layout from the manifest, or by listing without one."""
+        if manifest is not None:
+            return manifest.layout == LAYOUT_PARTITIONED
+        return self._has_partitions(dataset_id)
 
     def _has_partitions(self, dataset_id: str) -> bool:
         """Check if dataset uses partition structure (datasets/{id}/partitions/)."""
@@ -48,101 +400,342 @@ class ParquetReader:
         except ClientError:
             return False
 
-    def _list_partitions(self, dataset_id: str) -> list[str]:
-        """List available partitions for dataset.
+    def _partition_paths(
+        self,
+        dataset_id: str,
+        date_range: Optional[tuple[str, str]] = None,
+        manifest: Optional[DatasetManifest] = None,
+    ) -> list[str]:
+        """Return the object keys of the partitions selected by *date_range*.
+
+        Keys come from the manifest when one is given, otherwise from listing
+        the partition objects. Every part file of a partition is included.
+
+        Raises:
+            DatasetFileNotFoundError: If no partition falls inside the range.
+        """
+        if manifest is not None:
+            s3_paths = manifest.file_keys(date_range)
+            if not s3_paths:
+                raise DatasetFileNotFoundError(
+                    s3_path=f"datasets/{dataset_id}/partitions/",
+                    dataset_id=dataset_id,
+                )
+            return s3_paths
+
+        partition_files = self._list_partition_files(dataset_id)
+
+        if date_range:
+            start_date, end_date = date_range
+            partitions_to_read = [
+                p for p in partition_files
+                if start_date <= p <= end_date
+            ]
+        else:
+            partitions_to_read = list(partition_files)
+
+        if not partitions_to_read:
+            raise DatasetFileNotFoundError(
+                s3_path=f"datasets/{dataset_id}/partitions/",
+                dataset_id=dataset_id,
+            )
+
+        return [key for p in partitions_to_read for key in partition_files[p]]
+
+    def _list_partition_files(self, dataset_id: str) -> dict[str, list[str]]:
+        """List the Parquet objects of every partition (one paginated listing).
 
         Returns:
-            Sorted list of date strings (e.g., ["2024-01-01", "2024-01-02"])
+            Dict of partition date -> object keys (part-0000, part-0001, ...),
+            both sorted.
         """
         prefix = f"datasets/{dataset_id}/partitions/"
-        partitions = []
+        files: dict[str, list[str]] = {}
 
         try:
             paginator = self.client.get_paginator("list_objects_v2")
-            for page in paginator.paginate(
-                Bucket=self.bucket,
-                Prefix=prefix,
-                Delimiter="/",
-            ):
-                for p in page.get("CommonPrefixes", []):
-                    date_part = p["Prefix"].rstrip("/").split("/")[-1]
-                    if date_part.startswith("date="):
-                        partitions.append(date_part.split("=", 1)[1])
+            for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+                for obj in page.get("Contents", []):
+                    partition = partition_from_key(obj["Key"])
+                    if partition and obj["Key"].endswith(".parquet"):
+                        files.setdefault(partition, []).append(obj["Key"])
         except ClientError:
             pass
 
-        return sorted(partitions)
+        return {p: sorted(files[p]) for p in sorted(files)}
 
-    def _read_partitioned(
+    def _load(
         self,
         dataset_id: str,
-        date_range: Optional[tuple[str, str]] = None,
-    ) -> pd.DataFrame:
-        """Read partitioned dataset with optional date range filtering.
+        s3_paths: list[str],
+        columns: Optional[list[str]],
+        filters: Optional[FilterSet],
+        partitioned: bool,
+        categories: Optional[list[str]] = None,
+        objects: Optional[dict[str, ManifestFile]] = None,
+    ) -> tuple[pd.DataFrame, LoadStats]:
+        """Read files as Arrow tables, combine them and convert to pandas once.
+
+        Partition tables are concatenated in Arrow with permissive schema
+        promotion, so there are no per-partition DataFrames and no pd.concat
+        copy. The single to_pandas call splits blocks and self-destructs the
+        table, releasing Arrow buffers column by column while the frame is
+        built; peak memory stays near the size of the result.
+
+        Raises:
+            DatasetFileNotFoundError: If no file could be read.
+        """
+        started = time.perf_counter()
+        if partitioned:
+            parts = [
+                p for p in self._read_tables(s3_paths, columns, filters, categories, objects)
+                if p is not None
+            ]
+            if not parts:
+                raise DatasetFileNotFoundError(
+                    s3_path=f"datasets/{dataset_id}/partitions/",
+                    dataset_id=dataset_id,
+                )
+        else:
+            parts = [self._read_table(
+                s3_paths[0], columns, filters, categories, (objects or {}).get(s3_paths[0])
+            )]
+
+        tables = [table for table, _ in parts]
+        residuals = [(table.num_rows, residual) for table, residual in parts]
+        del parts
+        file_count = len(tables)
+        arrow_bytes = sum(table.nbytes for table in tables)
+
+        df = _tables_to_pandas(tables)
+        if partitioned:
+            df = df.reset_index(drop=True)
+        df = _apply_residual_filters(df, residuals)
+        if columns is not None:
+            keep = [c for c in columns if c in df.columns]
+            if list(df.columns) != keep:
+                df = df[keep]
+
+        stats = LoadStats(
+            dataset_id=dataset_id,
+            files=file_count,
+            rows=len(df),
+            columns=len(df.columns),
+            arrow_bytes=arrow_bytes,
+            pandas_bytes=int(df.memory_usage(index=True, deep=True).sum()),
+            seconds=time.perf_counter() - started,
+        )
+        logger.info(
+            "Loaded dataset %s: %d files, %d rows x %d cols, arrow=%d bytes, "
+            "pandas=%d bytes in %.2fs",
+            stats.dataset_id, stats.files, stats.rows, stats.columns,
+            stats.arrow_bytes, stats.pandas_bytes, stats.seconds,
+        )
+        return df, stats
+
+    def _read_tables(
+        self,
+        s3_paths: list[str],
+        columns: Optional[list[str]] = None,
+        filters: Optional[FilterSet] = None,
+        categories: Optional[list[str]] = None,
+        objects: Optional[dict[str, ManifestFile]] = None,
+    ) -> list[Optional[tuple[pa.Table, Optional[FilterSet]]]]:
+        """Read several Parquet files concurrently, preserving input order.
+
+        Uses a bounded thread pool sized by ``settings.parquet_read_concurrency``.
+        Files that no longer exist are returned as None so callers can skip them.
+        *objects* (manifest entries by key) provide sizes and ETags, so the
+        files need no HEAD request.
+        """
+        objects = objects or {}
+        workers = min(max(settings.parquet_read_concurrency, 1), len(s3_paths))
+        if workers <= 1:
+            return [
+                self._read_table_if_exists(path, columns, filters, categories, objects.get(path))
+                for path in s3_paths
+            ]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda path: self._read_table_if_exists(
+                    path, columns, filters, categories, objects.get(path)
+                ),
+                s3_paths,
+            ))
+
+    def _read_table_if_exists(
+        self,
+        s3_path: str,
+        columns: Optional[list[str]] = None,
+        filters: Optional[FilterSet] = None,
+        categories: Optional[list[str]] = None,
+        known: Optional[ManifestFile] = None,
+    ) -> Optional[tuple[pa.Table, Optional[FilterSet]]]:
+        """Read single Parquet file, returning None if it does not exist."""
+        try:
+            return self._read_table(s3_path, columns, filters, categories, known)
+        except DatasetFileNotFoundError:
+            return None
+
+    def _read_table(
+        self,
+        s3_path: str,
+        columns: Optional[list[str]] = None,
+        filters: Optional[FilterSet] = None,
+        categories: Optional[list[str]] = None,
+        known: Optional[ManifestFile] = None,
+    ) -> tuple[pa.Table, Optional[FilterSet]]:
+        """Read single Parquet file from S3 as an Arrow table.
 
         Args:
-            dataset_id: Dataset identifier
-            date_range: Optional (start_date, end_date) for partition pruning.
+            s3_path: Object key of the Parquet file.
+            columns: Optional column projection. Only the requested columns
+                     present in the file are decoded.
+            filters: Optional FilterSet. Pushable predicates are evaluated by the
+                     Parquet scan (row-group pruning).
+            categories: Optional string columns decoded as dictionary arrays.
+            known: Optional manifest entry of the object (size and ETag). If
+                   the object was rewritten since, it is read again without it.
 
         Returns:
-            Combined DataFrame from filtered partitions.
+            (table, residual FilterSet still to be applied in memory, or None).
+            Columns needed by the residual filters are included in the table.
 
         Raises:
-            DatasetFileNotFoundError: If no valid partitions found.
+            DatasetFileNotFoundError: If file not found.
         """
-        all_partitions = self._list_partitions(dataset_id)
+        try:
+            return self._read_table_once(s3_path, columns, filters, categories, known)
+        except Exception as e:
+            if known is None or not _is_precondition_failed(e):
+                raise
+            logger.info("Object %s changed since its manifest entry; re-reading", s3_path)
+            return self._read_table_once(s3_path, columns, filters, categories, None)
 
-        if date_range:
-            start_date, end_date = date_range
-            partitions_to_read = [
-                p for p in all_partitions
-                if start_date <= p <= end_date
-            ]
-        else:
-            partitions_to_read = all_partitions
+    def _read_table_once(
+        self,
+        s3_path: str,
+        columns: Optional[list[str]],
+        filters: Optional[FilterSet],
+        categories: Optional[list[str]],
+        known: Optional[ManifestFile],
+    ) -> tuple[pa.Table, Optional[FilterSet]]:
+        selective = columns is not None or filters is not None
+        try:
+            source, metadata = self._open_source(s3_path, selective, known)
+        except ClientError as e:
+            if _is_not_found(e):
+                raise DatasetFileNotFoundError(s3_path=s3_path) from e
+            raise
 
-        if not partitions_to_read:
-            raise DatasetFileNotFoundError(
-                s3_path=f"datasets/{dataset_id}/partitions/",
-                dataset_id=dataset_id,
+        parquet_file = pq.ParquetFile(source, metadata=metadata, pre_buffer=True)
+        read_dictionary = _dictionary_columns(parquet_file.schema_arrow, categories)
+        if read_dictionary:
+            parquet_file = pq.ParquetFile(
+                source,
+                metadata=parquet_file.metadata,
+                pre_buffer=True,
+                read_dictionary=read_dictionary,
             )
+        projection = _project_columns(parquet_file.schema_arrow, columns)
+        if filters is None:
+            return parquet_file.read(columns=projection, use_pandas_metadata=True), None
+        return _read_filtered(parquet_file, projection, filters)
 
-        dfs = []
-        for partition_date in partitions_to_read:
-            s3_path = f"datasets/{dataset_id}/partitions/date={partition_date}/part-0000.parquet"
-            try:
-                dfs.append(self._read_file(s3_path))
-            except DatasetFileNotFoundError:
-                continue
+    def _open_source(
+        self,
+        s3_path: str,
+        selective: bool,
+        known: Optional[ManifestFile] = None,
+    ) -> tuple[Any, Optional[pq.FileMetaData]]:
+        """Choose how to read a Parquet object.
 
-        if not dfs:
-            raise DatasetFileNotFoundError(
-                s3_path=f"datasets/{dataset_id}/partitions/",
-                dataset_id=dataset_id,
-            )
+        Selective reads (projection or filters) of objects of at least
+        ``settings.parquet_range_read_min_bytes`` use an S3RangeFile: the footer
+        comes from a ranged GET (or the per-ETag footer cache) and only the
+        needed column chunks are fetched, coalesced by pyarrow's pre-buffering.
+        Everything else is fetched whole via _fetch_buffer.
 
-        return pd.concat(dfs, ignore_index=True)
+        The object size and ETag come from its manifest entry (*known*) when
+        there is one, so no HEAD request is made; without one, a HEAD is sent.
+        Ranged GETs carry the ETag (IfMatch), so a stale entry fails with 412
+        instead of mixing object versions.
 
-    def _read_single(self, dataset_id: str) -> pd.DataFrame:
-        """Read non-partitioned dataset."""
-        s3_path = f"datasets/{dataset_id}/data/part-0000.parquet"
-        return self._read_file(s3_path)
+        Returns:
+            (readable source, cached FileMetaData or None)
+        """
+        if selective and not settings.parquet_cache_dir:
+            if known is not None:
+                size, etag = known.size, known.etag
+            else:
+                head = self.client.head_object(Bucket=self.bucket, Key=s3_path)
+                size, etag = head["ContentLength"], head["ETag"]
+            if size >= settings.parquet_range_read_min_bytes:
+                return open_parquet_range_file(self.client, self.bucket, s3_path, size, etag)
+        return pa.BufferReader(self._fetch_buffer(s3_path)), None
+
+    def _fetch_buffer(self, s3_path: str) -> pa.Buffer:
+        """Fetch a Parquet object as an Arrow buffer.
+
+        Without a local object cache the object is downloaded into memory.
+        With ``settings.parquet_cache_dir`` set, the object is looked up by its
+        current ETag (one HEAD request) and memory-mapped from disk; only a miss
+        downloads it, streaming straight into the cache file.
+        """
+        if not settings.parquet_cache_dir:
+            response = self.client.get_object(Bucket=self.bucket, Key=s3_path)
+            return pa.py_buffer(response["Body"].read())
+        return self._open_cached(s3_path).read_buffer()
 
-    def _read_file(self, s3_path: str) -> pd.DataFrame:
-        """Read single Parquet file from S3.
+    def _open_stream(self, s3_path: str) -> BinaryIO:
+        """Open a Parquet object as a seekable local file without reading it into memory.
+
+        Uses the local object cache when configured; otherwise the body is
+        streamed into an anonymous temporary file that disappears on close.
 
         Raises:
             DatasetFileNotFoundError: If file not found.
         """
         try:
+            if settings.parquet_cache_dir:
+                return self._open_cached(s3_path)
             response = self.client.get_object(Bucket=self.bucket, Key=s3_path)
-            parquet_data = response["Body"].read()
-            return pq.ParquetFile(io.BytesIO(parquet_data)).read().to_pandas()
         except ClientError as e:
-            if e.response["Error"]["Code"] in ("NoSuchKey", "404", "NotFound"):
+            if _is_not_found(e):
                 raise DatasetFileNotFoundError(s3_path=s3_path) from e
             raise
 
+        spool = tempfile.TemporaryFile()
+        try:
+            shutil.copyfileobj(response["Body"], spool, length=1024 * 1024)
+            spool.seek(0)
+        except BaseException:
+            spool.close()
+            raise
+        return spool
+
+    def _open_cached(self, s3_path: str) -> pa.MemoryMappedFile:
+        """Memory-map the current version of an object from the local object cache.
+
+        The object is looked up by its current ETag (one HEAD request); only a
+        miss downloads it, streaming straight into the cache file.
+        """
+        object_cache = get_object_cache(
+            settings.parquet_cache_dir, settings.parquet_cache_max_bytes
+        )
+        head = self.client.head_object(Bucket=self.bucket, Key=s3_path)
+        path = object_cache.get(self.bucket, s3_path, head["ETag"])
+        if path is not None:
+            try:
+                return pa.memory_map(str(path), "r")
+            except FileNotFoundError:
+                pass  # evicted between lookup and open: download again
+
+        response = self.client.get_object(Bucket=self.bucket, Key=s3_path)
+        path = object_cache.put(self.bucket, s3_path, response["ETag"], response["Body"])
+        return pa.memory_map(str(path), "r")
+
     def list_datasets(self) -> list[str]:
         """Get list of available datasets."""
         try:
@@ -154,3 +747,199 @@ class ParquetReader:
             return [p["Prefix"].split("/")[1] for p in response.get("CommonPrefixes", [])]
         except ClientError:
             return []
+
+
+def get_reader() -> ParquetReader:
+    """Return the process-wide ParquetReader.
+
+    Pages, warmup and the version watcher share one reader (and through it
+    the pooled S3 client) instead of constructing one per callback. It is
+    created on first use.
+    """
+    global _shared_reader
+    reader = _shared_reader
+    if reader is not None:
+        return reader
+    with _shared_reader_lock:
+        if _shared_reader is None:
+            _shared_reader = ParquetReader()
+        return _shared_reader
+
+
+def reset_reader() -> None:
+    """Drop the process-wide ParquetReader (after settings changes, in tests)."""
+    global _shared_reader
+    with _shared_reader_lock:
+        _shared_reader = None
+
+
+def _project_columns(
+    schema: pa.Schema,
+    columns: Optional[list[str]],
+) -> Optional[list[str]]:
+    """Restrict a requested projection to the columns present in *schema*.
+
+    Returns None (read everything) when no projection is requested.
+    """
+    if columns is None:
+        return None
+    available = set(schema.names)
+    return [c for c in columns if c in available]
+
+
+def _dictionary_columns(
+    schema: pa.Schema,
+    categories: Optional[list[str]],
+) -> list[str]:
+    """Return the requested category columns that are plain strings in *schema*.
+
+    Other types are left alone; columns that are already dictionaries are read
+    as dictionaries by pyarrow anyway.
+    """
+    if not categories:
+        return []
+    return [
+        name for name in categories
+        if name in schema.names
+        and (pa.types.is_string(schema.field(name).type)
+             or pa.types.is_large_string(schema.field(name).type))
+    ]
+
+
+def _manifest_objects(manifest: Optional[DatasetManifest]) -> Optional[dict[str, ManifestFile]]:
+    """Manifest entries by object key (None without a manifest)."""
+    if manifest is None:
+        return None
+    return {f.key: f for f in manifest.files}
+
+
+def _is_precondition_failed(error: BaseException) -> bool:
+    """Return True if *error* (or its cause) is an S3 IfMatch mismatch (HTTP 412)."""
+    while error is not None:
+        if isinstance(error, ClientError) and error.response["Error"]["Code"] in (
+            "PreconditionFailed", "412",
+        ):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def _is_not_found(error: ClientError) -> bool:
+    """Return True if a botocore ClientError means the object does not exist."""
+    return error.response["Error"]["Code"] in ("NoSuchKey", "404", "NotFound")
+
+
+def _read_filtered(
+    parquet_file: pq.ParquetFile,
+    projection: Optional[list[str]],
+    filters: FilterSet,
+) -> tuple[pa.Table, Optional[FilterSet]]:
+    """Read a Parquet file with predicate pushdown.
+
+    Predicates that translate to Arrow expressions prune row groups by their
+    min/max statistics (matching_row_groups), and the expression filters the
+    rows read. Everything goes through *parquet_file*, so its footer (possibly
+    from the footer cache) is not fetched or parsed again. The residual
+    filters are returned for the caller to apply in memory, and the columns
+    they need are read in addition to the projection.
+    """
+    schema = parquet_file.schema_arrow
+    expression, residual = to_arrow_filter(filters, schema)
+
+    read_columns = projection
+    if projection is not None:
+        extra = [
+            c for c in filter_columns(residual)
+            if c in schema.names and c not in projection
+        ]
+        read_columns = projection + extra
+
+    if expression is None:
+        table = parquet_file.read(
+            columns=read_columns,
+            use_pandas_metadata=True,
+        )
+    else:
+        # Columns only the pushed predicates need are read, then dropped
+        predicate_only = []
+        if read_columns is not None:
+            predicate_only = [
+                c for c in filter_columns(filters)
+                if c in schema.names and c not in read_columns
+            ]
+        table = parquet_file.read_row_groups(
+            matching_row_groups(filters, parquet_file.metadata, schema),
+            columns=None if read_columns is None else read_columns + predicate_only,
+            use_pandas_metadata=True,
+        )
+        table = table.filter(expression)
+        if predicate_only:
+            table = table.drop_columns(predicate_only)
+
+    if residual.category_filters or residual.date_filters:
+        return table, residual
+    return table, None
+
+
+def _to_pandas(table: pa.Table) -> pd.DataFrame:
+    """Convert a table to pandas with minimal peak memory.
+
+    The table is consumed (self_destruct) and must not be used afterwards.
+    With ``settings.parquet_arrow_dtypes`` the columns stay Arrow-backed
+    (pd.ArrowDtype) and are not copied into NumPy at all.
+    """
+    options: dict[str, Any] = {"split_blocks": True, "self_destruct": True}
+    if settings.parquet_arrow_dtypes:
+        options["types_mapper"] = pd.ArrowDtype
+    return table.to_pandas(**options)
+
+
+def _tables_to_pandas(tables: list[pa.Table]) -> pd.DataFrame:
+    """Concatenate tables in Arrow and convert once.
+
+    The list is emptied so that the combined table holds the only reference
+    to the column buffers, which lets to_pandas release them as it goes.
+    """
+    if len(tables) == 1:
+        return _to_pandas(tables.pop())
+
+    try:
+        table = pa.concat_tables(tables, promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        # Partition schemas that Arrow cannot unify (e.g. int vs string):
+        # fall back to pandas, which widens to object
+        logger.warning("Partition schemas could not be unified in Arrow (%s); using pd.concat", e)
+        frames = []
+        while tables:
+            frames.append(_to_pandas(tables.pop(0)))
+        return pd.concat(frames, ignore_index=True)
+
+    tables.clear()
+    return _to_pandas(table)
+
+
+def _apply_residual_filters(
+    df: pd.DataFrame,
+    parts: list[tuple[int, Optional[FilterSet]]],
+) -> pd.DataFrame:
+    """Apply each file's residual filters to that file's rows of *df*.
+
+    Args:
+        df: Combined DataFrame; multi-file frames must have a RangeIndex.
+        parts: (row count, residual FilterSet or None) per file, in row order.
+    """
+    if all(residual is None for _, residual in parts):
+        return df
+    if len(parts) == 1:
+        return apply_filters(df, parts[0][1])
+
+    keep = np.zeros(len(df), dtype=bool)
+    offset = 0
+    for rows, residual in parts:
+        if residual is None:
+            keep[offset:offset + rows] = True
+        else:
+            kept = apply_filters(df.iloc[offset:offset + rows], residual)
+            keep[kept.index.to_numpy()] = True
+        offset += rows
+    return df[keep].reset_index(drop=True)
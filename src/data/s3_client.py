@@ -1,6 +1,23 @@
+import threading
+
 import boto3
+from botocore.config import Config
 from src.data.config import settings
 
+_shared_session = None
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+
+def _client_config() -> Config:
+    """接続プール・タイムアウト・keep-alive の設定"""
+    return Config(
+        max_pool_connections=settings.s3_max_pool_connections,
+        connect_timeout=settings.s3_connect_timeout,
+        read_timeout=settings.s3_read_timeout,
+        tcp_keepalive=settings.s3_tcp_keepalive,
+    )
+
 
 def get_s3_client():
     """S3クライアントを取得"""
@@ -12,4 +29,40 @@ def get_s3_client():
         region_name=settings.s3_region,
         aws_access_key_id=settings.s3_access_key,
         aws_secret_access_key=settings.s3_secret_key,
+        config=_client_config(),
     )
+
+
+def get_shared_s3_client():
+    """プロセス共有のS3クライアントを取得
+
+    boto3 のクライアントはスレッドセーフなので、コールバックやスレッドプールから
+    同じインスタンスを使い回し、接続プール（TCP/TLS接続）を再利用する。
+    初回呼び出し時にのみ生成する。
+    """
+    global _shared_session, _shared_client
+    client = _shared_client
+    if client is not None:
+        return client
+    with _shared_client_lock:
+        if _shared_client is None:
+            # boto3 のデフォルトセッションはスレッドセーフではないため、
+            # 生成はロック内で専用セッションから行う
+            if _shared_session is None:
+                _shared_session = boto3.session.Session()
+            _shared_client = _shared_session.client(
+                "s3",
+                endpoint_url=settings.s3_endpoint or None,
+                region_name=settings.s3_region,
+                aws_access_key_id=settings.s3_access_key,
+                aws_secret_access_key=settings.s3_secret_key,
+                config=_client_config(),
+            )
+        return _shared_client
+
+
+def reset_shared_s3_client() -> None:
+    """共有S3クライアントを破棄する（設定変更時・テスト用）"""
+    global _shared_client
+    with _shared_client_lock:
+        _shared_client = None
@@ -0,0 +1,212 @@
+"""Seekable, read-only S3 object backed by ranged GET requests."""
+import io
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+import pyarrow.parquet as pq
+
+from src.data.object_cache import normalize_etag
+
+logger = logging.getLogger(__name__)
+
+# Bytes fetched from the end of an object on the first footer read. Most
+# footers fit; larger ones cost exactly one more request.
+FOOTER_READ_SIZE = 64 * 1024
+# Number of parsed footers kept per process
+FOOTER_CACHE_SIZE = 256
+
+PARQUET_MAGIC = b"PAR1"
+
+
+@dataclass(frozen=True)
+class ParquetFooter:
+    """Footer of one object version: raw tail bytes plus parsed metadata."""
+
+    tail: bytes
+    metadata: pq.FileMetaData
+
+
+class S3RangeFile(io.RawIOBase):
+    """File object whose reads are served by ``Range`` GET requests.
+
+    Only the bytes actually read are transferred, so pyarrow can read a
+    Parquet footer and then just the column chunks of the row groups it
+    needs. With ``pre_buffer=True`` pyarrow coalesces nearby chunk ranges
+    before reading, turning them into a few larger requests.
+
+    Reads that fall inside the preloaded *tail* (the footer) are served from
+    memory. When *etag* is given, every request carries ``IfMatch`` so a
+    concurrent overwrite fails loudly instead of mixing two object versions.
+    """
+
+    def __init__(
+        self,
+        client,
+        bucket: str,
+        key: str,
+        size: int,
+        etag: Optional[str] = None,
+        tail: bytes = b"",
+    ) -> None:
+        """
+        Args:
+            client: boto3 S3 client.
+            bucket: S3 bucket name.
+            key: S3 object key.
+            size: Object size in bytes (ContentLength).
+            etag: Optional ETag the object must still match.
+            tail: Optional cached trailing bytes of the object.
+        """
+        super().__init__()
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        self.size = size
+        self.etag = etag
+        self._tail = tail
+        self._pos = 0
+        self.requests = 0
+        self.bytes_fetched = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._pos + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError(f"Negative seek position: {position}")
+        self._pos = position
+        return position
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        if size is None or size < 0:
+            size = self.size - self._pos
+        end = min(self._pos + size, self.size)
+        if end <= self._pos:
+            return b""
+        data = self._read_range(self._pos, end)
+        self._pos += len(data)
+        return data
+
+    def readall(self) -> bytes:
+        return self.read(-1)
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def load_footer(self) -> bytes:
+        """Fetch the Parquet footer (one request, two for very large footers).
+
+        Returns:
+            The trailing bytes of the object, which later reads are served from.
+
+        Raises:
+            ValueError: If the object is not a Parquet file.
+        """
+        nbytes = min(FOOTER_READ_SIZE, self.size)
+        tail = self._read_range(self.size - nbytes, self.size)
+        if len(tail) < 8 or tail[-4:] != PARQUET_MAGIC:
+            raise ValueError(f"s3://{self.bucket}/{self.key} is not a Parquet file")
+
+        footer_size = int.from_bytes(tail[-8:-4], "little") + 8
+        if footer_size > len(tail):
+            if footer_size > self.size:
+                raise ValueError(f"s3://{self.bucket}/{self.key} has a corrupt footer")
+            head = self._read_range(self.size - footer_size, self.size - len(tail))
+            tail = head + tail
+
+        self._tail = tail
+        return tail
+
+    def _read_range(self, start: int, end: int) -> bytes:
+        """Return bytes [start, end) from the cached tail or a ranged GET."""
+        tail_start = self.size - len(self._tail)
+        if self._tail and start >= tail_start:
+            return self._tail[start - tail_start:end - tail_start]
+
+        kwargs = {
+            "Bucket": self.bucket,
+            "Key": self.key,
+            "Range": f"bytes={start}-{end - 1}",
+        }
+        if self.etag:
+            kwargs["IfMatch"] = self.etag
+        response = self.client.get_object(**kwargs)
+        data = response["Body"].read()
+        self.requests += 1
+        self.bytes_fetched += len(data)
+        return data
+
+
+_footers: "OrderedDict[tuple[str, str, str], ParquetFooter]" = OrderedDict()
+_footers_lock = threading.Lock()
+
+
+def open_parquet_range_file(
+    client,
+    bucket: str,
+    key: str,
+    size: int,
+    etag: str,
+) -> tuple[S3RangeFile, pq.FileMetaData]:
+    """Open an S3 Parquet object for ranged reads, reusing its cached footer.
+
+    Footers are cached per bucket/key/ETag, so repeated reads of an unchanged
+    object skip the footer request and metadata parsing entirely.
+
+    Args:
+        client: boto3 S3 client.
+        bucket: S3 bucket name.
+        key: S3 object key.
+        size: Object size in bytes.
+        etag: Current ETag of the object (from a HEAD request).
+
+    Returns:
+        (file object, parsed FileMetaData). Pass the metadata to
+        ``pq.ParquetFile(..., metadata=...)`` to avoid parsing it again.
+    """
+    cache_key = (bucket, key, normalize_etag(etag))
+    with _footers_lock:
+        footer = _footers.get(cache_key)
+        if footer is not None:
+            _footers.move_to_end(cache_key)
+
+    if footer is not None:
+        source = S3RangeFile(client, bucket, key, size, etag=etag, tail=footer.tail)
+        return source, footer.metadata
+
+    source = S3RangeFile(client, bucket, key, size, etag=etag)
+    tail = source.load_footer()
+    metadata = pq.ParquetFile(source).metadata
+    source.seek(0)
+
+    with _footers_lock:
+        _footers[cache_key] = ParquetFooter(tail=tail, metadata=metadata)
+        while len(_footers) > FOOTER_CACHE_SIZE:
+            _footers.popitem(last=False)
+    logger.debug("Cached Parquet footer for s3://%s/%s (%d bytes)", bucket, key, len(tail))
+    return source, metadata
+
+
+def clear_footer_cache() -> None:
+    """Drop all cached footers."""
+    with _footers_lock:
+        _footers.clear()
@@ -6,7 +6,8 @@ the ``@callback`` decorator as a side effect.
 """
 from dash import callback, html, Input, Output
 
-from src.data.parquet_reader import ParquetReader
+from src.core.callback_memo import memoize_callback
+from src.data.parquet_reader import ParquetReader, get_reader
 from src.data.data_source_registry import resolve_dataset_id
 from ._constants import (
     DASHBOARD_ID,
@@ -25,10 +26,69 @@ from ._constants import (
     FILTER_ID_AMP_AV,
     FILTER_ID_ORDER_TYPE,
 )
-from ._data_loader import load_and_filter_data, load_and_filter_data_2
+from ._data_loader import load_and_filter_data, load_and_filter_data_2, load_datasets
 from .charts import _ch00_reference_table, _ch01_change_issue_table
 
 
+@memoize_callback(dataset_params=("dataset_id_1", "dataset_id_2"))
+def _render_all_charts(
+    reader: ParquetReader,
+    dataset_id_1: str,
+    dataset_id_2: str,
+    num_percent_mode,
+    breakdown_tab,
+    selected_months,
+    prc_filter_value,
+    area_values,
+    category_values,
+    vendor_values,
+    amp_av_values,
+    order_type_values,
+) -> tuple:
+    """Build the KPI and both tables for one filter state (memoized)."""
+    df_1, df_2 = load_datasets(reader, dataset_id_1, dataset_id_2)
+
+    # Dataset 1: order_type NOT applied
+    filtered_df_1 = load_and_filter_data(
+        reader,
+        dataset_id_1,
+        selected_months=selected_months,
+        prc_filter_value=prc_filter_value,
+        area_values=area_values,
+        category_values=category_values,
+        vendor_values=vendor_values,
+        amp_av_values=amp_av_values,
+        order_type_values=None,           # dataset 1 does not use order_type
+        df=df_1,
+    )
+
+    # Dataset 2: amp_av NOT applicable
+    filtered_df_2 = load_and_filter_data_2(
+        reader,
+        dataset_id_2,
+        selected_months=selected_months,
+        prc_filter_value=prc_filter_value,
+        area_values=area_values,
+        category_values=category_values,
+        vendor_values=vendor_values,
+        order_type_values=order_type_values,  # dataset 2 uses order_type
+        df=df_2,
+    )
+
+    # Calculate total work orders (using work_order_id column from dataset 1)
+    from ._constants import COLUMN_MAP
+    work_order_col = COLUMN_MAP.get("work_order_id")
+    if work_order_col and work_order_col in filtered_df_1.columns:
+        total_work_orders = filtered_df_1[work_order_col].nunique()
+    else:
+        total_work_orders = len(filtered_df_1)
+
+    title_0, comp_0 = _ch00_reference_table.build(filtered_df_1, breakdown_tab, num_percent_mode)
+    title_1, comp_1 = _ch01_change_issue_table.build(filtered_df_2, breakdown_tab, num_percent_mode)
+
+    return (f"{total_work_orders:,}", title_0, comp_0, title_1, comp_1)
+
+
 @callback(
     [
         Output(KPI_ID_TOTAL_WORK_ORDERS, "children"),
@@ -62,53 +122,33 @@ def update_all_charts(
 ):
     """Update all charts based on filter inputs.
 
-    Creates a ParquetReader, calls load_and_filter_data for dataset 1
-    and load_and_filter_data_2 for dataset 2, and passes each result
-    to the corresponding chart builder.
+    Uses the shared ParquetReader, resolves both dataset IDs and renders through
+    _render_all_charts, which loads both datasets concurrently, filters
+    dataset 1 with load_and_filter_data and dataset 2 with
+    load_and_filter_data_2, and passes each result to the corresponding
+    chart builder. Rendered outputs are memoized per dataset version and
+    filter state (src.core.callback_memo); errors are not.
     """
-    reader = ParquetReader()
+    reader = get_reader()
 
     try:
-        # Dataset 1: order_type NOT applied
         dataset_id_1 = resolve_dataset_id(DASHBOARD_ID, CHART_ID_REFERENCE_TABLE)
-        filtered_df_1 = load_and_filter_data(
-            reader,
-            dataset_id_1,
-            selected_months=selected_months,
-            prc_filter_value=prc_filter_value,
-            area_values=area_values,
-            category_values=category_values,
-            vendor_values=vendor_values,
-            amp_av_values=amp_av_values,
-            order_type_values=None,           # dataset 1 does not use order_type
-        )
-
-        # Dataset 2: amp_av NOT applicable
         dataset_id_2 = resolve_dataset_id(DASHBOARD_ID, CHART_ID_CHANGE_ISSUE_TABLE)
-        filtered_df_2 = load_and_filter_data_2(
+        return _render_all_charts(
             reader,
+            dataset_id_1,
             dataset_id_2,
-            selected_months=selected_months,
-            prc_filter_value=prc_filter_value,
-            area_values=area_values,
-            category_values=category_values,
-            vendor_values=vendor_values,
-            order_type_values=order_type_values,  # dataset 2 uses order_type
+            num_percent_mode,
+            breakdown_tab,
+            selected_months,
+            prc_filter_value,
+            area_values,
+            category_values,
+            vendor_values,
+            amp_av_values,
+            order_type_values,
         )
 
-        # Calculate total work orders (using work_order_id column from dataset 1)
-        from ._constants import COLUMN_MAP
-        work_order_col = COLUMN_MAP.get("work_order_id")
-        if work_order_col and work_order_col in filtered_df_1.columns:
-            total_work_orders = filtered_df_1[work_order_col].nunique()
-        else:
-            total_work_orders = len(filtered_df_1)
-
-        title_0, comp_0 = _ch00_reference_table.build(filtered_df_1, breakdown_tab, num_percent_mode)
-        title_1, comp_1 = _ch01_change_issue_table.build(filtered_df_2, breakdown_tab, num_percent_mode)
-
-        return (f"{total_work_orders:,}", title_0, comp_0, title_1, comp_1)
-
     except Exception as e:
         msg = f"Error loading data: {str(e)}"
 
@@ -63,6 +63,11 @@ COLUMN_MAP_2: dict[str, str] = {
     "work_order_id": "work order: work order id",
 }
 
+# Columns read from each dataset. Passed as the column projection to
+# get_cached_dataset so wide DOMO exports only decode what the page uses.
+DATASET_COLUMNS: list[str] = list(COLUMN_MAP.values())
+DATASET_COLUMNS_2: list[str] = list(COLUMN_MAP_2.values())
+
 # Mapping from breakdown tab ID to the DataFrame column used for pivot grouping.
 # This is a subset of COLUMN_MAP -- only the columns that make sense as
 # breakdown dimensions in the pivot table.
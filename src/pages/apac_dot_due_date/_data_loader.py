@@ -8,8 +8,68 @@ import pandas as pd
 
 from src.data.parquet_reader import ParquetReader
 from src.core.cache import get_cached_dataset
+from src.core.callback_memo import memoize_callback
+from src.data.data_loader import DatasetLoad, load_many
+from src.data.data_source_registry import get_categorical_columns, resolve_dataset_id
 from src.data.filter_engine import FilterSet, CategoryFilter, apply_filters, extract_unique_values
-from ._constants import COLUMN_MAP, COLUMN_MAP_2
+from ._constants import (
+    CHART_ID_CHANGE_ISSUE_TABLE,
+    CHART_ID_REFERENCE_TABLE,
+    COLUMN_MAP,
+    COLUMN_MAP_2,
+    DASHBOARD_ID,
+    DATASET_COLUMNS,
+    DATASET_COLUMNS_2,
+)
+
+
+def _get_dataset(reader: ParquetReader, dataset_id: str, columns: list[str]) -> pd.DataFrame:
+    """Load a dataset through the cache with this dashboard's categorical columns."""
+    return get_cached_dataset(
+        reader,
+        dataset_id,
+        columns=columns,
+        categories=get_categorical_columns(DASHBOARD_ID, dataset_id),
+    )
+
+
+def load_datasets(
+    reader: ParquetReader,
+    dataset_id: str,
+    dataset_id_2: str,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Load the reference and change-issue datasets concurrently.
+
+    Returns:
+        (dataset 1 DataFrame, dataset 2 DataFrame), unfiltered.
+    """
+    frames = load_many(reader, [
+        DatasetLoad(
+            dataset_id,
+            columns=DATASET_COLUMNS,
+            categories=get_categorical_columns(DASHBOARD_ID, dataset_id),
+        ),
+        DatasetLoad(
+            dataset_id_2,
+            columns=DATASET_COLUMNS_2,
+            categories=get_categorical_columns(DASHBOARD_ID, dataset_id_2),
+        ),
+    ])
+    return frames[dataset_id], frames[dataset_id_2]
+
+
+def warmup(reader: ParquetReader) -> None:
+    """Preload both datasets (as the page reads them) and the filter options.
+
+    Called by src.core.warmup at startup.
+
+    Raises:
+        Exception: If a dataset cannot be loaded.
+    """
+    dataset_id = resolve_dataset_id(DASHBOARD_ID, CHART_ID_REFERENCE_TABLE)
+    dataset_id_2 = resolve_dataset_id(DASHBOARD_ID, CHART_ID_CHANGE_ISSUE_TABLE)
+    load_datasets(reader, dataset_id, dataset_id_2)
+    load_filter_options(reader, dataset_id, dataset_id_2)
 
 
 def load_filter_options(
@@ -27,49 +87,12 @@ def load_filter_options(
         - ``months`` is the sorted union of months from both datasets.
         - ``order_types`` is extracted from dataset 2 (COLUMN_MAP_2).
 
-    On any exception the function returns safe defaults (empty lists / zeros)
-    so that the layout can still render.
+    The options are computed once per cached version of the datasets (see
+    _filter_options). On any exception the function returns safe defaults
+    (empty lists / zeros) so that the layout can still render.
     """
     try:
-        df = get_cached_dataset(reader, dataset_id)
-
-        months = extract_unique_values(df, COLUMN_MAP["month"])
-        areas = extract_unique_values(df, COLUMN_MAP["area"])
-        workstreams = extract_unique_values(df, COLUMN_MAP["category"])
-        vendors = extract_unique_values(df, COLUMN_MAP["vendor"])
-        amp_vs_av = extract_unique_values(df, COLUMN_MAP["amp_av"])
-        order_types = extract_unique_values(df, COLUMN_MAP["order_type"])
-
-        # --- Merge with dataset 2 when provided ---
-        if dataset_id_2 is not None:
-            try:
-                df2 = get_cached_dataset(reader, dataset_id_2)
-                months_2 = extract_unique_values(df2, COLUMN_MAP_2["month"])
-                months = sorted(set(months + months_2))
-                order_types = extract_unique_values(df2, COLUMN_MAP_2["order_type"])
-            except Exception:
-                pass  # dataset 2 failure: keep dataset 1 options
-
-        total_count = len(df)
-        job_name_col = COLUMN_MAP["job_name"]
-        prc_count = (
-            len(df[df[job_name_col].str.contains("PRC", case=False, na=False)])
-            if job_name_col in df.columns
-            else 0
-        )
-        non_prc_count = total_count - prc_count
-
-        return {
-            "months": months,
-            "areas": areas,
-            "workstreams": workstreams,
-            "vendors": vendors,
-            "amp_vs_av": amp_vs_av,
-            "order_types": order_types,
-            "total_count": total_count,
-            "prc_count": prc_count,
-            "non_prc_count": non_prc_count,
-        }
+        return _filter_options(reader, dataset_id, dataset_id_2)
 
     except Exception:
         return {
@@ -85,6 +108,64 @@ def load_filter_options(
         }
 
 
+@memoize_callback(dataset_params=("dataset_id", "dataset_id_2"))
+def _filter_options(
+    reader: ParquetReader,
+    dataset_id: str,
+    dataset_id_2: Optional[str],
+) -> dict:
+    """Extract the filter options, memoized by dataset versions.
+
+    Both datasets are loaded concurrently (load_datasets). A dataset 2 that
+    fails to load keeps the dataset 1 options; such a result is not memoized,
+    as dataset 2 then has no cached version.
+    """
+    df2 = None
+    if dataset_id_2 is None:
+        df = _get_dataset(reader, dataset_id, DATASET_COLUMNS)
+    else:
+        try:
+            df, df2 = load_datasets(reader, dataset_id, dataset_id_2)
+        except Exception:
+            # dataset 2 failure: keep dataset 1 options (a cache hit if it
+            # loaded; re-raises if dataset 1 is the one that failed)
+            df = _get_dataset(reader, dataset_id, DATASET_COLUMNS)
+
+    months = extract_unique_values(df, COLUMN_MAP["month"])
+    areas = extract_unique_values(df, COLUMN_MAP["area"])
+    workstreams = extract_unique_values(df, COLUMN_MAP["category"])
+    vendors = extract_unique_values(df, COLUMN_MAP["vendor"])
+    amp_vs_av = extract_unique_values(df, COLUMN_MAP["amp_av"])
+    order_types = extract_unique_values(df, COLUMN_MAP["order_type"])
+
+    # --- Merge with dataset 2 when provided ---
+    if df2 is not None:
+        months_2 = extract_unique_values(df2, COLUMN_MAP_2["month"])
+        months = sorted(set(months + months_2))
+        order_types = extract_unique_values(df2, COLUMN_MAP_2["order_type"])
+
+    total_count = len(df)
+    job_name_col = COLUMN_MAP["job_name"]
+    prc_count = (
+        len(df[df[job_name_col].str.contains("PRC", case=False, na=False)])
+        if job_name_col in df.columns
+        else 0
+    )
+    non_prc_count = total_count - prc_count
+
+    return {
+        "months": months,
+        "areas": areas,
+        "workstreams": workstreams,
+        "vendors": vendors,
+        "amp_vs_av": amp_vs_av,
+        "order_types": order_types,
+        "total_count": total_count,
+        "prc_count": prc_count,
+        "non_prc_count": non_prc_count,
+    }
+
+
 def load_and_filter_data(
     reader: ParquetReader,
     dataset_id: str,
@@ -95,6 +176,7 @@ def load_and_filter_data(
     vendor_values,
     amp_av_values,
     order_type_values,
+    df: Optional[pd.DataFrame] = None,
 ) -> pd.DataFrame:
     """Load dataset and apply all filter criteria.
 
@@ -108,11 +190,14 @@ def load_and_filter_data(
         vendor_values: List of vendor values or None/[].
         amp_av_values: List of AMP/AV values or None/[].
         order_type_values: List of order-type values or None/[].
+        df: Optional already-loaded dataset (e.g. from load_datasets);
+            loaded through the cache when omitted.
 
     Returns:
         Filtered DataFrame.
     """
-    df = get_cached_dataset(reader, dataset_id)
+    if df is None:
+        df = _get_dataset(reader, dataset_id, DATASET_COLUMNS)
 
     # --- PRC filter (custom logic, applied before FilterSet) ---
     job_name_col = COLUMN_MAP["job_name"]
@@ -167,6 +252,7 @@ def load_and_filter_data_2(
     category_values,
     vendor_values,
     order_type_values,
+    df: Optional[pd.DataFrame] = None,
 ) -> pd.DataFrame:
     """Load change-issue dataset and apply all filter criteria.
 
@@ -182,11 +268,14 @@ def load_and_filter_data_2(
         category_values: List of category values or None/[].
         vendor_values: List of vendor values or None/[].
         order_type_values: List of order-type values or None/[].
+        df: Optional already-loaded change-issue dataset; loaded through
+            the cache when omitted.
 
     Returns:
         Filtered DataFrame.
     """
-    df = get_cached_dataset(reader, dataset_id)
+    if df is None:
+        df = _get_dataset(reader, dataset_id, DATASET_COLUMNS_2)
 
     # --- PRC filter (custom logic, applied before FilterSet) ---
     job_name_col = COLUMN_MAP_2["job_name"]
@@ -6,7 +6,7 @@ standalone, testable function.
 from dash import html
 import dash_bootstrap_components as dbc
 
-from src.data.parquet_reader import ParquetReader
+from src.data.parquet_reader import get_reader
 from src.data.data_source_registry import resolve_dataset_id
 from ._constants import (
     DASHBOARD_ID,
@@ -31,7 +31,7 @@ def build_layout() -> html.Div:
             - Chart 01: DDD Change + Issue Table section
     """
     # Load data to get available options for filters
-    reader = ParquetReader()
+    reader = get_reader()
     dataset_id = resolve_dataset_id(DASHBOARD_ID, CHART_ID_REFERENCE_TABLE)
     dataset_id_2 = resolve_dataset_id(DASHBOARD_ID, CHART_ID_CHANGE_ISSUE_TABLE)
     opts = load_filter_options(reader, dataset_id, dataset_id_2)
@@ -30,7 +30,7 @@ def build_pivot_table(
 
     pivot_data = (
         filtered_df
-        .groupby([breakdown_column, column_map["month"]])[work_order_col]
+        .groupby([breakdown_column, column_map["month"]], observed=True)[work_order_col]
         .nunique()
         .reset_index()
     )
@@ -33,3 +33,13 @@ COLUMN_MAP: dict[str, str] = {
     "user": "User",
     "kind": "Kind",
 }
+
+# Columns read from the dataset. Passed as the column projection to
+# get_cached_dataset so wide exports only decode what the page uses.
+DATASET_COLUMNS: list[str] = list(COLUMN_MAP.values())
+
+# Columns the filter options are built from (dropdowns and date picker
+# bounds). Read as their own projection, without the measure columns.
+FILTER_OPTION_COLUMNS: list[str] = [
+    COLUMN_MAP["date"], COLUMN_MAP["model"], COLUMN_MAP["user"], COLUMN_MAP["kind"],
+]
@@ -2,7 +2,7 @@
 from dash import html, dcc
 import dash_bootstrap_components as dbc
 
-from src.data.parquet_reader import ParquetReader
+from src.data.parquet_reader import get_reader
 from src.components.filters import create_date_range_filter, create_category_filter
 from ._constants import (
     CHART_ID_KPI_TOTAL_COST,
@@ -24,7 +24,7 @@ def build_layout():
         Dash layout component tree with filters, KPI cards, charts, and data table.
     """
     # Load data to get available options for filters
-    reader = ParquetReader()
+    reader = get_reader()
     dataset_id = resolve_dataset_id_for_dashboard()
     options = load_filter_options(reader, dataset_id)
 
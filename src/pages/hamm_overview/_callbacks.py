@@ -4,7 +4,8 @@ import pandas as pd
 from dash import callback, Input, Output, html, dash_table
 import plotly.graph_objects as go
 
-from src.data.parquet_reader import ParquetReader
+from src.core.callback_memo import memoize_callback
+from src.data.parquet_reader import ParquetReader, get_reader
 from src.components.cards import create_kpi_card
 from ._constants import (
     COLUMN_MAP,
@@ -122,7 +123,7 @@ def _build_task_table(df: pd.DataFrame) -> html.Div:
     created_col = COLUMN_MAP["created_at"]
     completed_col = COLUMN_MAP["completed_at"]
 
-    display_df = df.copy()
+    display_df = df.copy(deep=False)
     display_df["Job Created"] = display_df[created_col].dt.strftime("%Y-%m-%d %H:%M")
     display_df["Completed / Err"] = display_df[completed_col].dt.strftime("%Y-%m-%d %H:%M")
 
@@ -202,7 +203,7 @@ def _build_volume_summary(df: pd.DataFrame, cadence: str) -> pd.DataFrame:
     ]
 
     summary = (
-        df.groupby(group_cols)[COLUMN_MAP["id"]]
+        df.groupby(group_cols, observed=True)[COLUMN_MAP["id"]]
         .nunique()
         .reset_index(name="count")
     )
@@ -218,6 +219,7 @@ def _build_volume_summary(df: pd.DataFrame, cadence: str) -> pd.DataFrame:
         columns=COLUMN_MAP["content_type"],
         values="count",
         fill_value=0,
+        observed=True,
     ).reset_index()
 
     for label in (PRELIM_LABEL, ERV_LABEL):
@@ -252,6 +254,67 @@ def _build_volume_summary(df: pd.DataFrame, cadence: str) -> pd.DataFrame:
     return pivot
 
 
+@memoize_callback()
+def _render_dashboard(
+    reader: ParquetReader,
+    dataset_id: str,
+    region_values: list,
+    year_values: list,
+    month_values: list,
+    task_ids: list,
+    content_type_values: list,
+    original_language_values: list,
+    dialogue_values: list,
+    genre_values: list,
+    error_code_values: list,
+    error_type_values: list,
+    cadence: str,
+) -> tuple:
+    """Build the KPI cards, volume table/chart and task table (memoized)."""
+    df = load_and_filter_data(
+        reader,
+        dataset_id,
+        region_values,
+        year_values,
+        month_values,
+        task_ids,
+        content_type_values,
+        original_language_values,
+        dialogue_values,
+        genre_values,
+        error_code_values,
+        error_type_values,
+    )
+
+    total_tasks = df[COLUMN_MAP["id"]].nunique()
+    kpi_total_tasks = create_kpi_card("Total Tasks", f"{total_tasks:,}")
+
+    avg_seconds = df["_video_duration_seconds"].mean()
+    if pd.isna(avg_seconds):
+        avg_duration_str = "N/A"
+    else:
+        mins, secs = divmod(int(avg_seconds), 60)
+        hrs, mins = divmod(mins, 60)
+        avg_duration_str = f"{hrs:02d}:{mins:02d}:{secs:02d}"
+    kpi_avg_duration = create_kpi_card("Average Video Duration", avg_duration_str)
+
+    volume_summary = _build_volume_summary(df, cadence)
+    volume_chart_df = _strip_sort_column(volume_summary)
+    volume_table_df = _strip_sort_column(
+        volume_summary.sort_values(
+            by=[SORT_START_COL],
+            ascending=False,
+            kind="mergesort",
+        )
+    )
+
+    volume_table = _build_volume_table(volume_table_df)
+    volume_chart = _build_volume_chart(volume_chart_df)
+    task_table = _build_task_table(df)
+
+    return kpi_total_tasks, kpi_avg_duration, volume_table, volume_chart, task_table
+
+
 @callback(
     Output(CHART_ID_KPI_TOTAL_TASKS, "children"),
     Output(CHART_ID_KPI_AVG_VIDEO_DURATION, "children"),
@@ -283,7 +346,7 @@ def update_dashboard(
     error_type_values,
     cadence_value,
 ):
-    reader = ParquetReader()
+    reader = get_reader()
     dataset_id = resolve_dataset_id_for_dashboard()
 
     normalized = _normalize_filter_values(
@@ -299,64 +362,10 @@ def update_dashboard(
         error_type_values,
     )
 
-    (
-        region_values,
-        year_values,
-        month_values,
-        task_ids,
-        content_type_values,
-        original_language_values,
-        dialogue_values,
-        genre_values,
-        error_code_values,
-        error_type_values,
-    ) = normalized
-
     cadence = cadence_value or "weekly"
 
     try:
-        df = load_and_filter_data(
-            reader,
-            dataset_id,
-            region_values,
-            year_values,
-            month_values,
-            task_ids,
-            content_type_values,
-            original_language_values,
-            dialogue_values,
-            genre_values,
-            error_code_values,
-            error_type_values,
-        )
-
-        total_tasks = df[COLUMN_MAP["id"]].nunique()
-        kpi_total_tasks = create_kpi_card("Total Tasks", f"{total_tasks:,}")
-
-        avg_seconds = df["_video_duration_seconds"].mean()
-        if pd.isna(avg_seconds):
-            avg_duration_str = "N/A"
-        else:
-            mins, secs = divmod(int(avg_seconds), 60)
-            hrs, mins = divmod(mins, 60)
-            avg_duration_str = f"{hrs:02d}:{mins:02d}:{secs:02d}"
-        kpi_avg_duration = create_kpi_card("Average Video Duration", avg_duration_str)
-
-        volume_summary = _build_volume_summary(df, cadence)
-        volume_chart_df = _strip_sort_column(volume_summary)
-        volume_table_df = _strip_sort_column(
-            volume_summary.sort_values(
-                by=[SORT_START_COL],
-                ascending=False,
-                kind="mergesort",
-            )
-        )
-
-        volume_table = _build_volume_table(volume_table_df)
-        volume_chart = _build_volume_chart(volume_chart_df)
-        task_table = _build_task_table(df)
-
-        return kpi_total_tasks, kpi_avg_duration, volume_table, volume_chart, task_table
+        return _render_dashboard(reader, dataset_id, *normalized, cadence)
 
     except Exception as exc:
         error_msg = html.P(f"Error loading data: {exc}", className="text-danger")
@@ -1,4 +1,5 @@
 """Constants for the Hamm Overview dashboard."""
+from src.data import derived_columns
 
 DASHBOARD_ID: str = "hamm_overview"
 DATASET_ID: str = "hamm-dashboard"
@@ -26,14 +27,14 @@ FILTER_ID_ERROR_CODE: str = f"{ID_PREFIX}filter-error-code"
 FILTER_ID_ERROR_TYPE: str = f"{ID_PREFIX}filter-error-type"
 FILTER_ID_CADENCE: str = f"{ID_PREFIX}filter-cadence"
 
-# Derived column names
-DERIVED_YEAR: str = "_year"
-DERIVED_MONTH: str = "_month"
-DERIVED_FISCAL_YEAR: str = "_fiscal_year"
-DERIVED_FISCAL_QUARTER: str = "_fiscal_quarter"
-DERIVED_ISO_WEEK: str = "_iso_week"
-DERIVED_START_DATE: str = "_start_date"
-DERIVED_END_DATE: str = "_end_date"
+# Derived column names (materialized by the DOMO ETL, see src/data/derived_columns.py)
+DERIVED_YEAR: str = derived_columns.HAMM_YEAR
+DERIVED_MONTH: str = derived_columns.HAMM_MONTH
+DERIVED_FISCAL_YEAR: str = derived_columns.HAMM_FISCAL_YEAR
+DERIVED_FISCAL_QUARTER: str = derived_columns.HAMM_FISCAL_QUARTER
+DERIVED_ISO_WEEK: str = derived_columns.HAMM_ISO_WEEK
+DERIVED_START_DATE: str = derived_columns.HAMM_START_DATE
+DERIVED_END_DATE: str = derived_columns.HAMM_END_DATE
 
 # Mapping from logical keys to DataFrame column names
 COLUMN_MAP: dict[str, str] = {
@@ -52,3 +53,9 @@ COLUMN_MAP: dict[str, str] = {
     "video_duration": "video_duration",
     "audio_details": "audio location",
 }
+
+# Columns read from the dataset (column projection for the cached load).
+# Materialized derived columns are skipped by the reader when absent.
+DATASET_COLUMNS: list[str] = (
+    list(COLUMN_MAP.values()) + derived_columns.HAMM_MATERIALIZED_COLUMNS
+)
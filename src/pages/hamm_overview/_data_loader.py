@@ -1,13 +1,25 @@
 """Data loading and filtering logic for Hamm Overview dashboard."""
-from typing import Optional
 import pandas as pd
 
 from src.data.parquet_reader import ParquetReader
 from src.core.cache import get_cached_dataset
-from src.data.data_source_registry import resolve_dataset_id
+from src.core.callback_memo import memoize_callback
+from src.core.prepared_views import register_prepared_view
+from src.data.data_source_registry import get_categorical_columns, resolve_dataset_id
+from src.data.derived_columns import (
+    CADENCE_WEEKLY,
+    CADENCE_YEARLY,
+    CADENCES,
+    has_hamm_derived_columns,
+    hamm_cadence_column,
+    hamm_fiscal_labels,
+    hamm_period_labels,
+    prepare_hamm_base,
+)
 from src.data.filter_engine import FilterSet, CategoryFilter, apply_filters, extract_unique_values
 from ._constants import (
     COLUMN_MAP,
+    DATASET_COLUMNS,
     DASHBOARD_ID,
     CHART_ID_VOLUME_TABLE,
     CHART_ID_VOLUME_CHART,
@@ -22,12 +34,6 @@ from ._constants import (
 )
 
 
-CADENCE_WEEKLY = "weekly"
-CADENCE_MONTHLY = "monthly"
-CADENCE_QUARTERLY = "quarterly"
-CADENCE_YEARLY = "yearly"
-
-
 def resolve_dataset_id_for_dashboard() -> str:
     """Resolve the dataset ID for all Hamm Overview charts."""
     chart_ids = [
@@ -45,135 +51,84 @@ def resolve_dataset_id_for_dashboard() -> str:
 
 
 def _prepare_base_df(df: pd.DataFrame) -> pd.DataFrame:
-    created_col = COLUMN_MAP["created_at"]
-    completed_col = COLUMN_MAP["completed_at"]
-    id_col = COLUMN_MAP["id"]
-
-    df = df.copy()
-
-    df[id_col] = df[id_col].astype(str)
-    df[created_col] = pd.to_datetime(df[created_col], utc=True).dt.tz_convert(None)
-    df[completed_col] = pd.to_datetime(df[completed_col], utc=True).dt.tz_convert(None)
-
-    # Convert video_duration from "HH:MM:SS" string to seconds (float)
-    dur_col = COLUMN_MAP["video_duration"]
-    df["_video_duration_seconds"] = pd.to_timedelta(df[dur_col], errors="coerce").dt.total_seconds()
-
-    df[DERIVED_YEAR] = df[created_col].dt.strftime("%Y")
-    df[DERIVED_MONTH] = df[created_col].dt.strftime("%b")
+    """Return *df* with normalized timestamps/ids and the base derived columns.
 
-    return df
+    Datasets loaded by the DOMO ETL with ``derived_columns: hamm_overview``
+    already carry them and are returned as-is (no copy); older datasets are
+    prepared here. Registered as this page's prepared view, so the cache runs
+    it once per dataset version.
+    """
+    if has_hamm_derived_columns(df):
+        return df
+    return prepare_hamm_base(df)
 
 
-def _format_start_date_monthly(ts: Optional[pd.Timestamp]) -> str:
-    if ts is pd.NaT or pd.isna(ts):
-        return "Null"
-    return f"1-{ts.strftime('%b-%y')}"
+PREPARED_VIEW = register_prepared_view(DASHBOARD_ID, _prepare_base_df)
 
 
-def _format_start_date_quarterly(ts: Optional[pd.Timestamp]) -> str:
-    if ts is pd.NaT or pd.isna(ts):
-        return "Null"
-    month = ts.month
-    year = ts.strftime("%y")
-    if month in (1, 2, 3):
-        return f"1-Jan-{year}"
-    if month in (4, 5, 6):
-        return f"1-Apr-{year}"
-    if month in (7, 8, 9):
-        return f"1-Jul-{year}"
-    return f"1-Oct-{year}"
-
-
-def _format_end_date_quarterly(ts: Optional[pd.Timestamp]) -> str:
-    if ts is pd.NaT or pd.isna(ts):
-        return "Null"
-    month = ts.month
-    year = ts.strftime("%y")
-    if month in (1, 2, 3):
-        return f"31-Mar-{year}"
-    if month in (4, 5, 6):
-        return f"30-Jun-{year}"
-    if month in (7, 8, 9):
-        return f"30-Sep-{year}"
-    return f"31-Dec-{year}"
-
-
-def _format_start_date_yearly(ts: Optional[pd.Timestamp]) -> str:
-    if ts is pd.NaT or pd.isna(ts):
-        return "Null"
-    return f"1-Jan-{ts.strftime('%y')}"
-
-
-def _format_end_date_yearly(ts: Optional[pd.Timestamp]) -> str:
-    if ts is pd.NaT or pd.isna(ts):
-        return "Null"
-    return f"31-Dec-{ts.strftime('%y')}"
+def _get_dataset(reader: ParquetReader, dataset_id: str) -> pd.DataFrame:
+    """Load the prepared dataset (read-only view) through the cache."""
+    return get_cached_dataset(
+        reader,
+        dataset_id,
+        columns=DATASET_COLUMNS,
+        categories=get_categorical_columns(DASHBOARD_ID, dataset_id),
+        view=PREPARED_VIEW,
+    )
 
 
 def _add_cadence_columns(df: pd.DataFrame, cadence: str) -> pd.DataFrame:
-    created_col = COLUMN_MAP["created_at"]
-    df = df.copy()
-
-    shifted = df[created_col] + pd.DateOffset(months=3)
-    df[DERIVED_FISCAL_YEAR] = shifted.dt.strftime("%Y").fillna("Null")
-    df[DERIVED_FISCAL_QUARTER] = (
-        "Q" + shifted.dt.quarter.astype("Int64").astype(str)
-    ).where(~shifted.isna(), "Null")
-
-    if cadence == CADENCE_WEEKLY:
-        df[DERIVED_ISO_WEEK] = df[created_col].dt.strftime("%V").fillna("Null")
-
-        weekday = df[created_col].dt.weekday
-        start_offsets = weekday.map({0: -6, 1: 0, 2: -1, 3: -2, 4: -3, 5: -4, 6: -5})
-        end_offsets = weekday.map({0: 0, 1: 6, 2: 5, 3: 4, 4: 3, 5: 2, 6: 1})
-
-        start_dates = df[created_col] + pd.to_timedelta(start_offsets, unit="D")
-        end_dates = df[created_col] + pd.to_timedelta(end_offsets, unit="D")
-
-        df[DERIVED_START_DATE] = start_dates.dt.strftime("%d-%b-%y").fillna("Null")
-        df[DERIVED_END_DATE] = end_dates.dt.strftime("%d-%b-%y").fillna("Null")
-
-    elif cadence == CADENCE_MONTHLY:
-        df[DERIVED_ISO_WEEK] = ""
-        df[DERIVED_START_DATE] = df[created_col].apply(_format_start_date_monthly)
-        df[DERIVED_END_DATE] = df[created_col].dt.to_period("M").dt.end_time.dt.strftime(
-            "%d-%b-%y"
-        ).fillna("Null")
-
-    elif cadence == CADENCE_QUARTERLY:
-        df[DERIVED_ISO_WEEK] = ""
-        df[DERIVED_START_DATE] = df[created_col].apply(_format_start_date_quarterly)
-        df[DERIVED_END_DATE] = df[created_col].apply(_format_end_date_quarterly)
-
-    else:
-        df[DERIVED_ISO_WEEK] = ""
-        df[DERIVED_START_DATE] = df[created_col].apply(_format_start_date_yearly)
-        df[DERIVED_END_DATE] = df[created_col].apply(_format_end_date_yearly)
-
-    return df
+    """Add fiscal year/quarter and the ISO week/start/end labels of *cadence*.
+
+    Unknown cadences are treated as yearly.
+    """
+    if cadence not in CADENCES:
+        cadence = CADENCE_YEARLY
+
+    if has_hamm_derived_columns(df):
+        # Select the materialized labels of this cadence
+        return df.assign(**{
+            DERIVED_ISO_WEEK: (
+                df[hamm_cadence_column(DERIVED_ISO_WEEK, cadence)]
+                if cadence == CADENCE_WEEKLY else ""
+            ),
+            DERIVED_START_DATE: df[hamm_cadence_column(DERIVED_START_DATE, cadence)],
+            DERIVED_END_DATE: df[hamm_cadence_column(DERIVED_END_DATE, cadence)],
+        })
+
+    created = df[COLUMN_MAP["created_at"]]
+    fiscal_year, fiscal_quarter = hamm_fiscal_labels(created)
+    iso_week, start_date, end_date = hamm_period_labels(created, cadence)
+    return df.assign(**{
+        DERIVED_FISCAL_YEAR: fiscal_year,
+        DERIVED_FISCAL_QUARTER: fiscal_quarter,
+        DERIVED_ISO_WEEK: iso_week,
+        DERIVED_START_DATE: start_date,
+        DERIVED_END_DATE: end_date,
+    })
+
+
+def warmup(reader: ParquetReader) -> None:
+    """Preload the dataset (as the page reads it) and the filter options.
+
+    Called by src.core.warmup at startup.
+
+    Raises:
+        Exception: If the dataset cannot be loaded.
+    """
+    dataset_id = resolve_dataset_id_for_dashboard()
+    _get_dataset(reader, dataset_id)
+    load_filter_options(reader, dataset_id)
 
 
 def load_filter_options(reader: ParquetReader, dataset_id: str) -> dict:
-    """Load filter option values from cached dataset."""
-    try:
-        df = get_cached_dataset(reader, dataset_id)
-        df = _prepare_base_df(df)
-
-        options = {
-            "regions": extract_unique_values(df, COLUMN_MAP["region"]),
-            "years": extract_unique_values(df, DERIVED_YEAR),
-            "months": extract_unique_values(df, DERIVED_MONTH),
-            "task_ids": extract_unique_values(df, COLUMN_MAP["id"]),
-            "content_types": extract_unique_values(df, COLUMN_MAP["content_type"]),
-            "original_languages": extract_unique_values(df, COLUMN_MAP["original_language"]),
-            "dialogue_options": extract_unique_values(df, COLUMN_MAP["dialogue"]),
-            "genres": extract_unique_values(df, COLUMN_MAP["genre"]),
-            "error_codes": extract_unique_values(df, COLUMN_MAP["error_code"]),
-            "error_types": extract_unique_values(df, COLUMN_MAP["error_type"]),
-        }
+    """Load filter option values from cached dataset.
 
-        return options
+    The options are computed once per cached dataset version (see
+    _filter_options); on any exception safe defaults are returned.
+    """
+    try:
+        return _filter_options(reader, dataset_id)
 
     except Exception:
         return {
@@ -190,6 +145,24 @@ def load_filter_options(reader: ParquetReader, dataset_id: str) -> dict:
         }
 
 
+@memoize_callback()
+def _filter_options(reader: ParquetReader, dataset_id: str) -> dict:
+    """Extract the filter options, memoized by dataset version."""
+    df = _get_dataset(reader, dataset_id)
+    return {
+        "regions": extract_unique_values(df, COLUMN_MAP["region"]),
+        "years": extract_unique_values(df, DERIVED_YEAR),
+        "months": extract_unique_values(df, DERIVED_MONTH),
+        "task_ids": extract_unique_values(df, COLUMN_MAP["id"]),
+        "content_types": extract_unique_values(df, COLUMN_MAP["content_type"]),
+        "original_languages": extract_unique_values(df, COLUMN_MAP["original_language"]),
+        "dialogue_options": extract_unique_values(df, COLUMN_MAP["dialogue"]),
+        "genres": extract_unique_values(df, COLUMN_MAP["genre"]),
+        "error_codes": extract_unique_values(df, COLUMN_MAP["error_code"]),
+        "error_types": extract_unique_values(df, COLUMN_MAP["error_type"]),
+    }
+
+
 def load_and_filter_data(
     reader: ParquetReader,
     dataset_id: str,
@@ -205,8 +178,7 @@ def load_and_filter_data(
     error_types,
 ) -> pd.DataFrame:
     """Load dataset and apply all filter criteria."""
-    df = get_cached_dataset(reader, dataset_id)
-    df = _prepare_base_df(df)
+    df = _get_dataset(reader, dataset_id)
 
     filters = FilterSet()
 
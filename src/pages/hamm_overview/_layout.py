@@ -2,7 +2,7 @@
 from dash import html, dcc
 import dash_bootstrap_components as dbc
 
-from src.data.parquet_reader import ParquetReader
+from src.data.parquet_reader import get_reader
 from src.data.data_source_registry import resolve_dataset_id
 from src.components.filters import create_category_filter
 from ._constants import (
@@ -47,7 +47,7 @@ def _build_cadence_filter() -> dbc.Card:
 
 
 def build_layout() -> html.Div:
-    reader = ParquetReader()
+    reader = get_reader()
     dataset_id = resolve_dataset_id(DASHBOARD_ID, CHART_ID_VOLUME_TABLE)
     opts = load_filter_options(reader, dataset_id)
 
@@ -23,6 +23,19 @@ def setup_test_env(monkeypatch):
     monkeypatch.setenv("S3_SECRET_KEY", "test")
 
 
+@pytest.fixture(autouse=True)
+def reset_shared_s3_client():
+    """Give every test a fresh shared S3 client and reader (created inside its mock)."""
+    from src.data.parquet_reader import reset_reader
+    from src.data.s3_client import reset_shared_s3_client as reset
+
+    reset()
+    reset_reader()
+    yield
+    reset()
+    reset_reader()
+
+
 @pytest.fixture
 def mock_s3():
     """Mock S3 using moto and provide a bucket-ready client."""
@@ -81,3 +81,135 @@ def test_base_etl_run(mock_s3):
     s3_key = f"datasets/{dataset_id}/data/part-0000.parquet"
     response = mock_s3.head_object(Bucket="bi-datasets", Key=s3_key)
     assert response["ResponseMetadata"]["HTTPStatusCode"] == 200
+
+
+def test_base_etl_load_publishes_increasing_version(mock_s3, sample_df):
+    """Test: every load writes the dataset's version marker with the next number."""
+    from src.data.dataset_version import PublishedVersion, version_key
+
+    # Given: ETL instance
+    etl = ConcreteETL()
+    dataset_id = "test_dataset"
+
+    def _marker() -> PublishedVersion:
+        body = mock_s3.get_object(Bucket="bi-datasets", Key=version_key(dataset_id))["Body"]
+        return PublishedVersion.from_json(body.read().decode("utf-8"))
+
+    # When: Loading the dataset twice
+    etl.load(sample_df, dataset_id)
+    first = _marker()
+    etl.load(sample_df.head(1), dataset_id)
+    second = _marker()
+
+    # Then: The version increases and points at the current manifest
+    manifest = mock_s3.head_object(Bucket="bi-datasets", Key=f"datasets/{dataset_id}/_manifest.json")
+    assert (first.version, second.version) == (1, 2)
+    assert second.manifest_etag == manifest["ETag"].strip('"')
+    assert second.dataset_id == dataset_id
+
+
+def test_read_published_version_raises_on_errors_other_than_missing():
+    """Test: only a missing marker means "unpublished"; other S3 errors propagate."""
+    from unittest.mock import MagicMock
+
+    from botocore.exceptions import ClientError
+
+    # Given: Clients failing with NoSuchKey and with AccessDenied
+    etl = ConcreteETL()
+    missing = MagicMock()
+    missing.get_object.side_effect = ClientError(
+        {"Error": {"Code": "NoSuchKey", "Message": "missing"}}, "GetObject"
+    )
+    denied = MagicMock()
+    denied.get_object.side_effect = ClientError(
+        {"Error": {"Code": "AccessDenied", "Message": "denied"}}, "GetObject"
+    )
+
+    # When/Then: Missing is None (first version), AccessDenied is raised
+    assert etl._read_published_version(missing, "bi-datasets", "ds") is None
+    with pytest.raises(ClientError):
+        etl._read_published_version(denied, "bi-datasets", "ds")
+
+
+def test_read_previous_manifest_raises_on_errors_other_than_missing():
+    """Test: only a missing manifest means "first load"; other S3 errors propagate."""
+    from unittest.mock import MagicMock
+
+    from botocore.exceptions import ClientError
+
+    # Given: Clients failing with NoSuchKey and with throttling
+    etl = ConcreteETL()
+    missing = MagicMock()
+    missing.get_object.side_effect = ClientError(
+        {"Error": {"Code": "NoSuchKey", "Message": "missing"}}, "GetObject"
+    )
+    throttled = MagicMock()
+    throttled.get_object.side_effect = ClientError(
+        {"Error": {"Code": "SlowDown", "Message": "slow down"}}, "GetObject"
+    )
+
+    # When/Then: Missing is None, throttling is raised instead of dropping entries
+    assert etl._read_previous_manifest(missing, "bi-datasets", "ds") is None
+    with pytest.raises(ClientError):
+        etl._read_previous_manifest(throttled, "bi-datasets", "ds")
+
+def _partition_keys(client, dataset_id: str, date_str: str) -> list[str]:
+    response = client.list_objects_v2(
+        Bucket="bi-datasets", Prefix=f"datasets/{dataset_id}/partitions/date={date_str}/"
+    )
+    return sorted(obj["Key"].rsplit("/", 1)[-1] for obj in response.get("Contents", []))
+
+
+def test_base_etl_load_splits_large_partition(mock_s3, monkeypatch):
+    """Test: partitions above the target size are written as several parts."""
+    from src.data.parquet_reader import ParquetReader
+
+    # Given: A small part target and one large day
+    monkeypatch.setattr("backend.etl.base_etl.settings.etl_part_target_bytes", 4096)
+    etl = ConcreteETL()
+    n = 5000
+    df = pd.DataFrame({
+        "date": pd.to_datetime(["2024-01-01"] * n + ["2024-01-02"]),
+        "value": list(range(n + 1)),
+    })
+    dataset_id = "test_dataset"
+
+    # When: Loading with partition column
+    etl.load(df, dataset_id, partition_column="date")
+
+    # Then: The large day is split, the small day is one file, and reads see every row
+    parts = _partition_keys(mock_s3, dataset_id, "2024-01-01")
+    assert len(parts) > 1
+    assert parts[0] == "part-0000.parquet"
+    assert _partition_keys(mock_s3, dataset_id, "2024-01-02") == ["part-0000.parquet"]
+    result = ParquetReader().read_dataset(dataset_id)
+    assert result["value"].tolist() == list(range(n + 1))
+
+
+def test_base_etl_load_removes_stale_parts(mock_s3, monkeypatch):
+    """Test: reloading a day with fewer parts deletes the extra old parts."""
+    from src.data.parquet_reader import ParquetReader
+
+    # Given: A day previously written as several parts
+    monkeypatch.setattr("backend.etl.base_etl.settings.etl_part_target_bytes", 4096)
+    etl = ConcreteETL()
+    dataset_id = "test_dataset"
+    etl.load(
+        pd.DataFrame({"date": pd.to_datetime(["2024-01-01"] * 5000), "value": range(5000)}),
+        dataset_id,
+        partition_column="date",
+    )
+
+    # When: The day is reloaded with little data
+    etl.load(
+        pd.DataFrame({"date": pd.to_datetime(["2024-01-01"]), "value": [42]}),
+        dataset_id,
+        partition_column="date",
+    )
+
+    # Then: Only one part remains, with and without the manifest
+    assert _partition_keys(mock_s3, dataset_id, "2024-01-01") == ["part-0000.parquet"]
+    reader = ParquetReader()
+    assert reader.read_dataset(dataset_id)["value"].tolist() == [42]
+    mock_s3.delete_object(Bucket="bi-datasets", Key=f"datasets/{dataset_id}/_manifest.json")
+    assert reader.read_dataset(dataset_id)["value"].tolist() == [42]
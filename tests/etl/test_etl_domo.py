@@ -0,0 +1,50 @@
+"""Tests for DomoApiETL transform options."""
+import pandas as pd
+import pytest
+
+from backend.etl.etl_domo import DomoApiETL
+
+
+@pytest.fixture
+def domo_credentials(monkeypatch):
+    monkeypatch.setenv("DOMO_CLIENT_ID", "client-id")
+    monkeypatch.setenv("DOMO_CLIENT_SECRET", "client-secret")
+
+
+def test_transform_materializes_derived_columns(domo_credentials):
+    """Test: derived_columns adds the configured column set."""
+    # Given: A DOMO ETL configured with the hamm_overview column set
+    etl = DomoApiETL(dataset_id="domo-id", derived_columns="hamm_overview")
+    df = pd.DataFrame({
+        "id": [1, 2],
+        "created_at": ["2026-01-05 10:00:00", "2026-02-10 12:00:00"],
+        "completed_at": ["2026-01-06 10:00:00", "2026-02-12 12:00:00"],
+        "video_duration": ["00:10:00", "00:20:00"],
+    })
+
+    # When: Transforming
+    result = etl.transform(df)
+
+    # Then: The derived columns are part of the output
+    assert result["_start_date_monthly"].astype(str).tolist() == ["1-Jan-26", "1-Feb-26"]
+    assert result["_video_duration_seconds"].tolist() == [600.0, 1200.0]
+
+
+def test_transform_without_derived_columns_keeps_columns(domo_credentials):
+    """Test: no derived columns are added unless configured."""
+    # Given: A DOMO ETL without derived_columns
+    etl = DomoApiETL(dataset_id="domo-id")
+    df = pd.DataFrame({"id": [1, 2], "name": ["a", "b"]})
+
+    # When: Transforming
+    result = etl.transform(df)
+
+    # Then: Only the source columns remain
+    assert list(result.columns) == ["id", "name"]
+
+
+def test_unknown_derived_columns_raises(domo_credentials):
+    """Test: an unknown derived column set is rejected at construction."""
+    # Given/When/Then: Constructing with an unknown set fails
+    with pytest.raises(ValueError, match="Unknown derived_columns"):
+        DomoApiETL(dataset_id="domo-id", derived_columns="no_such_set")
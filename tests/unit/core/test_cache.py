@@ -59,3 +59,687 @@ def test_cache_key_by_dataset_id(mock_s3, flask_app, sample_df):
 
         # Then: Different DataFrames are returned
         assert len(result1.columns) != len(result2.columns)
+
+
+def test_cache_key_includes_column_projection(mock_s3, flask_app, sample_df):
+    """Test: projected and full reads are cached under different keys."""
+    # Given: Dataset uploaded
+    dataset_id = "test_dataset"
+    s3_key = f"datasets/{dataset_id}/data/part-0000.parquet"
+    upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key, sample_df)
+
+    reader = ParquetReader()
+
+    with flask_app.app_context():
+        # When: Reading a projection first, then the full dataset
+        projected = get_cached_dataset(reader, dataset_id, columns=["id", "name"])
+        full = get_cached_dataset(reader, dataset_id)
+
+        # Then: The full read is not served from the projected entry
+        assert list(projected.columns) == ["id", "name"]
+        assert list(full.columns) == list(sample_df.columns)
+
+
+def test_build_cache_key():
+    """Test: cache key is dataset-only without projection, projection-aware with it."""
+    from src.core.cache import build_cache_key
+
+    assert build_cache_key("ds") == "dataset:ds"
+    assert build_cache_key("ds", ["a", "b"]) != build_cache_key("ds", ["a"])
+    assert build_cache_key("ds", ["a", "b"]) == build_cache_key("ds", ("a", "b"))
+    assert build_cache_key("ds", ["a"], categories=["a"]) != build_cache_key("ds", ["a"])
+    assert build_cache_key("ds", ["a"], categories=[]) == build_cache_key("ds", ["a"])
+
+
+def test_get_cached_dataset_loads_categories(mock_s3, flask_app, sample_df):
+    """Test: categorical columns are passed to the reader and cached separately."""
+    # Given: Dataset uploaded
+    dataset_id = "test_dataset"
+    s3_key = f"datasets/{dataset_id}/data/part-0000.parquet"
+    upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key, sample_df)
+
+    reader = ParquetReader()
+
+    with flask_app.app_context():
+        # When: Reading with and without categorical columns
+        categorical = get_cached_dataset(reader, dataset_id, categories=["name"])
+        plain = get_cached_dataset(reader, dataset_id)
+
+        # Then: Only the categorical read has a category column
+        assert isinstance(categorical["name"].dtype, pd.CategoricalDtype)
+        assert not isinstance(plain["name"].dtype, pd.CategoricalDtype)
+
+
+def _upload_partitions(client, dataset_id, dates, df):
+    for date in dates:
+        upload_parquet_to_s3(
+            client, "bi-datasets",
+            f"datasets/{dataset_id}/partitions/date={date}/part-0000.parquet",
+            df.assign(date=pd.Timestamp(date)),
+        )
+
+
+def test_date_range_loads_only_selected_partitions(mock_s3, flask_app, sample_df, monkeypatch):
+    """Test: overlapping date ranges reuse cached partitions."""
+    # Given: Three daily partitions
+    dataset_id = "test_dataset"
+    _upload_partitions(mock_s3, dataset_id, ["2024-01-01", "2024-01-02", "2024-01-03"], sample_df)
+    reader = ParquetReader()
+    requested = []
+    original = ParquetReader.read_partitions
+
+    def tracking_read_partitions(self, dataset_id, partitions, **kwargs):
+        requested.append(list(partitions))
+        return original(self, dataset_id, partitions, **kwargs)
+
+    monkeypatch.setattr(ParquetReader, "read_partitions", tracking_read_partitions)
+
+    with flask_app.app_context():
+        # When: Reading two overlapping windows
+        first = get_cached_dataset(reader, dataset_id, date_range=("2024-01-01", "2024-01-02"))
+        second = get_cached_dataset(reader, dataset_id, date_range=("2024-01-02", "2024-01-03"))
+
+    # Then: Each window has its partitions; the shared one was read once
+    assert sorted(first["date"].dt.strftime("%Y-%m-%d").unique()) == ["2024-01-01", "2024-01-02"]
+    assert sorted(second["date"].dt.strftime("%Y-%m-%d").unique()) == ["2024-01-02", "2024-01-03"]
+    assert list(second.index) == list(range(len(second)))
+    assert requested == [["2024-01-01", "2024-01-02"], ["2024-01-03"]]
+
+
+def test_date_range_reloads_only_changed_partition(mock_s3, flask_app, sample_df, monkeypatch):
+    """Test: after a dataset change, unchanged partitions stay cached."""
+    from src.core.cache import revalidate_dataset
+
+    # Given: Cached window over two partitions
+    dataset_id = "test_dataset"
+    _upload_partitions(mock_s3, dataset_id, ["2024-01-01", "2024-01-02"], sample_df)
+    reader = ParquetReader()
+    window = ("2024-01-01", "2024-01-02")
+
+    with flask_app.app_context():
+        get_cached_dataset(reader, dataset_id, date_range=window)
+
+        # When: One partition is rewritten and the partition index revalidated
+        _upload_partitions(mock_s3, dataset_id, ["2024-01-02"], sample_df.head(1))
+        assert revalidate_dataset(reader, dataset_id, f"partitions:{dataset_id}") is False
+        requested = []
+        original = ParquetReader.read_partitions
+
+        def tracking_read_partitions(self, dataset_id, partitions, **kwargs):
+            requested.append(list(partitions))
+            return original(self, dataset_id, partitions, **kwargs)
+
+        monkeypatch.setattr(ParquetReader, "read_partitions", tracking_read_partitions)
+        result = get_cached_dataset(reader, dataset_id, date_range=window)
+
+    # Then: Only the rewritten partition was read again
+    assert requested == [["2024-01-02"]]
+    assert len(result) == len(sample_df) + 1
+
+
+def test_date_range_keeps_categories_and_empty_window_schema(mock_s3, flask_app, sample_df):
+    """Test: concatenated partitions stay categorical; empty windows keep columns."""
+    # Given: Partitions with different category values
+    dataset_id = "test_dataset"
+    _upload_partitions(mock_s3, dataset_id, ["2024-01-01"], sample_df)
+    _upload_partitions(mock_s3, dataset_id, ["2024-01-02"], sample_df.assign(category="Z"))
+    reader = ParquetReader()
+
+    with flask_app.app_context():
+        # When: Reading a window and a window without partitions
+        result = get_cached_dataset(
+            reader, dataset_id, categories=["category"], date_range=("2024-01-01", "2024-01-02")
+        )
+        empty = get_cached_dataset(reader, dataset_id, date_range=("2025-01-01", "2025-01-31"))
+
+    # Then
+    assert isinstance(result["category"].dtype, pd.CategoricalDtype)
+    assert sorted(result["category"].cat.categories) == ["A", "B", "Z"]
+    assert len(empty) == 0
+    assert list(empty.columns) == list(sample_df.columns)
+
+
+def test_date_range_ignored_for_non_partitioned_dataset(mock_s3, flask_app, sample_df):
+    """Test: non-partitioned datasets are returned whole."""
+    # Given: Non-partitioned dataset
+    dataset_id = "test_dataset"
+    upload_parquet_to_s3(
+        mock_s3, "bi-datasets", f"datasets/{dataset_id}/data/part-0000.parquet", sample_df
+    )
+
+    with flask_app.app_context():
+        # When: Reading with a date range
+        result = get_cached_dataset(
+            ParquetReader(), dataset_id, date_range=("2024-01-01", "2024-01-01")
+        )
+
+    # Then: Every row is returned (the caller filters rows)
+    assert len(result) == len(sample_df)
+
+
+def test_init_cache_has_no_time_based_expiry():
+    """Test: entries are kept indefinitely (freshness comes from revalidation)."""
+    from src.core.cache import cache
+
+    app = Flask(__name__)
+    init_cache(app)
+    with app.app_context():
+        assert cache.cache.default_timeout == 0
+
+
+def test_init_cache_applies_byte_budget():
+    """Test: init_cache passes the byte budget to the backend."""
+    from src.core.cache import cache
+
+    app = Flask(__name__)
+    init_cache(app, max_bytes=1024)
+    with app.app_context():
+        assert cache.cache._max_bytes == 1024
+
+
+def test_revalidate_keeps_unchanged_entry(mock_s3, flask_app, sample_df):
+    """Test: revalidation leaves the entry in place when the version is unchanged."""
+    from src.core.cache import build_cache_key, cache, revalidate_dataset
+
+    # Given: Cached dataset
+    dataset_id = "test_dataset"
+    s3_key = f"datasets/{dataset_id}/data/part-0000.parquet"
+    upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key, sample_df)
+    reader = ParquetReader()
+
+    with flask_app.app_context():
+        get_cached_dataset(reader, dataset_id)
+        cache_key = build_cache_key(dataset_id)
+
+        # When: Revalidating without any change in S3
+        still_current = revalidate_dataset(reader, dataset_id, cache_key)
+
+        # Then: Entry is kept
+        assert still_current is True
+        assert cache.get(cache_key) is not None
+
+
+def test_revalidate_refreshes_changed_entry(mock_s3, flask_app, sample_df):
+    """Test: a rewritten dataset is re-read in place on revalidation."""
+    from src.core.cache import build_cache_key, cache, revalidate_dataset
+
+    # Given: Cached dataset
+    dataset_id = "test_dataset"
+    s3_key = f"datasets/{dataset_id}/data/part-0000.parquet"
+    upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key, sample_df)
+    reader = ParquetReader()
+
+    with flask_app.app_context():
+        get_cached_dataset(reader, dataset_id)
+        cache_key = build_cache_key(dataset_id)
+
+        # When: The ETL rewrites the data and the entry is revalidated
+        upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key, sample_df.head(1))
+        still_current = revalidate_dataset(reader, dataset_id, cache_key)
+
+        # Then: Entry now holds the new data, served without another read
+        assert still_current is False
+        assert len(cache.get(cache_key).df) == 1
+        assert len(get_cached_dataset(reader, dataset_id)) == 1
+
+
+def _wait_for_revalidation(timeout: float = 5.0) -> None:
+    import time
+
+    from src.core import cache as cache_module
+
+    deadline = time.monotonic() + timeout
+    while cache_module._revalidating and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not cache_module._revalidating
+
+
+def test_due_hit_serves_stale_entry_while_refreshing(mock_s3, flask_app, sample_df, monkeypatch):
+    """Test: a hit after a data change returns the old data and refreshes in the background."""
+    import threading
+
+    # Given: Cached dataset, every hit due for revalidation, data rewritten
+    dataset_id = "test_dataset"
+    s3_key = f"datasets/{dataset_id}/data/part-0000.parquet"
+    upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key, sample_df)
+    reader = ParquetReader()
+    monkeypatch.setattr("src.core.cache.settings.cache_revalidate_seconds", 0)
+
+    with flask_app.app_context():
+        get_cached_dataset(reader, dataset_id)
+        upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key, sample_df.head(1))
+        release = threading.Event()
+        original = reader.read_dataset
+
+        def blocked_read(*args, **kwargs):
+            release.wait(5)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(reader, "read_dataset", blocked_read)
+
+        # When: Hitting while the refresh is blocked
+        stale = get_cached_dataset(reader, dataset_id)
+        release.set()
+        _wait_for_revalidation()
+        monkeypatch.setattr("src.core.cache.settings.cache_revalidate_seconds", 300)
+        fresh = get_cached_dataset(reader, dataset_id)
+
+    # Then: Stale data served without waiting, new data after the refresh
+    assert len(stale) == len(sample_df)
+    assert len(fresh) == 1
+
+
+def test_entry_past_max_staleness_is_revalidated_before_serving(
+    mock_s3, flask_app, sample_df, monkeypatch
+):
+    """Test: an entry not confirmed current for too long is refreshed synchronously."""
+    import time
+
+    from src.core import cache as cache_module
+    from src.core.cache import build_cache_key
+
+    # Given: Cached dataset last verified long ago, data rewritten since
+    dataset_id = "test_dataset"
+    s3_key = f"datasets/{dataset_id}/data/part-0000.parquet"
+    upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key, sample_df)
+    reader = ParquetReader()
+    monkeypatch.setattr("src.core.cache.settings.cache_max_stale_seconds", 60)
+
+    with flask_app.app_context():
+        get_cached_dataset(reader, dataset_id)
+        upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key, sample_df.head(1))
+        monkeypatch.setitem(
+            cache_module._verified_at, build_cache_key(dataset_id), time.monotonic() - 120
+        )
+
+        # When
+        result = get_cached_dataset(reader, dataset_id)
+
+    # Then: New data is returned by this very call
+    assert len(result) == 1
+
+
+
+def test_failed_revalidation_past_max_staleness_serves_stale_entry(
+    mock_s3, flask_app, sample_df, monkeypatch
+):
+    """Test: a failing synchronous revalidation serves the stale entry and is not retried at once."""
+    import time
+
+    from src.core import cache as cache_module
+    from src.core.cache import build_cache_key
+
+    # Given: Cached dataset last verified long ago, version lookups failing
+    dataset_id = "test_dataset"
+    s3_key = f"datasets/{dataset_id}/data/part-0000.parquet"
+    upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key, sample_df)
+    reader = ParquetReader()
+    monkeypatch.setattr("src.core.cache.settings.cache_max_stale_seconds", 60)
+    monkeypatch.setattr("src.core.cache.settings.cache_revalidate_seconds", 300)
+    monkeypatch.setattr(cache_module, "_forced_failed_at", {})
+    calls = []
+
+    def failing_version(*args, **kwargs):
+        calls.append(args)
+        raise ConnectionError("S3 unavailable")
+
+    with flask_app.app_context():
+        get_cached_dataset(reader, dataset_id)
+        monkeypatch.setattr(reader, "get_dataset_version", failing_version)
+        monkeypatch.setitem(
+            cache_module._verified_at, build_cache_key(dataset_id), time.monotonic() - 120
+        )
+
+        # When: Two hits while S3 is down
+        first = get_cached_dataset(reader, dataset_id)
+        second = get_cached_dataset(reader, dataset_id)
+
+    # Then: Stale data served both times; only the first hit tried S3
+    pd.testing.assert_frame_equal(first, sample_df, check_dtype=False)
+    pd.testing.assert_frame_equal(second, sample_df, check_dtype=False)
+    assert len(calls) == 1
+
+def test_get_dataset_version_changes_with_partitions(mock_s3, sample_df):
+    """Test: partitioned dataset version changes when a partition is added."""
+    dataset_id = "test_dataset"
+    upload_parquet_to_s3(
+        mock_s3, "bi-datasets",
+        f"datasets/{dataset_id}/partitions/date=2024-01-01/part-0000.parquet", sample_df,
+    )
+    reader = ParquetReader()
+    before = reader.get_dataset_version(dataset_id)
+
+    upload_parquet_to_s3(
+        mock_s3, "bi-datasets",
+        f"datasets/{dataset_id}/partitions/date=2024-01-02/part-0000.parquet", sample_df,
+    )
+
+    assert before is not None
+    assert reader.get_dataset_version(dataset_id) != before
+    assert reader.get_dataset_version("missing") is None
+
+
+def test_cache_hit_is_not_unpickled_and_is_mutation_safe(mock_s3, flask_app, sample_df):
+    """Test: hits share the cached data, and caller changes do not leak into it."""
+    from src.core.cache import build_cache_key, cache
+
+    # Given: Cached dataset
+    dataset_id = "test_dataset"
+    s3_key = f"datasets/{dataset_id}/data/part-0000.parquet"
+    upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key, sample_df)
+    reader = ParquetReader()
+
+    with flask_app.app_context():
+        first = get_cached_dataset(reader, dataset_id)
+        stored = cache.get(build_cache_key(dataset_id)).df
+
+        # When: Caller modifies the returned frame, then reads again
+        first["extra"] = 1
+        first.loc[0, "id"] = -1
+        second = get_cached_dataset(reader, dataset_id)
+
+        # Then: Same stored object (no unpickling), unchanged contents
+        assert cache.get(build_cache_key(dataset_id)).df is stored
+        assert "extra" not in second.columns
+        assert second["id"].tolist() == sample_df["id"].tolist()
+
+
+def _concurrent_gets(flask_app, reader, dataset_id, callers=5, **kwargs):
+    """Call get_cached_dataset from several threads at once; return results or exceptions."""
+    import threading
+
+    results = [None] * callers
+    start = threading.Barrier(callers)
+
+    def _call(i):
+        with flask_app.app_context():
+            start.wait()
+            try:
+                results[i] = get_cached_dataset(reader, dataset_id, **kwargs)
+            except Exception as e:
+                results[i] = e
+
+    threads = [threading.Thread(target=_call, args=(i,)) for i in range(callers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+def test_concurrent_misses_share_one_load(mock_s3, flask_app, sample_df, monkeypatch):
+    """Test: concurrent misses on one key read the dataset once (single-flight)."""
+    import time
+
+    # Given: Slow dataset read
+    dataset_id = "test_dataset"
+    s3_key = f"datasets/{dataset_id}/data/part-0000.parquet"
+    upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key, sample_df)
+    reader = ParquetReader()
+    original = reader.read_dataset
+    calls = []
+
+    def slow_read(*args, **kwargs):
+        calls.append(args)
+        time.sleep(0.2)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(reader, "read_dataset", slow_read)
+
+    # When: Five callers miss at the same time
+    results = _concurrent_gets(flask_app, reader, dataset_id)
+
+    # Then: One read, every caller gets the data
+    assert len(calls) == 1
+    for result in results:
+        pd.testing.assert_frame_equal(result, sample_df, check_dtype=False)
+
+
+def test_concurrent_misses_share_the_error(mock_s3, flask_app, monkeypatch):
+    """Test: callers waiting on a failed load get the same exception."""
+    import time
+
+    # Given: Read that fails after a delay
+    reader = ParquetReader()
+    calls = []
+
+    def failing_read(*args, **kwargs):
+        calls.append(args)
+        time.sleep(0.2)
+        raise RuntimeError("S3 unavailable")
+
+    monkeypatch.setattr(reader, "read_dataset", failing_read)
+
+    # When
+    results = _concurrent_gets(flask_app, reader, "test_dataset")
+
+    # Then: One attempt, every caller sees the error; the next call retries
+    assert len(calls) == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+    with flask_app.app_context():
+        with pytest.raises(RuntimeError):
+            get_cached_dataset(reader, "test_dataset")
+    assert len(calls) == 2
+
+
+def test_load_does_not_wait_on_revalidation_of_same_key(
+    mock_s3, flask_app, sample_df, monkeypatch
+):
+    """Test: a miss during a revalidation of the same key loads its own DataFrame."""
+    import threading
+
+    from src.core.cache import build_cache_key, cache, refresh_dataset
+
+    # Given: Cached dataset rewritten in S3; the refresh's re-read is blocked
+    dataset_id = "test_dataset"
+    s3_key = f"datasets/{dataset_id}/data/part-0000.parquet"
+    upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key, sample_df)
+    reader = ParquetReader()
+    with flask_app.app_context():
+        get_cached_dataset(reader, dataset_id)
+    upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key, sample_df.head(1))
+
+    original = reader.read_dataset
+    blocked = threading.Event()
+    release = threading.Event()
+
+    def read(*args, **kwargs):
+        if not blocked.is_set():
+            blocked.set()
+            release.wait(5)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(reader, "read_dataset", read)
+    refreshed = []
+
+    def _refresh():
+        with flask_app.app_context():
+            refreshed.append(refresh_dataset(reader, dataset_id))
+
+    refresher = threading.Thread(target=_refresh)
+    refresher.start()
+    assert blocked.wait(5)
+
+    # When: The entry is evicted and a caller misses while the refresh runs
+    timer = threading.Timer(2, release.set)  # unblocks a load wrongly waiting on it
+    timer.start()
+    with flask_app.app_context():
+        cache.delete(build_cache_key(dataset_id))
+        result = get_cached_dataset(reader, dataset_id)
+        released_before_load_returned = release.is_set()
+    release.set()
+    timer.cancel()
+    refresher.join(5)
+
+    # Then: The load returned the new data without waiting for the refresh
+    assert isinstance(result, pd.DataFrame)
+    assert len(result) == 1
+    assert not released_before_load_returned
+    assert refreshed == [1]
+
+
+def test_concurrent_partition_misses_share_one_load(mock_s3, flask_app, sample_df, monkeypatch):
+    """Test: concurrent date-range misses read each partition once."""
+    import time
+
+    # Given: Partitioned dataset with a slow partition read
+    dataset_id = "test_partitioned"
+    for date in ["2024-01-01", "2024-01-02"]:
+        upload_parquet_to_s3(
+            mock_s3, "bi-datasets",
+            f"datasets/{dataset_id}/partitions/date={date}/part-0000.parquet", sample_df,
+        )
+    reader = ParquetReader()
+    original = reader.read_partitions
+    requested = []
+
+    def slow_read_partitions(dataset_id, partitions, **kwargs):
+        requested.extend(partitions)
+        time.sleep(0.2)
+        return original(dataset_id, partitions, **kwargs)
+
+    monkeypatch.setattr(reader, "read_partitions", slow_read_partitions)
+
+    # When
+    results = _concurrent_gets(
+        flask_app, reader, dataset_id, date_range=("2024-01-01", "2024-01-02")
+    )
+
+    # Then: Each partition read once, every caller gets both partitions
+    assert sorted(requested) == ["2024-01-01", "2024-01-02"]
+    assert all(len(r) == 2 * len(sample_df) for r in results)
+
+
+_prepare_calls: list[int] = []
+
+
+def _prepare_amount_cents(df: pd.DataFrame) -> pd.DataFrame:
+    """Prepared view used by the tests below; records each run."""
+    _prepare_calls.append(len(df))
+    return df.assign(amount_cents=df["amount"] * 100)
+
+
+def test_prepared_view_runs_once_per_version(mock_s3, flask_app, sample_df):
+    """Test: a view's prepare step runs on load only; hits get views of its result."""
+    from src.core.cache import build_cache_key, cache, revalidate_dataset
+    from src.core.prepared_views import register_prepared_view
+
+    # Given: Dataset uploaded and a registered view
+    view = register_prepared_view("test_amount_cents", _prepare_amount_cents)
+    dataset_id = "test_dataset"
+    s3_key = f"datasets/{dataset_id}/data/part-0000.parquet"
+    upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key, sample_df)
+    reader = ParquetReader()
+    _prepare_calls.clear()
+
+    with flask_app.app_context():
+        # When: Reading the view twice and modifying the first result
+        first = get_cached_dataset(reader, dataset_id, view=view)
+        first["amount_cents"] = 0
+        second = get_cached_dataset(reader, dataset_id, view=view)
+        raw = get_cached_dataset(reader, dataset_id)
+
+        # Then: Prepared once, cached result unchanged, raw read cached apart
+        assert _prepare_calls == [3]
+        assert second["amount_cents"].tolist() == [10000.0, 20000.0, 30000.0]
+        assert "amount_cents" not in raw.columns
+
+        # When: The dataset changes and the entry is refreshed
+        upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key, sample_df.head(1))
+        assert revalidate_dataset(reader, dataset_id, build_cache_key(dataset_id, view=view)) is False
+
+        # Then: The new version is prepared again
+        assert _prepare_calls == [3, 1]
+        assert get_cached_dataset(reader, dataset_id, view=view)["amount_cents"].tolist() == [10000.0]
+        assert cache.get(build_cache_key(dataset_id, view=view)).view == view
+
+
+def test_prepared_view_applies_per_partition(mock_s3, flask_app, sample_df):
+    """Test: partitioned reads prepare each partition once."""
+    from src.core.prepared_views import register_prepared_view
+
+    # Given: Two daily partitions and a registered view
+    view = register_prepared_view("test_amount_cents", _prepare_amount_cents)
+    dataset_id = "test_dataset"
+    _upload_partitions(mock_s3, dataset_id, ["2024-01-01", "2024-01-02"], sample_df)
+    reader = ParquetReader()
+    _prepare_calls.clear()
+
+    with flask_app.app_context():
+        # When: Reading overlapping windows of the view
+        get_cached_dataset(reader, dataset_id, date_range=("2024-01-01", "2024-01-01"), view=view)
+        result = get_cached_dataset(
+            reader, dataset_id, date_range=("2024-01-01", "2024-01-02"), view=view
+        )
+
+    # Then: Each partition was prepared once
+    assert _prepare_calls == [3, 3]
+    assert len(result) == 6
+    assert "amount_cents" in result.columns
+
+
+def test_unknown_prepared_view_raises(mock_s3, flask_app, sample_df):
+    """Test: reading an unregistered view fails."""
+    # Given: Dataset uploaded
+    dataset_id = "test_dataset"
+    s3_key = f"datasets/{dataset_id}/data/part-0000.parquet"
+    upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key, sample_df)
+
+    with flask_app.app_context():
+        # When/Then: The unknown view is rejected
+        with pytest.raises(ValueError, match="Unknown prepared view"):
+            get_cached_dataset(ParquetReader(), dataset_id, view="no_such_view")
+
+
+def test_get_cached_version(mock_s3, flask_app, sample_df):
+    """Test: the cached version is known only once the dataset is loaded."""
+    from src.core.cache import get_cached_version
+
+    # Given: Dataset uploaded
+    dataset_id = "versioned_dataset"
+    s3_key = f"datasets/{dataset_id}/data/part-0000.parquet"
+    upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key, sample_df)
+    reader = ParquetReader()
+
+    with flask_app.app_context():
+        # When/Then: Unknown before the first load, the read version after it
+        assert get_cached_version(reader, dataset_id) is None
+        get_cached_dataset(reader, dataset_id)
+        assert get_cached_version(reader, dataset_id) == reader.get_dataset_version(dataset_id)
+
+
+def test_refresh_dataset_refreshes_only_that_dataset(mock_s3, flask_app, sample_df, monkeypatch):
+    """Test: refresh_dataset re-reads every changed entry of one dataset and notifies listeners."""
+    import src.core.cache as cache_module
+    from src.core.cache import add_refresh_listener, refresh_dataset
+
+    # Given: Two cached datasets, one of them read in two shapes
+    monkeypatch.setattr(cache_module, "_refresh_listeners", [])
+    notified = []
+    add_refresh_listener(notified.append)
+    for dataset_id in ("refreshed_dataset", "other_dataset"):
+        upload_parquet_to_s3(
+            mock_s3, "bi-datasets", f"datasets/{dataset_id}/data/part-0000.parquet", sample_df
+        )
+    reader = ParquetReader()
+
+    with flask_app.app_context():
+        get_cached_dataset(reader, "refreshed_dataset")
+        get_cached_dataset(reader, "refreshed_dataset", columns=["id"])
+        get_cached_dataset(reader, "other_dataset")
+
+        # When: One dataset is republished and refreshed
+        upload_parquet_to_s3(
+            mock_s3, "bi-datasets", "datasets/refreshed_dataset/data/part-0000.parquet",
+            sample_df.head(1),
+        )
+        unchanged = refresh_dataset(reader, "other_dataset")
+        refreshed = refresh_dataset(reader, "refreshed_dataset")
+
+        # Then: Both entries of that dataset serve the new data at once
+        assert (unchanged, refreshed) == (0, 2)
+        assert len(get_cached_dataset(reader, "refreshed_dataset")) == 1
+        assert len(get_cached_dataset(reader, "refreshed_dataset", columns=["id"])) == 1
+        assert len(get_cached_dataset(reader, "other_dataset")) == len(sample_df)
+
+    assert notified == ["refreshed_dataset", "refreshed_dataset"]
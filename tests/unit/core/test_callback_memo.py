@@ -0,0 +1,172 @@
+"""Tests for page callback memoization (src/core/callback_memo.py)."""
+import pytest
+from flask import Flask
+
+from src.core.cache import build_cache_key, get_cached_dataset, init_cache, revalidate_dataset
+from src.core.callback_memo import (
+    invalidate_callback_memo,
+    memoize_callback,
+    normalize_callback_value,
+    reset_callback_memo,
+)
+from src.data.config import settings
+from src.data.parquet_reader import ParquetReader
+from tests.conftest import upload_parquet_to_s3
+
+DATASET_ID = "test_dataset"
+S3_KEY = f"datasets/{DATASET_ID}/data/part-0000.parquet"
+
+calls: list[tuple] = []
+
+
+@memoize_callback()
+def _render(reader, dataset_id, names, fail=False):
+    """Memoized test render: total amount of the selected names."""
+    calls.append((dataset_id, names))
+    if fail:
+        raise RuntimeError("render failed")
+    df = get_cached_dataset(reader, dataset_id)
+    if names:
+        df = df[df["name"].isin(names)]
+    return {"total": float(df["amount"].sum())}
+
+
+@memoize_callback(dataset_params=("dataset_id", "dataset_id_2"))
+def _render_pair(reader, dataset_id, dataset_id_2=None):
+    """Memoized test render over an optional second dataset."""
+    calls.append((dataset_id, dataset_id_2))
+    return {"rows": len(get_cached_dataset(reader, dataset_id))}
+
+
+@pytest.fixture
+def flask_app():
+    app = Flask(__name__)
+    init_cache(app)
+    return app
+
+
+@pytest.fixture(autouse=True)
+def clean_memo():
+    reset_callback_memo()
+    calls.clear()
+    yield
+    reset_callback_memo()
+
+
+def test_normalize_callback_value():
+    """Test: selections are compared regardless of order, duplicates and None vs []."""
+    assert normalize_callback_value(None) == normalize_callback_value([])
+    assert normalize_callback_value(["b", "a", "b"]) == ["a", "b"]
+    assert normalize_callback_value(("b", "a")) == normalize_callback_value(["a", "b"])
+    assert normalize_callback_value("weekly") == "weekly"
+
+
+def test_repeat_filter_state_is_served_from_memo(mock_s3, flask_app, sample_df):
+    """Test: the same normalized filter state is rendered once per dataset version."""
+    # Given: A dataset in S3
+    upload_parquet_to_s3(mock_s3, "bi-datasets", S3_KEY, sample_df)
+    reader = ParquetReader()
+
+    with flask_app.app_context():
+        # When: Rendering equivalent filter states
+        first = _render(reader, DATASET_ID, ["Bob", "Alice"])
+        second = _render(reader, DATASET_ID, ["Alice", "Bob", "Alice"])
+        unfiltered = _render(reader, DATASET_ID, None)
+        unfiltered_again = _render(reader, DATASET_ID, [])
+
+    # Then: Each state was computed once; hits are equal, fresh objects
+    assert calls == [(DATASET_ID, ["Bob", "Alice"]), (DATASET_ID, None)]
+    assert first == second == {"total": 300.0}
+    assert first is not second
+    assert unfiltered == unfiltered_again == {"total": 600.0}
+
+
+def test_dataset_version_change_invalidates_memo(mock_s3, flask_app, sample_df):
+    """Test: a refreshed dataset version is rendered again."""
+    # Given: A memoized render
+    upload_parquet_to_s3(mock_s3, "bi-datasets", S3_KEY, sample_df)
+    reader = ParquetReader()
+
+    with flask_app.app_context():
+        assert _render(reader, DATASET_ID, None) == {"total": 600.0}
+
+        # When: The data changes and the cache entry is refreshed
+        upload_parquet_to_s3(mock_s3, "bi-datasets", S3_KEY, sample_df.head(1))
+        assert revalidate_dataset(reader, DATASET_ID, build_cache_key(DATASET_ID)) is False
+        result = _render(reader, DATASET_ID, None)
+
+    # Then: The new version was rendered
+    assert result == {"total": 100.0}
+    assert len(calls) == 2
+
+
+def test_errors_are_not_memoized(mock_s3, flask_app, sample_df):
+    """Test: a failing render is retried on the next call."""
+    # Given: A cached dataset
+    upload_parquet_to_s3(mock_s3, "bi-datasets", S3_KEY, sample_df)
+    reader = ParquetReader()
+
+    with flask_app.app_context():
+        get_cached_dataset(reader, DATASET_ID)
+
+        # When/Then: Both calls run the function
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                _render(reader, DATASET_ID, None, fail=True)
+
+    assert len(calls) == 2
+
+
+def test_memo_can_be_disabled(mock_s3, flask_app, sample_df, monkeypatch):
+    """Test: CALLBACK_MEMO_ENABLED=false renders every time."""
+    # Given: Memoization disabled
+    monkeypatch.setattr(settings, "callback_memo_enabled", False)
+    upload_parquet_to_s3(mock_s3, "bi-datasets", S3_KEY, sample_df)
+    reader = ParquetReader()
+
+    with flask_app.app_context():
+        # When: Rendering the same state twice
+        _render(reader, DATASET_ID, ["Alice"])
+        _render(reader, DATASET_ID, ["Alice"])
+
+    # Then: Both calls were computed
+    assert len(calls) == 2
+
+
+def test_optional_dataset_param_may_be_none(mock_s3, flask_app, sample_df):
+    """Test: a None dataset ID is skipped when reading versions."""
+    # Given: A dataset in S3
+    upload_parquet_to_s3(mock_s3, "bi-datasets", S3_KEY, sample_df)
+    reader = ParquetReader()
+
+    with flask_app.app_context():
+        # When: Rendering without the optional dataset twice
+        first = _render_pair(reader, DATASET_ID)
+        second = _render_pair(reader, DATASET_ID, None)
+
+    # Then: The second call was served from the memo
+    assert first == second == {"rows": 3}
+    assert calls == [(DATASET_ID, None)]
+
+
+def test_refresh_drops_memoized_outputs_of_that_dataset(mock_s3, flask_app, sample_df):
+    """Test: refreshing a dataset frees its memoized outputs, not those of other datasets."""
+    # Given: Memoized outputs of two datasets
+    other_id = "other_dataset"
+    upload_parquet_to_s3(mock_s3, "bi-datasets", S3_KEY, sample_df)
+    upload_parquet_to_s3(
+        mock_s3, "bi-datasets", f"datasets/{other_id}/data/part-0000.parquet", sample_df
+    )
+    reader = ParquetReader()
+
+    with flask_app.app_context():
+        _render(reader, DATASET_ID, None)
+        _render_pair(reader, other_id)
+
+        # When: The first dataset is refreshed to a new version
+        upload_parquet_to_s3(mock_s3, "bi-datasets", S3_KEY, sample_df.head(1))
+        assert revalidate_dataset(reader, DATASET_ID, build_cache_key(DATASET_ID)) is False
+
+    # Then: Only its outputs were dropped by the refresh
+    assert invalidate_callback_memo(DATASET_ID) == 0
+    assert invalidate_callback_memo(other_id) == 1
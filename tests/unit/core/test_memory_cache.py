@@ -0,0 +1,155 @@
+"""Tests for the in-process (non-pickling) cache backend."""
+import logging
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from flask import Flask
+from flask_caching import Cache
+
+from src.core.cache import CachedDataset
+from src.core.memory_cache import InProcessCache, estimate_nbytes
+
+
+def test_get_returns_stored_object_without_pickling():
+    """Test: non-DataFrame values are returned as the stored object."""
+    # Given: Arrow table and a plain object in the cache
+    backend = InProcessCache(default_timeout=0)
+    table = pa.table({"a": [1, 2, 3]})
+    entry = {"nested": [1, 2]}
+    backend.set("table", table)
+    backend.set("entry", entry)
+
+    # When/Then: Same objects come back
+    assert backend.get("table") is table
+    assert backend.get("entry") is entry
+
+
+def test_get_protects_dataframe_from_caller_mutation():
+    """Test: changes to a returned DataFrame do not reach the cached one."""
+    # Given: DataFrame in the cache
+    backend = InProcessCache(default_timeout=0)
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    backend.set("df", df)
+
+    # When: Caller adds a column and writes values
+    hit = backend.get("df")
+    hit["b"] = hit["a"] * 2
+    hit.loc[0, "a"] = 100
+
+    # Then: Cached frame is unchanged
+    cached = backend.get("df")
+    assert list(cached.columns) == ["a"]
+    assert cached["a"].tolist() == [1, 2, 3]
+
+
+def test_timeout_and_threshold():
+    """Test: expired entries are misses and the threshold bounds the entry count."""
+    # Given: Backend holding at most two entries
+    backend = InProcessCache(threshold=2, default_timeout=0)
+    backend.set("expired", 1, timeout=-1)
+
+    # When: Adding more entries than the threshold
+    backend.set("a", 1)
+    backend.set("b", 2)
+    backend.set("c", 3)
+
+    # Then: Expired entry is gone, oldest entry evicted, newest kept
+    assert backend.get("expired") is None
+    assert not backend.has("a")
+    assert backend.get("c") == 3
+    assert backend.add("c", 4) is False
+    assert backend.delete("c") is True
+    assert backend.get("c") is None
+
+
+def test_factory_reads_flask_caching_config():
+    """Test: the backend is selectable by import path via CACHE_TYPE."""
+    # Given: Flask app configured with the backend
+    app = Flask(__name__)
+    cache = Cache(app, config={
+        "CACHE_TYPE": "src.core.memory_cache.InProcessCache",
+        "CACHE_DEFAULT_TIMEOUT": 0,
+        "CACHE_THRESHOLD": 10,
+        "CACHE_MAX_BYTES": 1024,
+    })
+
+    # When/Then
+    with app.app_context():
+        assert isinstance(cache.cache, InProcessCache)
+        assert cache.cache.default_timeout == 0
+        assert cache.cache._threshold == 10
+        assert cache.cache._max_bytes == 1024
+
+
+def _frame(rows: int) -> pd.DataFrame:
+    return pd.DataFrame({"x": np.arange(rows, dtype="int64")})
+
+
+def test_estimate_nbytes_measures_cache_entries():
+    """Test: entries are measured by the deep size of the DataFrame they hold."""
+    # Given: Frame with string contents
+    df = pd.DataFrame({"s": ["a" * 100] * 1000, "x": np.arange(1000)})
+
+    # When/Then: Entry size covers the string data, not just pointers
+    assert estimate_nbytes(CachedDataset(df=df, version="v1")) >= 100 * 1000
+    assert estimate_nbytes(pa.table({"x": np.arange(1000)})) == 8000
+
+
+def test_byte_budget_evicts_least_recently_used(caplog):
+    """Test: exceeding the budget evicts the least recently used entries and logs them."""
+    # Given: Budget for about two 8 KB frames
+    backend = InProcessCache(default_timeout=0, max_bytes=20_000)
+    backend.set("a", _frame(1000))
+    backend.set("b", _frame(1000))
+    backend.get("a")  # a is now more recently used than b
+
+    # When: Adding a third frame
+    with caplog.at_level(logging.INFO, logger="src.core.memory_cache"):
+        backend.set("c", _frame(1000))
+
+    # Then: b evicted, within budget, eviction logged
+    assert backend.has("a") and backend.has("c")
+    assert not backend.has("b")
+    assert backend.total_bytes <= 20_000
+    assert "Evicted b" in caplog.text
+
+
+def test_entry_larger_than_budget_is_cached_alone(caplog):
+    """Test: an oversized entry evicts every other entry, is cached and warned about."""
+    # Given: Small entries cached
+    backend = InProcessCache(default_timeout=0, max_bytes=20_000)
+    backend.set("small", _frame(100))
+    backend.set("other", _frame(100))
+
+    # When: Setting an entry above the whole budget
+    with caplog.at_level(logging.WARNING, logger="src.core.memory_cache"):
+        stored = backend.set("huge", _frame(10_000))
+
+    # Then: Only the oversized entry remains
+    assert stored is True
+    assert backend.has("huge")
+    assert not backend.has("small") and not backend.has("other")
+    assert backend.total_bytes == estimate_nbytes(_frame(10_000))
+    assert "Caching huge alone" in caplog.text
+
+    # When: A regular entry arrives afterwards
+    backend.set("small", _frame(100))
+
+    # Then: The oversized entry is the one evicted
+    assert backend.has("small")
+    assert not backend.has("huge")
+
+
+def test_total_bytes_tracks_replace_and_delete():
+    """Test: overwriting and deleting keys keep the size accounting exact."""
+    # Given
+    backend = InProcessCache(default_timeout=0, max_bytes=10 ** 6)
+    backend.set("a", _frame(1000))
+    size = backend.total_bytes
+
+    # When/Then
+    backend.set("a", _frame(1000))
+    assert backend.total_bytes == size
+    backend.delete("a")
+    assert backend.total_bytes == 0
@@ -0,0 +1,47 @@
+"""Tests for the prepared view registry."""
+import pandas as pd
+import pytest
+
+from src.core.prepared_views import prepare_view, register_prepared_view
+
+
+def _add_flag(df: pd.DataFrame) -> pd.DataFrame:
+    return df.assign(flag=True)
+
+
+def _drop_flag(df: pd.DataFrame) -> pd.DataFrame:
+    return df.drop(columns=["flag"], errors="ignore")
+
+
+def test_register_and_prepare():
+    """Test: a registered view runs its prepare step without touching the input."""
+    # Given: A registered view
+    name = register_prepared_view("test_flag_view", _add_flag)
+    df = pd.DataFrame({"a": [1, 2]})
+
+    # When: Preparing a frame
+    result = prepare_view(name, df)
+
+    # Then: The result has the new column, the input is unchanged
+    assert name == "test_flag_view"
+    assert result["flag"].tolist() == [True, True]
+    assert list(df.columns) == ["a"]
+
+
+def test_register_same_function_twice_is_allowed():
+    """Test: re-registering the same function (module reload) is a no-op."""
+    register_prepared_view("test_flag_view", _add_flag)
+    assert register_prepared_view("test_flag_view", _add_flag) == "test_flag_view"
+
+
+def test_register_conflicting_function_raises():
+    """Test: two different prepare steps cannot share a name."""
+    register_prepared_view("test_flag_view", _add_flag)
+    with pytest.raises(ValueError, match="already registered"):
+        register_prepared_view("test_flag_view", _drop_flag)
+
+
+def test_prepare_unknown_view_raises():
+    """Test: preparing with an unregistered name fails."""
+    with pytest.raises(ValueError, match="Unknown prepared view"):
+        prepare_view("no_such_view", pd.DataFrame())
@@ -0,0 +1,168 @@
+"""Tests for the cross-worker shared dataset store."""
+import numpy as np
+import pandas as pd
+import pytest
+from flask import Flask
+
+from src.core.cache import (
+    CachedDataset,
+    build_cache_key,
+    cache,
+    get_cached_dataset,
+    init_cache,
+)
+from src.core.memory_cache import estimate_nbytes
+from src.core.shared_cache import SharedDatasetStore
+from src.data.parquet_reader import ParquetReader
+from tests.conftest import upload_parquet_to_s3
+
+
+@pytest.fixture
+def flask_app():
+    """Flask app for cache testing."""
+    app = Flask(__name__)
+    init_cache(app)
+    return app
+
+
+@pytest.fixture
+def shared_dir(tmp_path, monkeypatch):
+    """Enable the shared store in a temporary directory."""
+    monkeypatch.setattr("src.core.cache.settings.cache_shared_dir", str(tmp_path))
+    return tmp_path
+
+
+def _fail_read(*args, **kwargs):
+    raise AssertionError("S3 should not be read")
+
+
+def test_store_round_trip_is_memory_mapped(tmp_path, sample_df):
+    """Test: a stored version loads back equal and backed by the mapped file."""
+    # Given: Store with categorical data
+    store = SharedDatasetStore(str(tmp_path))
+    df = sample_df.assign(category=sample_df["category"].astype("category"))
+
+    # When: Storing and loading
+    shared = store.store("dataset:x", "v1", df).df
+    loaded = store.load("dataset:x", "v1").df
+
+    # Then: Same data and dtypes; buffers are read-only (mapped, not copied)
+    pd.testing.assert_frame_equal(loaded, df, check_dtype=False)
+    assert isinstance(loaded["category"].dtype, pd.CategoricalDtype)
+    assert not loaded["id"].to_numpy().flags.writeable
+    pd.testing.assert_frame_equal(shared, loaded)
+    assert store.load("dataset:x", "v2") is None
+
+
+def test_store_round_trip_preserves_index(tmp_path, sample_df):
+    """Test: named, non-default and range indexes survive the shared file."""
+    # Given: Frames with a labelled index and an offset RangeIndex
+    store = SharedDatasetStore(str(tmp_path))
+    labelled = sample_df.set_index("category")
+    offset = sample_df.set_axis(pd.RangeIndex(10, 10 + len(sample_df)))
+
+    # When: Storing both
+    loaded_labelled = store.store("dataset:x", "v1", labelled).df
+    loaded_offset = store.store("dataset:y", "v1", offset).df
+
+    # Then: Index comes back unchanged
+    pd.testing.assert_frame_equal(loaded_labelled, labelled, check_dtype=False)
+    pd.testing.assert_index_equal(loaded_offset.index, offset.index)
+
+
+def test_mapped_columns_do_not_count_against_memory_budget(tmp_path):
+    """Test: estimate_nbytes leaves out column data living in the mapped file."""
+    # Given: Numeric frame stored in the shared directory
+    store = SharedDatasetStore(str(tmp_path))
+    df = pd.DataFrame({"x": np.arange(100_000), "y": np.arange(100_000) * 0.5})
+
+    # When: Caching the mapped copy and the in-process frame
+    shared = store.store("dataset:x", "v1", df)
+    mapped_entry = CachedDataset(df=shared.df, version="v1", mapped_nbytes=shared.mapped_nbytes)
+    local_entry = CachedDataset(df=df, version="v1")
+
+    # Then: Its numeric columns are mapped; the in-process copy counts in full
+    assert shared.mapped_nbytes == 1_600_000
+    assert estimate_nbytes(mapped_entry) < 10_000
+    assert estimate_nbytes(local_entry) >= 1_600_000
+
+
+def test_store_new_version_removes_old_file(tmp_path, sample_df):
+    """Test: writing a new version replaces the previous one of the same key."""
+    # Given: Version v1 stored, plus another key
+    store = SharedDatasetStore(str(tmp_path))
+    store.store("dataset:x", "v1", sample_df)
+    store.store("dataset:y", "v1", sample_df)
+
+    # When: Storing v2
+    store.store("dataset:x", "v2", sample_df)
+
+    # Then: Only v2 of x remains; y is untouched
+    assert store.load("dataset:x", "v1") is None
+    assert store.load("dataset:x", "v2") is not None
+    assert store.load("dataset:y", "v1") is not None
+
+
+def test_store_skips_frames_arrow_cannot_represent(tmp_path):
+    """Test: mixed-type object columns are returned as-is and not shared."""
+    # Given: Column mixing ints and strings
+    store = SharedDatasetStore(str(tmp_path))
+    df = pd.DataFrame({"mixed": pd.Series([1, "a"], dtype=object)})
+
+    # When
+    result = store.store("dataset:x", "v1", df)
+
+    # Then
+    assert result.df is df
+    assert result.mapped_nbytes == 0
+    assert store.load("dataset:x", "v1") is None
+
+
+def test_second_worker_maps_shared_file_instead_of_reading_s3(
+    mock_s3, flask_app, shared_dir, sample_df, monkeypatch
+):
+    """Test: a worker with an empty cache serves the dataset from the shared file."""
+    # Given: First worker loaded the dataset
+    dataset_id = "test_dataset"
+    upload_parquet_to_s3(
+        mock_s3, "bi-datasets", f"datasets/{dataset_id}/data/part-0000.parquet", sample_df
+    )
+    reader = ParquetReader()
+    with flask_app.app_context():
+        first = get_cached_dataset(reader, dataset_id)
+
+        # When: Another worker (empty process cache) reads with S3 reads disabled
+        cache.delete(build_cache_key(dataset_id))
+        monkeypatch.setattr(reader, "read_dataset", _fail_read)
+        second = get_cached_dataset(reader, dataset_id)
+
+        # Then: Same data, recorded as mapped; caller writes do not reach the shared copy
+        pd.testing.assert_frame_equal(first, second)
+        assert cache.get(build_cache_key(dataset_id)).mapped_nbytes > 0
+        second.loc[0, "amount"] = -1.0
+        assert get_cached_dataset(reader, dataset_id)["amount"].tolist() == [100.0, 200.0, 300.0]
+    assert len(list(shared_dir.glob("*.arrow"))) == 1
+
+
+def test_partitions_are_shared(mock_s3, flask_app, shared_dir, sample_df, monkeypatch):
+    """Test: partition entries are shared per partition version."""
+    # Given: Partitioned dataset loaded once
+    dataset_id = "test_partitioned"
+    for date in ["2024-01-01", "2024-01-02"]:
+        upload_parquet_to_s3(
+            mock_s3, "bi-datasets",
+            f"datasets/{dataset_id}/partitions/date={date}/part-0000.parquet", sample_df,
+        )
+    reader = ParquetReader()
+    date_range = ("2024-01-01", "2024-01-02")
+    with flask_app.app_context():
+        first = get_cached_dataset(reader, dataset_id, date_range=date_range)
+
+        # When: Another worker reads the same range
+        cache.clear()
+        monkeypatch.setattr(reader, "read_partitions", _fail_read)
+        second = get_cached_dataset(reader, dataset_id, date_range=date_range)
+
+    # Then: Served from the two shared partition files
+    pd.testing.assert_frame_equal(first, second)
+    assert len(list(shared_dir.glob("*.arrow"))) == 2
@@ -0,0 +1,171 @@
+"""Tests for polling of published dataset versions (src/core/version_watch.py)."""
+from unittest.mock import MagicMock
+
+import pytest
+from flask import Flask
+
+from src.core import version_watch
+from src.core.cache import get_cached_dataset, init_cache
+from src.data.config import settings
+from src.data.dataset_version import PublishedVersion, version_key
+from src.data.parquet_reader import ParquetReader
+from tests.conftest import upload_parquet_to_s3
+
+
+@pytest.fixture(autouse=True)
+def reset_seen():
+    version_watch.reset_version_watch()
+    yield
+    version_watch.reset_version_watch()
+
+
+@pytest.fixture
+def flask_app():
+    """Flask app with the cache initialized."""
+    app = Flask(__name__)
+    init_cache(app)
+    return app
+
+
+def _publish(client, dataset_id: str, df, version: int) -> None:
+    """Write a dataset and its version marker as an ETL load would."""
+    upload_parquet_to_s3(
+        client, "bi-datasets", f"datasets/{dataset_id}/data/part-0000.parquet", df
+    )
+    client.put_object(
+        Bucket="bi-datasets",
+        Key=version_key(dataset_id),
+        Body=PublishedVersion(dataset_id=dataset_id, version=version).to_json().encode("utf-8"),
+    )
+
+
+def test_republished_dataset_is_refreshed(mock_s3, flask_app, sample_df, monkeypatch):
+    """Test: a changed marker refreshes that dataset before its revalidation is due."""
+    # Given: Two published, cached datasets and no revalidation for an hour
+    monkeypatch.setattr(settings, "cache_revalidate_seconds", 3600)
+    _publish(mock_s3, "dataset-a", sample_df, 1)
+    _publish(mock_s3, "dataset-b", sample_df, 1)
+    reader = ParquetReader()
+    with flask_app.app_context():
+        get_cached_dataset(reader, "dataset-a")
+        get_cached_dataset(reader, "dataset-b")
+    assert version_watch.poll_published_versions(flask_app, reader) == ["dataset-a", "dataset-b"]
+
+    # When: One dataset is republished and the markers are polled
+    _publish(mock_s3, "dataset-a", sample_df.head(1), 2)
+    changed = version_watch.poll_published_versions(flask_app, reader)
+
+    # Then: Only that dataset was refreshed and serves the new data
+    assert changed == ["dataset-a"]
+    with flask_app.app_context():
+        assert len(get_cached_dataset(reader, "dataset-a")) == 1
+        assert len(get_cached_dataset(reader, "dataset-b")) == len(sample_df)
+
+
+def test_unchanged_markers_do_not_touch_the_cache(mock_s3, flask_app, sample_df, monkeypatch):
+    """Test: polling unchanged markers costs one listing and no version lookups."""
+    # Given: A published dataset whose marker was already seen
+    _publish(mock_s3, "dataset-a", sample_df, 1)
+    reader = ParquetReader()
+    with flask_app.app_context():
+        get_cached_dataset(reader, "dataset-a")
+    version_watch.poll_published_versions(flask_app, reader)
+    lookups = MagicMock(wraps=reader.get_dataset_version)
+    monkeypatch.setattr(reader, "get_dataset_version", lookups)
+
+    # When: Polling again
+    changed = version_watch.poll_published_versions(flask_app, reader)
+
+    # Then: Nothing was revalidated
+    assert changed == []
+    lookups.assert_not_called()
+
+
+def test_listing_failure_is_tolerated(flask_app):
+    """Test: a failed listing is logged and retried on the next poll."""
+    # Given: A reader whose listing fails
+    reader = MagicMock()
+    reader.get_published_versions.side_effect = RuntimeError("S3 unavailable")
+
+    # When/Then: The poll reports no changes
+    assert version_watch.poll_published_versions(flask_app, reader) == []
+
+
+def test_polling_can_be_disabled(flask_app, monkeypatch):
+    """Test: CACHE_VERSION_POLL_SECONDS=0 starts no thread."""
+    monkeypatch.setattr(settings, "cache_version_poll_seconds", 0)
+
+    assert version_watch.init_version_watch(flask_app, MagicMock()) is None
+
+
+def test_watch_thread_polls_until_stopped(flask_app, monkeypatch):
+    """Test: the background thread polls and exits when stopped."""
+    import threading
+
+    # Given: A reader that signals each listing
+    monkeypatch.setattr(settings, "cache_version_poll_seconds", 1)
+    polled = threading.Event()
+    reader = MagicMock()
+    reader.get_published_versions.side_effect = lambda: polled.set() or {}
+
+    # When: Starting and stopping the watch
+    thread = version_watch.init_version_watch(flask_app, reader)
+    assert polled.wait(timeout=5)
+    version_watch.stop_version_watch()
+    thread.join(timeout=5)
+
+    # Then: The thread has exited
+    assert not thread.is_alive()
+
+
+def test_refresh_failure_is_retried_on_next_poll(flask_app, monkeypatch):
+    """Test: a failing refresh is logged, does not stop the others and is retried."""
+    # Given: Two changed datasets; refreshing dataset-a fails once
+    reader = MagicMock()
+    reader.get_published_versions.return_value = {"dataset-a": "1", "dataset-b": "1"}
+    calls = []
+
+    def refresh(reader, dataset_id):
+        calls.append(dataset_id)
+        if calls == ["dataset-a"]:
+            raise ValueError("refresh failed")
+        return 0
+
+    monkeypatch.setattr(version_watch, "refresh_dataset", refresh)
+
+    # When: Polling twice
+    first = version_watch.poll_published_versions(flask_app, reader)
+    second = version_watch.poll_published_versions(flask_app, reader)
+
+    # Then: dataset-b refreshed right away, dataset-a retried on the next poll
+    assert first == ["dataset-a", "dataset-b"]
+    assert second == ["dataset-a"]
+    assert calls == ["dataset-a", "dataset-b", "dataset-a"]
+
+
+def test_watch_thread_survives_a_failing_poll(flask_app, monkeypatch):
+    """Test: an exception escaping one poll does not end the polling thread."""
+    import threading
+
+    # Given: A first poll that raises
+    monkeypatch.setattr(settings, "cache_version_poll_seconds", 0.01)
+    polls = []
+    polled_again = threading.Event()
+
+    def poll(server, reader):
+        polls.append(1)
+        if len(polls) == 1:
+            raise RuntimeError("unexpected")
+        polled_again.set()
+        return []
+
+    monkeypatch.setattr(version_watch, "poll_published_versions", poll)
+
+    # When: Starting the watch
+    thread = version_watch.init_version_watch(flask_app, MagicMock())
+    try:
+        # Then: It keeps polling after the failure
+        assert polled_again.wait(timeout=5)
+    finally:
+        version_watch.stop_version_watch()
+        thread.join(timeout=5)
@@ -0,0 +1,119 @@
+"""Tests for startup cache warmup and the readiness endpoint."""
+import threading
+
+import pytest
+from flask import Flask
+
+from src.core import warmup
+from src.core.cache import build_cache_key, cache, init_cache
+from src.data.parquet_reader import ParquetReader
+from tests.conftest import upload_parquet_to_s3
+
+
+@pytest.fixture(autouse=True)
+def reset_status():
+    warmup.reset_warmup_status()
+    yield
+    warmup.reset_warmup_status()
+
+
+@pytest.fixture
+def flask_app():
+    """Flask app with the cache initialized."""
+    app = Flask(__name__)
+    init_cache(app)
+    return app
+
+
+@pytest.fixture
+def pages_dir(tmp_path, monkeypatch):
+    """Registry pointed at a dashboard without a page package (generic warmup)."""
+    import src.data.data_source_registry as registry
+
+    pages = tmp_path / "pages"
+    (pages / "sample").mkdir(parents=True)
+    (pages / "sample" / registry.DASHBOARD_CONFIG_FILENAME).write_text(
+        "charts:\n  chart-a: dataset-a\n  chart-b: dataset-b\n"
+        "datasets:\n  dataset-a:\n    categorical_columns: [category]\n"
+    )
+    monkeypatch.setattr(registry, "DASHBOARD_PAGES_DIR", pages)
+    registry.load_dashboard_config.cache_clear()
+    yield pages
+    registry.load_dashboard_config.cache_clear()
+
+
+def test_warmup_preloads_datasets_and_reports_ready(mock_s3, flask_app, pages_dir, sample_df):
+    """Test: every configured dataset is cached and /readyz turns 200."""
+    # Given: Both datasets in S3
+    for dataset_id in ["dataset-a", "dataset-b"]:
+        upload_parquet_to_s3(
+            mock_s3, "bi-datasets", f"datasets/{dataset_id}/data/part-0000.parquet", sample_df
+        )
+
+    # When: Warmup runs to completion
+    warmup.init_warmup(flask_app, ParquetReader()).join(timeout=10)
+
+    # Then: Entries cached under the keys pages read, all datasets warm
+    with flask_app.app_context():
+        assert cache.get(build_cache_key("dataset-a", categories=["category"])) is not None
+        assert cache.get(build_cache_key("dataset-b")) is not None
+    response = flask_app.test_client().get(warmup.READINESS_PATH)
+    assert response.status_code == 200
+    assert response.get_json() == {
+        "ready": True,
+        "datasets": {"dataset-a": "warm", "dataset-b": "warm"},
+    }
+
+
+def test_readyz_is_503_while_warming(mock_s3, flask_app, pages_dir, sample_df, monkeypatch):
+    """Test: the endpoint holds traffic until the warmup has finished."""
+    # Given: Dataset reads blocked until released
+    release = threading.Event()
+    reader = ParquetReader()
+
+    def blocked_read(*args, **kwargs):
+        release.wait(5)
+        return sample_df
+
+    monkeypatch.setattr(reader, "read_dataset", blocked_read)
+
+    # When: Warmup is running
+    thread = warmup.init_warmup(flask_app, reader)
+    response = flask_app.test_client().get(warmup.READINESS_PATH)
+    release.set()
+    thread.join(timeout=10)
+
+    # Then: 503 with per-dataset status, ready afterwards
+    assert response.status_code == 503
+    assert set(response.get_json()["datasets"]) == {"dataset-a", "dataset-b"}
+    assert warmup.readiness()["ready"] is True
+
+
+def test_failed_dataset_does_not_block_readiness(mock_s3, flask_app, pages_dir):
+    """Test: a dataset that cannot be loaded is reported failed, and the app is ready."""
+    # Given: No data in S3
+
+    # When
+    warmup.init_warmup(flask_app, ParquetReader()).join(timeout=10)
+
+    # Then
+    report = warmup.readiness()
+    assert report["ready"] is True
+    assert report["datasets"] == {"dataset-a": "failed", "dataset-b": "failed"}
+
+
+def test_warmup_disabled_reports_ready(flask_app, monkeypatch):
+    """Test: with warmup disabled, nothing is loaded and /readyz is 200."""
+    monkeypatch.setattr("src.core.warmup.settings.cache_warmup_enabled", False)
+
+    assert warmup.init_warmup(flask_app) is None
+    assert flask_app.test_client().get(warmup.READINESS_PATH).status_code == 200
+
+
+@pytest.mark.parametrize("dashboard_id", ["apac_dot_due_date", "cursor_usage", "hamm_overview"])
+def test_dashboards_define_page_warmup_hooks(dashboard_id):
+    """Test: each dashboard warms its datasets the way its page reads them."""
+    import src.data.data_source_registry as registry
+
+    assert dashboard_id in registry.list_dashboard_ids()
+    assert callable(warmup._page_warmup_hook(dashboard_id))
@@ -34,3 +34,86 @@ def test_load_dataset_for_chart_missing_dataset_raises(mock_get_dataset_id):
 
     with pytest.raises(ValueError):
         load_dataset_for_chart(reader, "dashboard-x", "chart-missing")
+
+
+@patch("src.data.data_loader.get_cached_dataset")
+def test_load_many_passes_specs_and_keeps_order(mock_get_cached):
+    from src.data.data_loader import DatasetLoad, load_many
+
+    mock_get_cached.side_effect = lambda reader, dataset_id, **kwargs: pd.DataFrame(
+        {"id": [dataset_id]}
+    )
+    reader = MagicMock()
+
+    result = load_many(reader, [
+        "dataset-1",
+        DatasetLoad("dataset-2", columns=["id"], categories=["id"]),
+    ])
+
+    assert list(result) == ["dataset-1", "dataset-2"]
+    assert result["dataset-2"]["id"].tolist() == ["dataset-2"]
+    mock_get_cached.assert_any_call(reader, "dataset-1")
+    mock_get_cached.assert_any_call(reader, "dataset-2", columns=["id"], categories=["id"])
+
+
+@patch("src.data.data_loader.get_cached_dataset")
+def test_load_many_runs_loads_concurrently(mock_get_cached):
+    import threading
+
+    from src.data.data_loader import load_many
+
+    # Each load waits until the other has started: only passes when concurrent
+    barrier = threading.Barrier(2, timeout=5)
+
+    def _load(reader, dataset_id, **kwargs):
+        barrier.wait()
+        return pd.DataFrame({"id": [dataset_id]})
+
+    mock_get_cached.side_effect = _load
+
+    result = load_many(MagicMock(), ["dataset-1", "dataset-2"])
+
+    assert set(result) == {"dataset-1", "dataset-2"}
+
+
+@patch("src.data.data_loader.get_cached_dataset")
+def test_load_many_reraises_failure(mock_get_cached):
+    from src.data.data_loader import load_many
+
+    def _load(reader, dataset_id, **kwargs):
+        if dataset_id == "broken":
+            raise RuntimeError("boom")
+        return pd.DataFrame()
+
+    mock_get_cached.side_effect = _load
+
+    with pytest.raises(RuntimeError, match="boom"):
+        load_many(MagicMock(), ["ok", "broken"])
+
+
+def test_load_many_rejects_duplicate_ids():
+    from src.data.data_loader import load_many
+
+    with pytest.raises(ValueError):
+        load_many(MagicMock(), ["dataset-1", "dataset-1"])
+
+
+def test_load_many_uses_app_context_in_threads(mock_s3, sample_df):
+    from flask import Flask
+
+    from src.core.cache import init_cache
+    from src.data.data_loader import load_many
+    from src.data.parquet_reader import ParquetReader
+    from tests.conftest import upload_parquet_to_s3
+
+    for dataset_id in ("dataset-1", "dataset-2"):
+        upload_parquet_to_s3(
+            mock_s3, "bi-datasets", f"datasets/{dataset_id}/data/part-0000.parquet", sample_df
+        )
+    app = Flask(__name__)
+    init_cache(app)
+
+    with app.app_context():
+        result = load_many(ParquetReader(), ["dataset-1", "dataset-2"])
+
+    assert [len(df) for df in result.values()] == [3, 3]
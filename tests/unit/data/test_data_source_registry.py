@@ -88,6 +88,57 @@ def test_get_dataset_id_missing_chart_returns_none(tmp_path, monkeypatch):
 # ---- resolve_dataset_id tests ----
 
 
+def test_get_categorical_columns_reads_dataset_options(tmp_path, monkeypatch):
+    import src.data.data_source_registry as registry
+
+    pages_dir = tmp_path / "pages"
+    _write_yaml(
+        pages_dir / "sample" / registry.DASHBOARD_CONFIG_FILENAME,
+        "charts:\n  chart-a: dataset-a\n"
+        "datasets:\n  dataset-a:\n    categorical_columns: [region, \"error code\"]\n",
+    )
+
+    monkeypatch.setattr(registry, "DASHBOARD_PAGES_DIR", pages_dir)
+    registry.load_dashboard_config.cache_clear()
+
+    assert registry.get_categorical_columns("sample", "dataset-a") == ["region", "error code"]
+    assert registry.get_categorical_columns("sample", "dataset-b") is None
+
+
+def test_load_dashboard_config_invalid_categorical_columns_raises(tmp_path, monkeypatch):
+    import src.data.data_source_registry as registry
+
+    pages_dir = tmp_path / "pages"
+    _write_yaml(
+        pages_dir / "bad" / registry.DASHBOARD_CONFIG_FILENAME,
+        "datasets:\n  dataset-a:\n    categorical_columns: region\n",
+    )
+
+    monkeypatch.setattr(registry, "DASHBOARD_PAGES_DIR", pages_dir)
+    registry.load_dashboard_config.cache_clear()
+
+    with pytest.raises(ValueError):
+        registry.load_dashboard_config("bad")
+
+
+def test_list_dashboards_and_dataset_ids(tmp_path, monkeypatch):
+    import src.data.data_source_registry as registry
+
+    pages_dir = tmp_path / "pages"
+    _write_yaml(
+        pages_dir / "sample" / registry.DASHBOARD_CONFIG_FILENAME,
+        "charts:\n  chart-a: dataset-b\n  chart-b: dataset-b\n"
+        "datasets:\n  dataset-a:\n    categorical_columns: [region]\n",
+    )
+    (pages_dir / "no_config").mkdir()
+
+    monkeypatch.setattr(registry, "DASHBOARD_PAGES_DIR", pages_dir)
+    registry.load_dashboard_config.cache_clear()
+
+    assert registry.list_dashboard_ids() == ["sample"]
+    assert registry.get_dataset_ids("sample") == ["dataset-a", "dataset-b"]
+
+
 class TestResolveDatasetId:
     """Tests for resolve_dataset_id helper."""
 
@@ -61,3 +61,23 @@ def test_generate_summary_statistics(mock_s3, sample_df):
     for col in sample_df.columns:
         assert col in summary["statistics"]
         assert "null_count" in summary["statistics"][col]
+
+
+def test_generate_summary_streams_preview_rows(mock_s3, sample_df, monkeypatch):
+    """Test: generate_summary stops streaming once the preview is filled."""
+    # Given: Dataset larger than the preview limit
+    dataset_id = "test_dataset"
+    s3_key = f"datasets/{dataset_id}/data/part-0000.parquet"
+    upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key, sample_df)
+    monkeypatch.setattr("src.data.dataset_summarizer.GENERATE_SUMMARY_PREVIEW_ROWS", 2)
+
+    reader = ParquetReader()
+    summarizer = DatasetSummarizer(reader)
+
+    # When: Generating the summary
+    summary = summarizer.generate_summary(dataset_id)
+
+    # Then: Only the leading rows are summarized, with original dtypes
+    assert summary['row_count'] == 2
+    dtypes = {col['name']: col['dtype'] for col in summary['schema']}
+    assert dtypes['date'].startswith('datetime64')
@@ -0,0 +1,51 @@
+"""Tests for published dataset version markers (src/data/dataset_version.py)."""
+import pytest
+
+from src.data.dataset_version import (
+    PublishedVersion,
+    dataset_id_from_version_key,
+    version_key,
+)
+
+
+def test_version_key_round_trip():
+    """Test: marker keys map back to their dataset ID."""
+    key = version_key("cursor-usage")
+
+    assert key == "_dataset_versions/cursor-usage.json"
+    assert dataset_id_from_version_key(key) == "cursor-usage"
+
+
+@pytest.mark.parametrize("key", [
+    "datasets/cursor-usage/_manifest.json",
+    "_dataset_versions/cursor-usage.txt",
+    "_dataset_versions/nested/cursor-usage.json",
+    "_dataset_versions/.json",
+])
+def test_dataset_id_from_other_keys_is_none(key):
+    """Test: keys that are not markers are ignored."""
+    assert dataset_id_from_version_key(key) is None
+
+
+def test_published_version_json_round_trip():
+    """Test: a marker survives serialization."""
+    marker = PublishedVersion(
+        dataset_id="cursor-usage",
+        version=3,
+        published_at="2026-10-17T00:00:00+00:00",
+        manifest_etag="abc",
+    )
+
+    assert PublishedVersion.from_json(marker.to_json()) == marker
+
+
+@pytest.mark.parametrize("text", [
+    "not json",
+    '{"dataset_id": "a"}',
+    '{"dataset_id": "a", "version": 0}',
+    '{"dataset_id": "a", "version": "2"}',
+])
+def test_invalid_marker_raises_value_error(text):
+    """Test: malformed markers are rejected with ValueError."""
+    with pytest.raises(ValueError):
+        PublishedVersion.from_json(text)
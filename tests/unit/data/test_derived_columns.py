@@ -0,0 +1,104 @@
+"""Tests for ETL-time derived columns (src/data/derived_columns.py)."""
+import io
+
+import pandas as pd
+import pytest
+
+from src.data.derived_columns import (
+    CADENCES,
+    HAMM_MATERIALIZED_COLUMNS,
+    add_hamm_derived_columns,
+    apply_derived_columns,
+    has_hamm_derived_columns,
+    hamm_period_labels,
+)
+
+
+def _make_hamm_raw_df() -> pd.DataFrame:
+    return pd.DataFrame({
+        "id": [1, 2, 3],
+        "created_at": ["2026-01-05T10:00:00Z", "2025-12-30T23:00:00Z", None],
+        "completed_at": ["2026-01-06T10:00:00Z", None, None],
+        "video_duration": ["00:10:00", "01:00:30", "bad"],
+    })
+
+
+def test_add_hamm_derived_columns_adds_all_materialized_columns():
+    """Test: every materialized column is added, labels as category."""
+    # Given: Raw Hamm rows as loaded from DOMO
+    df = _make_hamm_raw_df()
+
+    # When: Materializing the derived columns
+    result = add_hamm_derived_columns(df)
+
+    # Then: All columns exist, labels are categorical, sources are normalized
+    assert has_hamm_derived_columns(result)
+    for column in HAMM_MATERIALIZED_COLUMNS:
+        if column != "_video_duration_seconds":
+            assert isinstance(result[column].dtype, pd.CategoricalDtype), column
+    assert result["id"].tolist() == ["1", "2", "3"]
+    assert result["created_at"].dt.tz is None
+    assert result["_video_duration_seconds"].iloc[1] == 3630.0
+
+
+def test_add_hamm_derived_columns_labels():
+    """Test: fiscal and per-cadence labels are computed per row."""
+    # Given: A Monday (2026-01-05) and a Tuesday (2025-12-30)
+    df = _make_hamm_raw_df()
+
+    # When: Materializing the derived columns
+    result = add_hamm_derived_columns(df)
+
+    # Then: Labels match the dashboard formats; missing dates become "Null"
+    row = result.iloc[0]
+    assert row["_fiscal_year"] == "2026"
+    assert row["_fiscal_quarter"] == "Q2"
+    assert row["_iso_week_weekly"] == "02"
+    assert row["_start_date_weekly"] == "30-Dec-25"
+    assert row["_end_date_weekly"] == "05-Jan-26"
+    assert row["_start_date_monthly"] == "1-Jan-26"
+    assert row["_end_date_monthly"] == "31-Jan-26"
+    assert row["_start_date_quarterly"] == "1-Jan-26"
+    assert row["_end_date_quarterly"] == "31-Mar-26"
+    assert row["_start_date_yearly"] == "1-Jan-26"
+    assert row["_end_date_yearly"] == "31-Dec-26"
+    assert result.iloc[1]["_start_date_weekly"] == "30-Dec-25"
+    assert result.iloc[1]["_end_date_weekly"] == "05-Jan-26"
+    assert result.iloc[2]["_fiscal_year"] == "Null"
+    assert result.iloc[2]["_start_date_monthly"] == "Null"
+
+
+def test_add_hamm_derived_columns_survives_parquet_round_trip():
+    """Test: materialized labels are read back from Parquet as category."""
+    # Given: A materialized frame written as Parquet
+    buf = io.BytesIO()
+    add_hamm_derived_columns(_make_hamm_raw_df()).to_parquet(buf)
+    buf.seek(0)
+
+    # When: Reading it back
+    result = pd.read_parquet(buf)
+
+    # Then: The columns are still present and categorical
+    assert has_hamm_derived_columns(result)
+    assert isinstance(result["_start_date_weekly"].dtype, pd.CategoricalDtype)
+
+
+@pytest.mark.parametrize("cadence", CADENCES)
+def test_hamm_period_labels_match_materialized_columns(cadence):
+    """Test: the page fallback and the ETL produce the same labels."""
+    # Given: Materialized and freshly computed labels
+    materialized = add_hamm_derived_columns(_make_hamm_raw_df())
+
+    # When: Computing the labels of one cadence on the fly
+    _, start, end = hamm_period_labels(materialized["created_at"], cadence)
+
+    # Then: They equal the stored columns
+    assert start.tolist() == materialized[f"_start_date_{cadence}"].astype(str).tolist()
+    assert end.tolist() == materialized[f"_end_date_{cadence}"].astype(str).tolist()
+
+
+def test_apply_derived_columns_unknown_set_raises():
+    """Test: an unknown set name raises ValueError."""
+    # Given/When/Then: Applying an unknown set fails
+    with pytest.raises(ValueError, match="Unknown derived column set"):
+        apply_derived_columns(_make_hamm_raw_df(), "no_such_set")
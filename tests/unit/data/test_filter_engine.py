@@ -162,6 +162,25 @@ def test_combined_filters(sample_df):
     assert result["date"].iloc[0].date().isoformat() == "2024-01-03"
 
 
+def test_apply_filters_does_not_modify_source(sample_df):
+    """Test: Writing to a filtered result leaves the source untouched."""
+    # Given: Results with and without applicable filters
+    before = sample_df.copy()
+    unfiltered = apply_filters(sample_df, FilterSet())
+    filtered = apply_filters(
+        sample_df,
+        FilterSet(category_filters=[CategoryFilter(column="category", values=["A"])]),
+    )
+
+    # When: Modifying the results
+    unfiltered.loc[0, "amount"] = -1.0
+    filtered["amount"] = 0.0
+
+    # Then: The source DataFrame is unchanged
+    assert unfiltered is not sample_df
+    pd.testing.assert_frame_equal(sample_df, before)
+
+
 def test_multiple_category_filters(sample_df):
     """Test: Multiple category filters on different columns."""
     # Given: Multiple category filters
@@ -308,3 +327,123 @@ class TestExtractUniqueValues:
 
         # Then: Empty list is returned
         assert result == []
+
+
+def test_to_arrow_filter_pushes_string_and_timestamp_filters(sample_df):
+    """Test: string category and timestamp date filters are fully pushable."""
+    import pyarrow as pa
+    from src.data.filter_engine import to_arrow_filter
+
+    # Given: Filters on a string column and a timestamp column
+    schema = pa.Schema.from_pandas(sample_df)
+    filter_set = FilterSet(
+        category_filters=[CategoryFilter(column="category", values=["A"], include_null=True)],
+        date_filters=[DateRangeFilter(column="date", start_date="2024-01-02", end_date="2024-01-04")],
+    )
+
+    # When: Translating to an Arrow expression
+    expression, residual = to_arrow_filter(filter_set, schema)
+
+    # Then: Everything is pushed and evaluates like apply_filters
+    assert expression is not None
+    assert residual.category_filters == [] and residual.date_filters == []
+    table = pa.Table.from_pandas(sample_df, preserve_index=False)
+    pushed = table.filter(expression).to_pandas()
+    expected = apply_filters(sample_df, filter_set).reset_index(drop=True)
+    pd.testing.assert_frame_equal(pushed, expected)
+
+
+def test_to_arrow_filter_keeps_unpushable_filters_as_residual(sample_df):
+    """Test: category filters on non-string columns stay in the residual set."""
+    import pyarrow as pa
+    from src.data.filter_engine import to_arrow_filter
+
+    # Given: A category filter on a numeric column and one on a missing column
+    schema = pa.Schema.from_pandas(sample_df)
+    numeric_filter = CategoryFilter(column="id", values=[1, 2])
+    filter_set = FilterSet(
+        category_filters=[numeric_filter, CategoryFilter(column="missing", values=["x"])],
+    )
+
+    # When: Translating
+    expression, residual = to_arrow_filter(filter_set, schema)
+
+    # Then: Nothing is pushed, numeric filter is residual, missing column is dropped
+    assert expression is None
+    assert residual.category_filters == [numeric_filter]
+
+
+def test_tz_aware_date_filter_matches_pushdown():
+    """Test: naive bounds on a tz-aware column select the same rows in memory and pushed down."""
+    import pyarrow as pa
+    from src.data.filter_engine import to_arrow_filter
+
+    # Given: A UTC timestamp column, with rows around the UTC day boundaries
+    df = pd.DataFrame({
+        "ts": pd.to_datetime([
+            "2024-01-01 23:59:59", "2024-01-02 00:00:00", "2024-01-02 23:59:59", "2024-01-03 00:00:00",
+        ], utc=True),
+        "value": [1, 2, 3, 4],
+    })
+    filter_set = FilterSet(
+        date_filters=[DateRangeFilter(column="ts", start_date="2024-01-02", end_date="2024-01-02")],
+    )
+
+    # When: Filtering in memory and through the Arrow expression
+    in_memory = apply_filters(df, filter_set).reset_index(drop=True)
+    expression, residual = to_arrow_filter(filter_set, pa.Schema.from_pandas(df))
+    pushed = pa.Table.from_pandas(df, preserve_index=False).filter(expression).to_pandas()
+
+    # Then: Both take the bounds as UTC and agree
+    assert in_memory["value"].tolist() == [2, 3]
+    assert residual.date_filters == []
+    pd.testing.assert_frame_equal(pushed, in_memory)
+
+
+@pytest.mark.parametrize("copy_on_write", [True, False])
+def test_unfiltered_result_never_aliases_source_when_written(sample_df, monkeypatch, copy_on_write):
+    """Test: writing to an unfiltered result leaves the source intact, with or without CoW."""
+    # Given: Copy-on-Write reported on or off
+    monkeypatch.setattr(
+        "src.data.filter_engine._copy_on_write_enabled", lambda: copy_on_write
+    )
+
+    # When: No filter applies and the result is modified in place
+    result = apply_filters(sample_df, FilterSet())
+    shares = np.shares_memory(result["id"].to_numpy(), sample_df["id"].to_numpy())
+    result.loc[0, "id"] = 99
+
+    # Then: Data is shared only under CoW; the source is unchanged
+    assert shares is copy_on_write
+    assert sample_df.loc[0, "id"] == 1
+
+
+def test_matching_row_groups_prunes_by_statistics():
+    """Test: row groups whose min/max cannot match pushed filters are skipped."""
+    import io
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from src.data.filter_engine import matching_row_groups
+
+    # Given: Two row groups, dates 01-01..01-02 / 01-03..01-04, categories a-b / c-d
+    df = pd.DataFrame({
+        "date": pd.date_range("2024-01-01", periods=4),
+        "category": ["a", "b", "c", "d"],
+        "value": [1, 2, 3, 4],
+    })
+    buf = io.BytesIO()
+    df.to_parquet(buf, row_group_size=2)
+    parquet_file = pq.ParquetFile(pa.BufferReader(buf.getvalue()))
+
+    def _groups(filter_set):
+        return matching_row_groups(filter_set, parquet_file.metadata, parquet_file.schema_arrow)
+
+    # When/Then: Category and date filters select the overlapping groups only
+    assert _groups(FilterSet(category_filters=[CategoryFilter(column="category", values=["c"])])) == [1]
+    assert _groups(FilterSet(date_filters=[
+        DateRangeFilter(column="date", start_date="2024-01-02", end_date="2024-01-03"),
+    ])) == [0, 1]
+    assert _groups(FilterSet(category_filters=[CategoryFilter(column="category", values=["z"])])) == []
+    # Not pushed down (non-string values): nothing is pruned
+    assert _groups(FilterSet(category_filters=[CategoryFilter(column="value", values=[9])])) == [0, 1]
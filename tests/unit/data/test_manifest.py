@@ -0,0 +1,211 @@
+"""Tests for dataset manifests and manifest-based read planning."""
+import json
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from backend.etl.base_etl import BaseETL
+from src.data.manifest import (
+    LAYOUT_PARTITIONED,
+    DatasetManifest,
+    ManifestFile,
+    compute_statistics,
+    manifest_key,
+    merge_statistics,
+)
+from src.data.parquet_reader import ParquetReader
+from tests.conftest import upload_parquet_to_s3
+
+
+class PassthroughETL(BaseETL):
+    """ETL that loads a given DataFrame unchanged."""
+
+    def extract(self) -> pd.DataFrame:
+        return pd.DataFrame()
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        return df
+
+
+@pytest.fixture
+def partitioned_df() -> pd.DataFrame:
+    return pd.DataFrame({
+        "date": pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-02", "2024-01-03"]),
+        "value": [1, 2, 3, 4],
+        "category": ["A", "B", None, "A"],
+    })
+
+
+def test_compute_and_merge_statistics():
+    """Test: per-file statistics merge into dataset-wide bounds and null counts."""
+    # Given: Two tables
+    first = pa.table({"x": [1, 5], "s": ["b", None]})
+    second = pa.table({"x": [-2, 3], "s": ["a", "c"]})
+
+    # When: Computing and merging
+    merged = merge_statistics([compute_statistics(first), compute_statistics(second)])
+
+    # Then: Bounds span both files
+    assert merged["x"] == {"null_count": 0, "min": -2, "max": 5}
+    assert merged["s"] == {"null_count": 1, "min": "a", "max": "c"}
+
+
+def test_manifest_json_round_trip():
+    """Test: to_json/from_json preserve files; unknown versions are rejected."""
+    # Given: Manifest with two partitions
+    manifest = DatasetManifest(
+        dataset_id="ds",
+        layout=LAYOUT_PARTITIONED,
+        files=[
+            ManifestFile(key="k2", size=10, etag="e2", row_count=2, partition="2024-01-02"),
+            ManifestFile(key="k1", size=10, etag="e1", row_count=1, partition="2024-01-01"),
+        ],
+    )
+
+    # When: Round-tripping
+    parsed = DatasetManifest.from_json(manifest.to_json())
+
+    # Then: Files survive, keys are planned in partition order
+    assert parsed.files == manifest.files
+    assert parsed.row_count == 3
+    assert parsed.file_keys() == ["k1", "k2"]
+    assert parsed.file_keys(("2024-01-02", "2024-01-31")) == ["k2"]
+    payload = json.loads(manifest.to_json())
+    payload["format_version"] = 99
+    with pytest.raises(ValueError):
+        DatasetManifest.from_json(json.dumps(payload))
+
+
+def test_load_writes_partitioned_manifest(mock_s3, partitioned_df):
+    """Test: BaseETL.load publishes a manifest describing every partition."""
+    # Given: ETL instance
+    etl = PassthroughETL()
+
+    # When: Loading a partitioned dataset
+    etl.load(partitioned_df, "ds", partition_column="date")
+
+    # Then: Manifest lists partitions with sizes, ETags, rows and statistics
+    body = mock_s3.get_object(Bucket="bi-datasets", Key=manifest_key("ds"))["Body"].read()
+    manifest = DatasetManifest.from_json(body.decode("utf-8"))
+    assert manifest.layout == LAYOUT_PARTITIONED
+    assert manifest.partitions() == ["2024-01-01", "2024-01-02", "2024-01-03"]
+    assert manifest.row_count == 4
+    for f in manifest.files:
+        head = mock_s3.head_object(Bucket="bi-datasets", Key=f.key)
+        assert f.size == head["ContentLength"]
+        assert f.etag == head["ETag"].strip('"')
+    stats = manifest.column_statistics()
+    assert stats["value"]["min"] == 1 and stats["value"]["max"] == 4
+    assert stats["category"]["null_count"] == 1
+    assert [c["name"] for c in manifest.schema] == ["date", "value", "category"]
+
+
+def test_load_keeps_partitions_from_earlier_loads(mock_s3, partitioned_df):
+    """Test: partitions not rewritten by a load stay in the manifest."""
+    # Given: A first full load
+    etl = PassthroughETL()
+    etl.load(partitioned_df, "ds", partition_column="date")
+
+    # When: A second load writes only a new day
+    etl.load(
+        pd.DataFrame({"date": pd.to_datetime(["2024-01-04"]), "value": [5], "category": ["B"]}),
+        "ds",
+        partition_column="date",
+    )
+
+    # Then: All four partitions are listed, with carried-over row counts
+    body = mock_s3.get_object(Bucket="bi-datasets", Key=manifest_key("ds"))["Body"].read()
+    manifest = DatasetManifest.from_json(body.decode("utf-8"))
+    assert manifest.partitions() == ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04"]
+    assert manifest.row_count == 5
+
+
+def test_reader_plans_from_manifest_without_listing(mock_s3, partitioned_df, monkeypatch):
+    """Test: read_dataset uses the manifest and never lists the bucket."""
+    # Given: Dataset loaded through the ETL (manifest present)
+    PassthroughETL().load(partitioned_df, "ds", partition_column="date")
+    reader = ParquetReader()
+
+    def fail_listing(*args, **kwargs):
+        raise AssertionError("bucket listing should not be needed")
+
+    monkeypatch.setattr(reader.client, "list_objects_v2", fail_listing)
+    monkeypatch.setattr(reader.client, "get_paginator", fail_listing)
+
+    # When: Reading all and a date range
+    full = reader.read_dataset("ds")
+    ranged = reader.read_dataset("ds", date_range=("2024-01-02", "2024-01-02"))
+
+    # Then: Data matches the partitions selected by the manifest
+    assert full["value"].tolist() == [1, 2, 3, 4]
+    assert ranged["value"].tolist() == [2, 3]
+    assert reader.get_dataset_version("ds").startswith("manifest:")
+
+
+def test_reader_falls_back_to_listing_without_manifest(mock_s3, sample_df):
+    """Test: datasets without a manifest are still discovered by listing."""
+    # Given: Partitions uploaded directly (no manifest)
+    for date in ["2024-01-01", "2024-01-02"]:
+        upload_parquet_to_s3(
+            mock_s3, "bi-datasets", f"datasets/legacy/partitions/date={date}/part-0000.parquet", sample_df
+        )
+    reader = ParquetReader()
+
+    # When: Reading
+    result = reader.read_dataset("legacy")
+
+    # Then: Both partitions are read
+    assert reader.get_manifest("legacy") is None
+    assert len(result) == 2 * len(sample_df)
+
+
+def test_reader_ignores_invalid_manifest(mock_s3, sample_df):
+    """Test: a corrupt manifest falls back to listing instead of failing reads."""
+    # Given: Single-file dataset with an unparsable manifest
+    upload_parquet_to_s3(mock_s3, "bi-datasets", "datasets/ds/data/part-0000.parquet", sample_df)
+    mock_s3.put_object(Bucket="bi-datasets", Key=manifest_key("ds"), Body=b"{not json")
+
+    # When: Reading
+    result = ParquetReader().read_dataset("ds")
+
+    # Then: Data is still returned
+    assert len(result) == len(sample_df)
+
+
+def test_partition_versions_from_manifest_change_per_partition(mock_s3, partitioned_df):
+    """Test: only the rewritten partition gets a new version."""
+    # Given: Dataset loaded through the ETL
+    etl = PassthroughETL()
+    etl.load(partitioned_df, "ds", partition_column="date")
+    reader = ParquetReader()
+    before = reader.get_partition_versions("ds")
+
+    # When: One day is reloaded with different data
+    etl.load(
+        pd.DataFrame({"date": pd.to_datetime(["2024-01-03"]), "value": [40], "category": ["A"]}),
+        "ds",
+        partition_column="date",
+    )
+    after = reader.get_partition_versions("ds")
+
+    # Then: Same partitions; only 2024-01-03 changed
+    assert list(before) == list(after) == ["2024-01-01", "2024-01-02", "2024-01-03"]
+    assert [d for d in after if after[d] != before[d]] == ["2024-01-03"]
+
+
+def test_read_partitions_from_manifest(mock_s3, partitioned_df):
+    """Test: read_partitions returns one frame per requested partition."""
+    # Given: Dataset loaded through the ETL
+    PassthroughETL().load(partitioned_df, "ds", partition_column="date")
+
+    # When: Reading two partitions (one of them unknown)
+    frames = ParquetReader().read_partitions(
+        "ds", ["2024-01-03", "2024-01-02", "2024-02-01"], columns=["value"]
+    )
+
+    # Then: Requested order, projected, unknown partition omitted
+    assert list(frames) == ["2024-01-03", "2024-01-02"]
+    assert frames["2024-01-02"]["value"].tolist() == [2, 3]
+    assert list(frames["2024-01-02"].columns) == ["value"]
+    assert list(frames["2024-01-02"].index) == [0, 1]
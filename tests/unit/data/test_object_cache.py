@@ -0,0 +1,68 @@
+"""Tests for the local on-disk S3 object cache."""
+import io
+import os
+import time
+
+from src.data.object_cache import LocalObjectCache
+
+
+def test_put_then_get_returns_same_file(tmp_path):
+    """Test: a stored object is found again under the same bucket/key/ETag."""
+    # Given: Empty cache
+    cache = LocalObjectCache(str(tmp_path), max_bytes=1024)
+
+    # When: Storing an object
+    path = cache.put("bucket", "a.parquet", '"etag-1"', io.BytesIO(b"hello"))
+
+    # Then: Lookup with the same ETag (quoted or not) hits
+    assert path.read_bytes() == b"hello"
+    assert cache.get("bucket", "a.parquet", "etag-1") == path
+
+
+def test_changed_etag_is_a_miss(tmp_path):
+    """Test: a new object version never hits the old cache file."""
+    # Given: Object cached under one ETag
+    cache = LocalObjectCache(str(tmp_path), max_bytes=1024)
+    cache.put("bucket", "a.parquet", "etag-1", io.BytesIO(b"old"))
+
+    # When / Then: Looking up another ETag misses
+    assert cache.get("bucket", "a.parquet", "etag-2") is None
+
+
+def test_evicts_least_recently_used_when_over_budget(tmp_path):
+    """Test: exceeding max_bytes removes the least recently used file."""
+    # Given: Two 4-byte objects in an 8-byte cache, "a" used more recently
+    cache = LocalObjectCache(str(tmp_path), max_bytes=8)
+    path_a = cache.put("bucket", "a", "1", io.BytesIO(b"aaaa"))
+    path_b = cache.put("bucket", "b", "1", io.BytesIO(b"bbbb"))
+    old = time.time() - 60
+    os.utime(path_b, (old, old))
+    cache.get("bucket", "a", "1")
+
+    # When: Adding a third object
+    path_c = cache.put("bucket", "c", "1", io.BytesIO(b"cccc"))
+
+    # Then: "b" is evicted, "a" and "c" remain
+    assert not path_b.exists()
+    assert path_a.exists() and path_c.exists()
+    assert cache.total_bytes() == 8
+
+
+def test_put_does_not_rescan_the_directory(tmp_path, monkeypatch):
+    """Test: puts maintain a running index instead of listing the directory each time."""
+    from pathlib import Path
+
+    # Given: A cache whose index was built once
+    cache = LocalObjectCache(str(tmp_path), max_bytes=1024)
+    cache.put("bucket", "first", "1", io.BytesIO(b"x"))
+    scans = []
+    original_glob = Path.glob
+    monkeypatch.setattr(Path, "glob", lambda self, pattern: scans.append(pattern) or original_glob(self, pattern))
+
+    # When: Storing many objects
+    for i in range(50):
+        cache.put("bucket", f"part-{i}", "1", io.BytesIO(b"yy"))
+
+    # Then: No directory scan happened and the size is still tracked
+    assert scans == []
+    assert cache.total_bytes() == 1 + 50 * 2
@@ -19,3 +19,168 @@ def test_read_dataset_smoke(mock_s3, sample_df):
     assert isinstance(result, type(sample_df))
     assert len(result) == len(sample_df)
     assert list(result.columns) == list(sample_df.columns)
+
+
+def test_read_dataset_with_column_projection(mock_s3, sample_df):
+    """Test: columns= decodes only the requested columns."""
+    # Given: Parquet file uploaded to S3
+    dataset_id = "test_dataset"
+    s3_key = f"datasets/{dataset_id}/data/part-0000.parquet"
+    upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key, sample_df)
+
+    # When: Reading a projection (including a column the file does not have)
+    reader = ParquetReader()
+    result = reader.read_dataset(dataset_id, columns=["name", "amount", "missing"])
+
+    # Then: Only the existing requested columns are returned
+    assert list(result.columns) == ["name", "amount"]
+    assert result["amount"].tolist() == sample_df["amount"].tolist()
+
+
+def test_read_partitioned_with_column_projection(mock_s3, sample_df):
+    """Test: column projection is applied to every partition."""
+    # Given: Partitioned dataset
+    dataset_id = "test_dataset"
+    for i in range(1, 3):
+        s3_key = f"datasets/{dataset_id}/partitions/date=2024-01-0{i}/part-0000.parquet"
+        upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key, sample_df)
+
+    # When: Reading with a projection
+    reader = ParquetReader()
+    result = reader.read_dataset(dataset_id, columns=["id"])
+
+    # Then: Combined frame only has the projected column
+    assert list(result.columns) == ["id"]
+    assert len(result) == len(sample_df) * 2
+
+
+def test_read_dataset_uses_local_object_cache(mock_s3, sample_df, tmp_path, monkeypatch):
+    """Test: with parquet_cache_dir set, a second read costs a HEAD but no GET."""
+    # Given: Parquet file uploaded to S3 and a local cache directory
+    dataset_id = "test_dataset"
+    s3_key = f"datasets/{dataset_id}/data/part-0000.parquet"
+    upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key, sample_df)
+    monkeypatch.setattr("src.data.parquet_reader.settings.parquet_cache_dir", str(tmp_path))
+
+    reader = ParquetReader()
+    first = reader.read_dataset(dataset_id)
+
+    # When: Reading again while counting GET requests
+    get_calls = []
+    original_get = reader.client.get_object
+
+    def counting_get(**kwargs):
+        if kwargs["Key"].endswith(".parquet"):
+            get_calls.append(kwargs["Key"])
+        return original_get(**kwargs)
+
+    monkeypatch.setattr(reader.client, "get_object", counting_get)
+    second = reader.read_dataset(dataset_id)
+
+    # Then: Same data, served from the memory-mapped cache file
+    assert get_calls == []
+    assert second.equals(first)
+
+
+def test_read_dataset_redownloads_when_etag_changes(mock_s3, sample_df, tmp_path, monkeypatch):
+    """Test: an overwritten object is downloaded again instead of served stale."""
+    # Given: Dataset read once through the local cache
+    dataset_id = "test_dataset"
+    s3_key = f"datasets/{dataset_id}/data/part-0000.parquet"
+    upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key, sample_df)
+    monkeypatch.setattr("src.data.parquet_reader.settings.parquet_cache_dir", str(tmp_path))
+    reader = ParquetReader()
+    reader.read_dataset(dataset_id)
+
+    # When: The object is replaced and read again
+    updated = sample_df.head(1)
+    upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key, updated)
+    result = reader.read_dataset(dataset_id)
+
+    # Then: The new version is returned
+    assert len(result) == 1
+
+
+def test_iter_batches_streams_single_file(mock_s3, sample_df):
+    """Test: iter_batches yields bounded record batches covering the whole file."""
+    # Given: Parquet file uploaded to S3
+    dataset_id = "test_dataset"
+    s3_key = f"datasets/{dataset_id}/data/part-0000.parquet"
+    upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key, sample_df)
+
+    # When: Streaming with a small batch size and a projection
+    reader = ParquetReader()
+    batches = list(reader.iter_batches(dataset_id, columns=["id", "amount"], batch_size=2))
+
+    # Then: Batches respect the size limit and contain only projected columns
+    assert [batch.num_rows for batch in batches] == [2, 1]
+    assert all(batch.schema.names == ["id", "amount"] for batch in batches)
+    assert [v for batch in batches for v in batch.column("id").to_pylist()] == [1, 2, 3]
+
+
+def test_iter_batches_uses_local_object_cache(mock_s3, sample_df, tmp_path, monkeypatch):
+    """Test: iter_batches streams from the local object cache when configured."""
+    # Given: Dataset streamed once through the local cache
+    dataset_id = "test_dataset"
+    s3_key = f"datasets/{dataset_id}/data/part-0000.parquet"
+    upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key, sample_df)
+    monkeypatch.setattr("src.data.parquet_reader.settings.parquet_cache_dir", str(tmp_path))
+    reader = ParquetReader()
+    list(reader.iter_batches(dataset_id))
+
+    # When: Streaming again while counting GET requests
+    get_calls = []
+    original_get = reader.client.get_object
+
+    def counting_get(**kwargs):
+        if kwargs["Key"].endswith(".parquet"):
+            get_calls.append(kwargs["Key"])
+        return original_get(**kwargs)
+
+    monkeypatch.setattr(reader.client, "get_object", counting_get)
+    rows = sum(batch.num_rows for batch in reader.iter_batches(dataset_id))
+
+    # Then: All rows are served without another download
+    assert get_calls == []
+    assert rows == len(sample_df)
+
+
+def test_iter_batches_missing_dataset_raises(mock_s3):
+    """Test: iter_batches raises DatasetFileNotFoundError for an unknown dataset."""
+    from src.exceptions import DatasetFileNotFoundError
+
+    # Given: Empty bucket
+    reader = ParquetReader()
+
+    # When/Then: Consuming the iterator raises
+    with pytest.raises(DatasetFileNotFoundError):
+        list(reader.iter_batches("missing_dataset"))
+
+
+def test_get_published_versions_lists_all_markers(mock_s3):
+    """Test: one listing returns a change token per published dataset."""
+    from src.data.dataset_version import PublishedVersion, version_key
+
+    # Given: Markers of two datasets and an unrelated object
+    for dataset_id in ("dataset-a", "dataset-b"):
+        mock_s3.put_object(
+            Bucket="bi-datasets",
+            Key=version_key(dataset_id),
+            Body=PublishedVersion(dataset_id=dataset_id, version=1).to_json().encode("utf-8"),
+        )
+    mock_s3.put_object(Bucket="bi-datasets", Key="_dataset_versions/README", Body=b"x")
+    reader = ParquetReader()
+
+    # When: Listing, republishing one dataset, listing again
+    before = reader.get_published_versions()
+    mock_s3.put_object(
+        Bucket="bi-datasets",
+        Key=version_key("dataset-a"),
+        Body=PublishedVersion(dataset_id="dataset-a", version=2).to_json().encode("utf-8"),
+    )
+    after = reader.get_published_versions()
+
+    # Then: Only the republished dataset's token changed
+    assert sorted(before) == ["dataset-a", "dataset-b"]
+    assert after["dataset-a"] != before["dataset-a"]
+    assert after["dataset-b"] == before["dataset-b"]
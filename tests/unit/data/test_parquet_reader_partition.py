@@ -1,5 +1,6 @@
 """Tests for ParquetReader partition support."""
 import pytest
+import pandas as pd
 from datetime import datetime
 from src.data.parquet_reader import ParquetReader
 from src.exceptions import DatasetFileNotFoundError
@@ -36,50 +37,26 @@ def test_has_partitions_partitioned(mock_s3, sample_df):
     assert reader._has_partitions(dataset_id) is True
 
 
-def test_list_partitions(mock_s3, sample_df):
-    """Test: _list_partitions returns list of partition dates."""
-    # Given: Partitioned dataset
-    dataset_id = "test_dataset"
-    s3_key1 = f"datasets/{dataset_id}/partitions/date=2024-01-01/part-0000.parquet"
-    s3_key2 = f"datasets/{dataset_id}/partitions/date=2024-01-02/part-0000.parquet"
-    s3_key3 = f"datasets/{dataset_id}/partitions/date=2024-01-03/part-0000.parquet"
-    upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key1, sample_df)
-    upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key2, sample_df)
-    upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key3, sample_df)
-
-    # When: Listing partitions
-    reader = ParquetReader()
-    partitions = reader._list_partitions(dataset_id)
-
-    # Then: Returns sorted list of dates
-    assert set(partitions) == {"2024-01-01", "2024-01-02", "2024-01-03"}
-
-
-def test_read_partitioned_all(mock_s3, sample_df):
-    """Test: _read_partitioned reads all partitions when date_range is None."""
+def test_read_partitions_all(mock_s3, sample_df):
+    """Test: read_partitions returns one frame per listed partition."""
     # Given: Partitioned dataset with 3 partitions
     dataset_id = "test_dataset"
-    df1 = sample_df.copy()
-    df2 = sample_df.copy()
-    df3 = sample_df.copy()
-
-    s3_key1 = f"datasets/{dataset_id}/partitions/date=2024-01-01/part-0000.parquet"
-    s3_key2 = f"datasets/{dataset_id}/partitions/date=2024-01-02/part-0000.parquet"
-    s3_key3 = f"datasets/{dataset_id}/partitions/date=2024-01-03/part-0000.parquet"
-    upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key1, df1)
-    upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key2, df2)
-    upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key3, df3)
+    dates = ["2024-01-01", "2024-01-02", "2024-01-03"]
+    for date_str in dates:
+        s3_key = f"datasets/{dataset_id}/partitions/date={date_str}/part-0000.parquet"
+        upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key, sample_df)
 
-    # When: Reading without date_range
+    # When: Reading every partition
     reader = ParquetReader()
-    result = reader._read_partitioned(dataset_id, date_range=None)
+    frames = reader.read_partitions(dataset_id, dates)
 
-    # Then: All partitions are combined
-    assert len(result) == len(df1) * 3
+    # Then: Frames come back in partition order, one per date
+    assert list(frames) == dates
+    assert all(len(frame) == len(sample_df) for frame in frames.values())
 
 
-def test_read_partitioned_with_range(mock_s3, sample_df):
-    """Test: _read_partitioned reads only partitions in date_range."""
+def test_read_partitions_subset(mock_s3, sample_df):
+    """Test: read_partitions reads only the requested partitions."""
     # Given: Partitioned dataset with 5 partitions
     dataset_id = "test_dataset"
     for i in range(1, 6):
@@ -87,12 +64,14 @@ def test_read_partitioned_with_range(mock_s3, sample_df):
         s3_key = f"datasets/{dataset_id}/partitions/date={date_str}/part-0000.parquet"
         upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key, sample_df)
 
-    # When: Reading with date_range (2024-01-02 to 2024-01-04)
+    # When: Reading three of them, plus one that does not exist
     reader = ParquetReader()
-    result = reader._read_partitioned(dataset_id, date_range=("2024-01-02", "2024-01-04"))
+    frames = reader.read_partitions(
+        dataset_id, ["2024-01-02", "2024-01-03", "2024-01-04", "2024-02-01"]
+    )
 
-    # Then: Only 3 partitions are read
-    assert len(result) == len(sample_df) * 3
+    # Then: Only the existing requested partitions are returned
+    assert list(frames) == ["2024-01-02", "2024-01-03", "2024-01-04"]
 
 
 def test_read_dataset_auto_detects_partition(mock_s3, sample_df):
@@ -127,3 +106,227 @@ def test_read_dataset_with_date_range(mock_s3, sample_df):
 
     # Then: Only filtered partitions are read
     assert len(result) == len(sample_df) * 3
+
+
+def test_read_dataset_concurrent_preserves_partition_order(mock_s3, sample_df, monkeypatch):
+    """Test: concurrent partition reads keep partition (date) order in the result."""
+    # Given: 6 partitions, each tagged with its own date
+    dataset_id = "test_dataset"
+    dates = [f"2024-01-{i:02d}" for i in range(1, 7)]
+    for date_str in dates:
+        df = sample_df.copy()
+        df["partition"] = date_str
+        s3_key = f"datasets/{dataset_id}/partitions/date={date_str}/part-0000.parquet"
+        upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key, df)
+
+    # When: Reading with a pool of several workers
+    monkeypatch.setattr("src.data.parquet_reader.settings.parquet_read_concurrency", 4)
+    reader = ParquetReader()
+    result = reader.read_dataset(dataset_id)
+
+    # Then: Rows appear in partition order, same as a sequential read
+    expected = [d for d in dates for _ in range(len(sample_df))]
+    assert result["partition"].tolist() == expected
+    assert list(result.index) == list(range(len(expected)))
+
+
+def test_read_dataset_sequential_when_concurrency_is_one(mock_s3, sample_df, monkeypatch):
+    """Test: parquet_read_concurrency=1 falls back to sequential reads."""
+    # Given: Partitioned dataset
+    dataset_id = "test_dataset"
+    for i in range(1, 4):
+        s3_key = f"datasets/{dataset_id}/partitions/date=2024-01-0{i}/part-0000.parquet"
+        upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key, sample_df)
+
+    # When: Reading with concurrency disabled
+    monkeypatch.setattr("src.data.parquet_reader.settings.parquet_read_concurrency", 1)
+    reader = ParquetReader()
+    result = reader.read_dataset(dataset_id)
+
+    # Then: All partitions are combined
+    assert len(result) == len(sample_df) * 3
+
+
+def test_iter_batches_partitioned_in_partition_order(mock_s3, sample_df):
+    """Test: iter_batches streams partitions in order and honours date_range."""
+    # Given: Partitioned dataset with 3 partitions
+    dataset_id = "test_dataset"
+    for i, date in enumerate(["2024-01-01", "2024-01-02", "2024-01-03"]):
+        s3_key = f"datasets/{dataset_id}/partitions/date={date}/part-0000.parquet"
+        upload_parquet_to_s3(mock_s3, "bi-datasets", s3_key, sample_df.assign(id=sample_df["id"] + i * 10))
+
+    # When: Streaming the last two partitions
+    reader = ParquetReader()
+    batches = list(reader.iter_batches(
+        dataset_id,
+        columns=["id"],
+        date_range=("2024-01-02", "2024-01-03"),
+    ))
+
+    # Then: Rows arrive partition by partition
+    ids = [v for batch in batches for v in batch.column("id").to_pylist()]
+    assert ids == [11, 12, 13, 21, 22, 23]
+
+
+def test_read_partitioned_promotes_drifting_schemas(mock_s3, sample_df):
+    """Test: partitions with drifting schemas are unified in Arrow."""
+    # Given: A later partition widens "id" and adds a column
+    dataset_id = "test_dataset"
+    first = sample_df.astype({"id": "int32"})
+    second = sample_df.assign(extra=["x", "y", "z"])
+    upload_parquet_to_s3(
+        mock_s3, "bi-datasets", f"datasets/{dataset_id}/partitions/date=2024-01-01/part-0000.parquet", first
+    )
+    upload_parquet_to_s3(
+        mock_s3, "bi-datasets", f"datasets/{dataset_id}/partitions/date=2024-01-02/part-0000.parquet", second
+    )
+
+    # When: Reading the dataset
+    result = ParquetReader().read_dataset(dataset_id)
+
+    # Then: Common type for id, missing column filled with nulls
+    assert str(result["id"].dtype) == "int64"
+    assert result["extra"].isna().sum() == len(sample_df)
+    assert result["extra"].dropna().tolist() == ["x", "y", "z"]
+    assert list(result.index) == list(range(2 * len(sample_df)))
+
+
+def test_read_partitioned_falls_back_for_incompatible_schemas(mock_s3, sample_df):
+    """Test: partitions Arrow cannot unify are combined by pandas."""
+    # Given: "amount" is numeric in one partition and text in the other
+    dataset_id = "test_dataset"
+    upload_parquet_to_s3(
+        mock_s3, "bi-datasets", f"datasets/{dataset_id}/partitions/date=2024-01-01/part-0000.parquet", sample_df
+    )
+    upload_parquet_to_s3(
+        mock_s3, "bi-datasets", f"datasets/{dataset_id}/partitions/date=2024-01-02/part-0000.parquet",
+        sample_df.assign(amount=["n/a", "1", "2"]),
+    )
+
+    # When: Reading the dataset
+    result = ParquetReader().read_dataset(dataset_id)
+
+    # Then: All rows are returned
+    assert len(result) == 2 * len(sample_df)
+    assert result["amount"].tolist()[-3:] == ["n/a", "1", "2"]
+
+
+def test_read_dataset_with_stats_reports_memory(mock_s3, sample_df):
+    """Test: read_dataset_with_stats returns the frame and load figures."""
+    # Given: Partitioned dataset with 2 partitions
+    dataset_id = "test_dataset"
+    for date in ["2024-01-01", "2024-01-02"]:
+        upload_parquet_to_s3(
+            mock_s3, "bi-datasets", f"datasets/{dataset_id}/partitions/date={date}/part-0000.parquet", sample_df
+        )
+
+    # When: Reading with stats
+    df, stats = ParquetReader().read_dataset_with_stats(dataset_id, columns=["id", "amount"])
+
+    # Then: Figures describe the load
+    assert stats.dataset_id == dataset_id
+    assert stats.files == 2
+    assert (stats.rows, stats.columns) == df.shape == (6, 2)
+    assert stats.arrow_bytes > 0
+    assert stats.pandas_bytes >= df["amount"].nbytes
+    assert stats.seconds >= 0
+
+
+def test_read_dataset_arrow_dtypes_option(mock_s3, sample_df, monkeypatch):
+    """Test: parquet_arrow_dtypes keeps columns Arrow-backed."""
+    # Given: Option enabled
+    dataset_id = "test_dataset"
+    upload_parquet_to_s3(
+        mock_s3, "bi-datasets", f"datasets/{dataset_id}/data/part-0000.parquet", sample_df
+    )
+    monkeypatch.setattr("src.data.parquet_reader.settings.parquet_arrow_dtypes", True)
+
+    # When: Reading
+    result = ParquetReader().read_dataset(dataset_id)
+
+    # Then: Columns use pd.ArrowDtype
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in result.dtypes)
+    assert result["id"].tolist() == [1, 2, 3]
+
+
+def test_read_dataset_loads_categories_across_partitions(mock_s3, sample_df):
+    """Test: requested string columns load as category over all partitions."""
+    # Given: Partitioned dataset with different values per partition
+    dataset_id = "test_dataset"
+    upload_parquet_to_s3(
+        mock_s3, "bi-datasets",
+        f"datasets/{dataset_id}/partitions/date=2024-01-01/part-0000.parquet", sample_df,
+    )
+    upload_parquet_to_s3(
+        mock_s3, "bi-datasets",
+        f"datasets/{dataset_id}/partitions/date=2024-01-02/part-0000.parquet",
+        sample_df.assign(category=["C", "C", "A"]),
+    )
+
+    # When: Reading with categorical columns (non-string and unknown ones are ignored)
+    result = ParquetReader().read_dataset(
+        dataset_id, categories=["category", "id", "missing"]
+    )
+
+    # Then: Only the string column is categorical, with the values of both partitions
+    assert isinstance(result["category"].dtype, pd.CategoricalDtype)
+    assert result["category"].tolist() == ["A", "B", "A", "C", "C", "A"]
+    assert sorted(result["category"].cat.categories) == ["A", "B", "C"]
+    assert result["id"].tolist() == [1, 2, 3, 1, 2, 3]
+
+
+def test_get_partition_versions_by_listing(mock_s3, sample_df):
+    """Test: without a manifest, partition versions come from the listing."""
+    # Given: Partitions uploaded directly (no manifest)
+    dataset_id = "test_dataset"
+    for date in ["2024-01-02", "2024-01-01"]:
+        upload_parquet_to_s3(
+            mock_s3, "bi-datasets",
+            f"datasets/{dataset_id}/partitions/date={date}/part-0000.parquet", sample_df,
+        )
+    reader = ParquetReader()
+    before = reader.get_partition_versions(dataset_id)
+
+    # When: One partition is rewritten
+    upload_parquet_to_s3(
+        mock_s3, "bi-datasets",
+        f"datasets/{dataset_id}/partitions/date=2024-01-02/part-0000.parquet", sample_df.head(1),
+    )
+    after = reader.get_partition_versions(dataset_id)
+
+    # Then: Sorted dates; only the rewritten one changed
+    assert list(after) == ["2024-01-01", "2024-01-02"]
+    assert after["2024-01-01"] == before["2024-01-01"]
+    assert after["2024-01-02"] != before["2024-01-02"]
+
+
+def test_get_partition_versions_non_partitioned(mock_s3, sample_df):
+    """Test: non-partitioned datasets have no partition versions."""
+    # Given: Non-partitioned dataset
+    upload_parquet_to_s3(
+        mock_s3, "bi-datasets", "datasets/test_dataset/data/part-0000.parquet", sample_df
+    )
+
+    # When/Then
+    assert ParquetReader().get_partition_versions("test_dataset") is None
+
+
+def test_read_dataset_reads_every_part_of_a_partition(mock_s3, sample_df):
+    """Test: without a manifest, all part files of each partition are read in order."""
+    # Given: A partition split into two parts and a single-part partition
+    dataset_id = "test_dataset"
+    prefix = f"datasets/{dataset_id}/partitions"
+    upload_parquet_to_s3(mock_s3, "bi-datasets", f"{prefix}/date=2024-01-01/part-0000.parquet", sample_df.iloc[:2])
+    upload_parquet_to_s3(mock_s3, "bi-datasets", f"{prefix}/date=2024-01-01/part-0001.parquet", sample_df.iloc[2:])
+    upload_parquet_to_s3(mock_s3, "bi-datasets", f"{prefix}/date=2024-01-02/part-0000.parquet", sample_df)
+    reader = ParquetReader()
+
+    # When: Reading everything, a date range and single partitions
+    full = reader.read_dataset(dataset_id)
+    ranged = reader.read_dataset(dataset_id, date_range=("2024-01-01", "2024-01-01"))
+    frames = reader.read_partitions(dataset_id, ["2024-01-01"])
+
+    # Then: Both parts are included, in part order
+    assert full["id"].tolist() == [1, 2, 3, 1, 2, 3]
+    assert ranged["id"].tolist() == [1, 2, 3]
+    assert frames["2024-01-01"]["id"].tolist() == [1, 2, 3]
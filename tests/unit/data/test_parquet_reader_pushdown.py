@@ -0,0 +1,155 @@
+"""Tests for ParquetReader predicate pushdown."""
+import io
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.data.filter_engine import CategoryFilter, DateRangeFilter, FilterSet, apply_filters
+from src.data.parquet_reader import ParquetReader
+from tests.conftest import upload_parquet_to_s3
+
+
+def _make_df() -> pd.DataFrame:
+    return pd.DataFrame({
+        "id": list(range(8)),
+        "region": ["APAC", "EMEA", "APAC", None, "AMER", "APAC", "EMEA", "AMER"],
+        "date": pd.to_datetime([
+            "2024-01-01 00:00:00",
+            "2024-01-01 23:59:59",
+            "2024-01-02 12:00:00",
+            "2024-01-03 08:00:00",
+            "2024-01-04 00:00:00",
+            "2024-01-05 10:00:00",
+            "2024-01-06 10:00:00",
+            "2024-01-07 10:00:00",
+        ]),
+        "amount": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0],
+    })
+
+
+def _upload_with_row_groups(client, key: str, df: pd.DataFrame, row_group_size: int) -> None:
+    buf = io.BytesIO()
+    pq.write_table(pa.Table.from_pandas(df), buf, row_group_size=row_group_size)
+    client.put_object(Bucket="bi-datasets", Key=key, Body=buf.getvalue())
+
+
+def test_pushdown_matches_in_memory_filters(mock_s3):
+    """Test: pushed-down read equals apply_filters on the full dataset."""
+    # Given: Single-file dataset split into small row groups
+    dataset_id = "pushdown"
+    df = _make_df()
+    _upload_with_row_groups(mock_s3, f"datasets/{dataset_id}/data/part-0000.parquet", df, 2)
+
+    filter_set = FilterSet(
+        category_filters=[CategoryFilter(column="region", values=["APAC", "EMEA"], include_null=True)],
+        date_filters=[DateRangeFilter(column="date", start_date="2024-01-01", end_date="2024-01-05")],
+    )
+
+    # When: Reading with filters
+    reader = ParquetReader()
+    result = reader.read_dataset(dataset_id, filters=filter_set)
+
+    # Then: Same rows as the in-memory path
+    expected = apply_filters(reader.read_dataset(dataset_id), filter_set)
+    pd.testing.assert_frame_equal(
+        result.reset_index(drop=True), expected.reset_index(drop=True)
+    )
+    assert result["id"].tolist() == [0, 1, 2, 3, 5]
+
+
+def test_pushdown_with_projection_drops_filter_only_columns(mock_s3):
+    """Test: filter columns outside the projection are not returned."""
+    # Given: Single-file dataset
+    dataset_id = "pushdown"
+    df = _make_df()
+    _upload_with_row_groups(mock_s3, f"datasets/{dataset_id}/data/part-0000.parquet", df, 3)
+
+    filter_set = FilterSet(
+        category_filters=[
+            CategoryFilter(column="region", values=["AMER"]),
+            CategoryFilter(column="id", values=[4, 7]),  # numeric: applied in memory
+        ],
+    )
+
+    # When: Reading a projection that excludes both filter columns
+    reader = ParquetReader()
+    result = reader.read_dataset(dataset_id, columns=["amount"], filters=filter_set)
+
+    # Then: Rows are filtered, only the projected column is returned
+    assert list(result.columns) == ["amount"]
+    assert result["amount"].tolist() == [5.0, 8.0]
+
+
+def test_pushdown_on_partitioned_dataset(mock_s3):
+    """Test: filters are pushed down into every partition file."""
+    # Given: Two partitions
+    dataset_id = "pushdown"
+    df = _make_df()
+    upload_parquet_to_s3(
+        mock_s3, "bi-datasets",
+        f"datasets/{dataset_id}/partitions/date=2024-01-01/part-0000.parquet", df.iloc[:4],
+    )
+    upload_parquet_to_s3(
+        mock_s3, "bi-datasets",
+        f"datasets/{dataset_id}/partitions/date=2024-01-04/part-0000.parquet", df.iloc[4:],
+    )
+    filter_set = FilterSet(category_filters=[CategoryFilter(column="region", values=["EMEA"])])
+
+    # When: Reading with filters
+    reader = ParquetReader()
+    result = reader.read_dataset(dataset_id, filters=filter_set)
+
+    # Then: Only matching rows from both partitions are returned
+    assert result["id"].tolist() == [1, 6]
+
+
+def test_residual_filters_applied_per_partition(mock_s3):
+    """Test: residual filters only affect partitions that have the column."""
+    # Given: The filtered column exists in the second partition only
+    dataset_id = "pushdown"
+    df = _make_df()
+    upload_parquet_to_s3(
+        mock_s3, "bi-datasets",
+        f"datasets/{dataset_id}/partitions/date=2024-01-01/part-0000.parquet", df.iloc[:4],
+    )
+    upload_parquet_to_s3(
+        mock_s3, "bi-datasets",
+        f"datasets/{dataset_id}/partitions/date=2024-01-04/part-0000.parquet",
+        df.iloc[4:].assign(score=[1, 2, 3, 4]),
+    )
+    # Non-string values are not pushed down: applied in memory (residual)
+    filter_set = FilterSet(category_filters=[CategoryFilter(column="score", values=[2, 4])])
+
+    # When: Reading with a projection that excludes the filter column
+    reader = ParquetReader()
+    result = reader.read_dataset(dataset_id, columns=["id"], filters=filter_set)
+
+    # Then: Same rows as filtering each partition on its own
+    expected = [0, 1, 2, 3] + apply_filters(df.iloc[4:].assign(score=[1, 2, 3, 4]), filter_set)["id"].tolist()
+    assert result["id"].tolist() == expected
+    assert list(result.columns) == ["id"]
+    assert list(result.index) == list(range(len(expected)))
+
+
+def test_pushdown_on_categorical_column(mock_s3):
+    """Test: filters on a column loaded as category match in-memory filtering."""
+    # Given: Single-file dataset split into small row groups
+    dataset_id = "pushdown"
+    df = _make_df()
+    _upload_with_row_groups(
+        mock_s3, f"datasets/{dataset_id}/data/part-0000.parquet", df, row_group_size=2
+    )
+    filter_set = FilterSet(category_filters=[
+        CategoryFilter(column="region", values=["APAC"], include_null=True),
+    ])
+
+    # When: Reading the filter column as category
+    reader = ParquetReader()
+    result = reader.read_dataset(dataset_id, filters=filter_set, categories=["region"])
+
+    # Then: Same rows as filtering the full frame, with a category dtype
+    expected = apply_filters(df, filter_set).reset_index(drop=True)
+    assert isinstance(result["region"].dtype, pd.CategoricalDtype)
+    assert result["id"].tolist() == expected["id"].tolist()
+    assert result["region"].astype(str).tolist() == expected["region"].astype(str).tolist()
@@ -0,0 +1,72 @@
+"""Tests for S3 client factories."""
+from concurrent.futures import ThreadPoolExecutor
+
+from src.data.parquet_reader import ParquetReader, get_reader, reset_reader
+from src.data.s3_client import get_s3_client, get_shared_s3_client, reset_shared_s3_client
+
+
+def test_shared_client_is_reused(mock_s3):
+    """Test: get_shared_s3_client returns one instance across threads."""
+    # When: Fetching the client from many threads
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        clients = list(executor.map(lambda _: get_shared_s3_client(), range(32)))
+
+    # Then: Every caller got the same client
+    assert len({id(c) for c in clients}) == 1
+
+
+def test_reset_shared_client_creates_new_instance(mock_s3):
+    """Test: reset_shared_s3_client drops the cached client."""
+    # Given: Shared client created
+    first = get_shared_s3_client()
+
+    # When: Resetting
+    reset_shared_s3_client()
+
+    # Then: A new client is created on next use
+    assert get_shared_s3_client() is not first
+
+
+def test_client_config_applies_pool_and_timeouts(mock_s3, monkeypatch):
+    """Test: pool size, timeouts and keep-alive come from settings."""
+    # Given: Custom settings
+    monkeypatch.setattr("src.data.s3_client.settings.s3_max_pool_connections", 64)
+    monkeypatch.setattr("src.data.s3_client.settings.s3_connect_timeout", 2.0)
+    monkeypatch.setattr("src.data.s3_client.settings.s3_read_timeout", 30.0)
+
+    # When: Creating clients
+    shared = get_shared_s3_client()
+    fresh = get_s3_client()
+
+    # Then: Both carry the configuration
+    for client in (shared, fresh):
+        assert client.meta.config.max_pool_connections == 64
+        assert client.meta.config.connect_timeout == 2.0
+        assert client.meta.config.read_timeout == 30.0
+        assert client.meta.config.tcp_keepalive is True
+
+
+def test_parquet_reader_uses_shared_client(mock_s3):
+    """Test: readers share the pooled client unless one is injected."""
+    # When: Constructing readers
+    first = ParquetReader()
+    second = ParquetReader()
+    injected = ParquetReader(client=mock_s3)
+
+    # Then: Default readers reuse the shared client
+    assert first.client is second.client is get_shared_s3_client()
+    assert injected.client is mock_s3
+
+
+def test_get_reader_returns_one_shared_reader(mock_s3):
+    """Test: get_reader hands out one reader until reset_reader is called."""
+    # When: Getting the reader twice, then after a reset
+    first = get_reader()
+    second = get_reader()
+    reset_reader()
+    third = get_reader()
+
+    # Then: Same instance until reset, always on the shared client
+    assert first is second
+    assert third is not first
+    assert third.client is get_shared_s3_client()
@@ -0,0 +1,198 @@
+"""Tests for the ranged-GET S3 file object."""
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data import s3_range_file
+from src.data.parquet_reader import ParquetReader
+from src.data.s3_range_file import S3RangeFile, open_parquet_range_file
+
+
+@pytest.fixture(autouse=True)
+def clear_footers():
+    s3_range_file.clear_footer_cache()
+    yield
+    s3_range_file.clear_footer_cache()
+
+
+@pytest.fixture
+def wide_parquet(mock_s3):
+    """Upload a multi-row-group Parquet file and return (key, bytes, DataFrame)."""
+    n = 40_000
+    df = pd.DataFrame({
+        "id": np.arange(n),
+        "x": np.random.default_rng(0).random(n),
+        "y": np.random.default_rng(1).random(n),
+        "category": np.where(np.arange(n) < n // 2, "A", "B"),
+    })
+    buf = io.BytesIO()
+    df.to_parquet(buf, row_group_size=10_000)
+    key = "datasets/wide/data/part-0000.parquet"
+    mock_s3.put_object(Bucket="bi-datasets", Key=key, Body=buf.getvalue())
+    return key, buf.getvalue(), df
+
+
+def test_range_file_reads_and_seeks(mock_s3):
+    """Test: read/seek return the same bytes as the object itself."""
+    # Given: Object in S3
+    body = bytes(range(256)) * 4
+    mock_s3.put_object(Bucket="bi-datasets", Key="obj", Body=body)
+    f = S3RangeFile(mock_s3, "bi-datasets", "obj", len(body))
+
+    # When/Then: Ranged reads match the object
+    f.seek(10)
+    assert f.read(5) == body[10:15]
+    assert f.tell() == 15
+    f.seek(-4, io.SEEK_END)
+    assert f.read() == body[-4:]
+    assert f.read(10) == b""
+    assert f.requests == 2
+
+
+def test_range_file_rejects_non_parquet(mock_s3):
+    """Test: load_footer raises ValueError for a non-Parquet object."""
+    # Given: Plain text object
+    mock_s3.put_object(Bucket="bi-datasets", Key="obj", Body=b"not parquet at all")
+    f = S3RangeFile(mock_s3, "bi-datasets", "obj", 18)
+
+    # When/Then
+    with pytest.raises(ValueError):
+        f.load_footer()
+
+
+def test_open_parquet_range_file_caches_footer_per_etag(mock_s3, wide_parquet):
+    """Test: second open of an unchanged object reuses the cached footer."""
+    # Given: Parquet object and its HEAD
+    key, body, _ = wide_parquet
+    head = mock_s3.head_object(Bucket="bi-datasets", Key=key)
+
+    # When: Opening twice
+    first, metadata = open_parquet_range_file(mock_s3, "bi-datasets", key, len(body), head["ETag"])
+    second, cached = open_parquet_range_file(mock_s3, "bi-datasets", key, len(body), head["ETag"])
+
+    # Then: Footer fetched once, metadata shared
+    assert first.requests == 1
+    assert second.requests == 0
+    assert cached is metadata
+    assert metadata.num_row_groups == 4
+
+
+def test_read_dataset_projection_uses_range_reads(mock_s3, wide_parquet, monkeypatch):
+    """Test: projected read of a large object fetches only part of it."""
+    # Given: Range reads enabled for every object size
+    _, body, df = wide_parquet
+    monkeypatch.setattr("src.data.parquet_reader.settings.parquet_range_read_min_bytes", 0)
+    fetched = []
+    original = S3RangeFile._read_range
+
+    def tracking_read_range(self, start, end):
+        data = original(self, start, end)
+        fetched.append(self)
+        return data
+
+    monkeypatch.setattr(S3RangeFile, "_read_range", tracking_read_range)
+
+    # When: Reading one column
+    result = ParquetReader().read_dataset("wide", columns=["id"])
+
+    # Then: Correct data, far fewer bytes than the object
+    assert result["id"].tolist() == df["id"].tolist()
+    assert list(result.columns) == ["id"]
+    assert sum(f.bytes_fetched for f in set(fetched)) < len(body) / 2
+
+
+def test_read_dataset_filters_with_range_reads(mock_s3, wide_parquet, monkeypatch):
+    """Test: pushdown over range reads matches an in-memory filter."""
+    from src.data.filter_engine import CategoryFilter, FilterSet, apply_filters
+
+    # Given: Range reads enabled for every object size
+    _, _, df = wide_parquet
+    monkeypatch.setattr("src.data.parquet_reader.settings.parquet_range_read_min_bytes", 0)
+    filters = FilterSet(category_filters=[CategoryFilter(column="category", values=["B"])])
+
+    # When: Reading with a projection and filters
+    result = ParquetReader().read_dataset("wide", columns=["id", "x"], filters=filters)
+
+    # Then: Same rows as filtering the full frame
+    expected = apply_filters(df, filters)[["id", "x"]].reset_index(drop=True)
+    pd.testing.assert_frame_equal(result.reset_index(drop=True), expected)
+
+
+def test_filtered_range_reads_parse_the_footer_once(mock_s3, wide_parquet, monkeypatch):
+    """Test: filtered reads reuse the opened file's footer instead of reading it again."""
+    from src.data.filter_engine import CategoryFilter, FilterSet
+
+    # Given: Range reads enabled; reads of the object's tail (the footer) tracked
+    _, _, df = wide_parquet
+    monkeypatch.setattr("src.data.parquet_reader.settings.parquet_range_read_min_bytes", 0)
+    footer_reads = []
+    original = S3RangeFile._read_range
+
+    def tracking_read_range(self, start, end):
+        if end == self.size:
+            footer_reads.append("cached" if self._tail else "fetched")
+        return original(self, start, end)
+
+    monkeypatch.setattr(S3RangeFile, "_read_range", tracking_read_range)
+    filters = FilterSet(category_filters=[CategoryFilter(column="category", values=["B"])])
+    reader = ParquetReader()
+
+    # When: Reading with filters, cold and then with the footer cached
+    first = reader.read_dataset("wide", columns=["id"], filters=filters)
+    cold = list(footer_reads)
+    second = reader.read_dataset("wide", columns=["id"], filters=filters)
+
+    # Then: Fetched and parsed once when opening, never by the filtered read
+    assert cold == ["fetched", "cached"]
+    assert footer_reads == cold
+    assert first["id"].tolist() == df.loc[df["category"] == "B", "id"].tolist()
+    pd.testing.assert_frame_equal(first, second)
+
+
+def _put_manifest(mock_s3, key, body, etag):
+    from src.data.manifest import LAYOUT_SINGLE, DatasetManifest, ManifestFile, manifest_key
+
+    manifest = DatasetManifest(
+        dataset_id="wide",
+        layout=LAYOUT_SINGLE,
+        files=[ManifestFile(key=key, size=len(body), etag=etag)],
+    )
+    mock_s3.put_object(Bucket="bi-datasets", Key=manifest_key("wide"), Body=manifest.to_json())
+
+
+def test_read_dataset_plans_range_reads_from_manifest(mock_s3, wide_parquet, monkeypatch):
+    """Test: objects listed in the manifest are range-read without a HEAD."""
+    # Given: Manifest recording the object's size and ETag
+    key, body, df = wide_parquet
+    etag = mock_s3.head_object(Bucket="bi-datasets", Key=key)["ETag"].strip('"')
+    _put_manifest(mock_s3, key, body, etag)
+    monkeypatch.setattr("src.data.parquet_reader.settings.parquet_range_read_min_bytes", 0)
+    reader = ParquetReader()
+    heads = []
+    original = reader.client.head_object
+    monkeypatch.setattr(
+        reader.client, "head_object", lambda **kw: heads.append(kw["Key"]) or original(**kw)
+    )
+
+    # When: Reading one column
+    result = reader.read_dataset("wide", columns=["id"])
+
+    # Then: Correct data, no HEAD request
+    assert result["id"].tolist() == df["id"].tolist()
+    assert heads == []
+
+
+def test_read_dataset_rereads_object_changed_since_manifest(mock_s3, wide_parquet, monkeypatch):
+    """Test: a stale manifest ETag falls back to the object's current version."""
+    # Given: Manifest entry whose ETag no longer matches the object
+    key, body, _ = wide_parquet
+    _put_manifest(mock_s3, key, body, "stale-etag")
+    monkeypatch.setattr("src.data.parquet_reader.settings.parquet_range_read_min_bytes", 0)
+
+    # When: Reading one column
+    result = ParquetReader().read_dataset("wide", columns=["id"])
+
+    # Then: Data comes from the current object
+    assert len(result) == 40_000
@@ -61,12 +61,21 @@ def _make_empty_df() -> pd.DataFrame:
 # ---------------------------------------------------------------------------
 # Common mock patch paths
 # ---------------------------------------------------------------------------
-_PATCH_READER = "src.pages.apac_dot_due_date._callbacks.ParquetReader"
+_PATCH_READER = "src.pages.apac_dot_due_date._callbacks.get_reader"
 _PATCH_LOAD = "src.pages.apac_dot_due_date._callbacks.load_and_filter_data"
 _PATCH_LOAD_2 = "src.pages.apac_dot_due_date._callbacks.load_and_filter_data_2"
 _PATCH_CH00 = "src.pages.apac_dot_due_date._callbacks._ch00_reference_table"
 _PATCH_CH01 = "src.pages.apac_dot_due_date._callbacks._ch01_change_issue_table"
 _PATCH_RESOLVE = "src.pages.apac_dot_due_date._callbacks.resolve_dataset_id"
+_PATCH_LOAD_DATASETS = "src.pages.apac_dot_due_date._callbacks.load_datasets"
+
+
+@pytest.fixture(autouse=True)
+def mock_load_datasets():
+    """Stub the concurrent dataset load; filtering is mocked per test."""
+    with patch(_PATCH_LOAD_DATASETS) as mock:
+        mock.return_value = (MagicMock(), MagicMock())
+        yield mock
 
 
 def _setup_happy_path(mock_reader_cls, mock_load, mock_load_2, mock_ch00, mock_ch01):
@@ -628,6 +628,51 @@ class TestLoadAndFilterDataEdgeCases:
         # row 0: "prc-lowercase-job" (contains prc), row 2: "PRC-Job-3"
         assert len(result) == 2
 
+    @patch("src.pages.apac_dot_due_date._data_loader.get_cached_dataset")
+    def test_preloaded_df_skips_cache_read(self, mock_cache):
+        """A DataFrame passed as df is filtered without loading the dataset."""
+        from src.pages.apac_dot_due_date._data_loader import load_and_filter_data
+
+        reader = MagicMock()
+
+        result = load_and_filter_data(
+            reader, "apac-dot-due-date",
+            selected_months=None,
+            prc_filter_value="all",
+            area_values=["EMEA"],
+            category_values=None,
+            vendor_values=None,
+            amp_av_values=None,
+            order_type_values=None,
+            df=_make_sample_df(),
+        )
+        assert len(result) == 2
+        mock_cache.assert_not_called()
+
+
+class TestLoadDatasets:
+    """load_datasets loads both datasets through load_many."""
+
+    @patch("src.pages.apac_dot_due_date._data_loader.load_many")
+    def test_returns_frames_in_order(self, mock_load_many):
+        from src.pages.apac_dot_due_date._constants import DATASET_COLUMNS, DATASET_COLUMNS_2
+        from src.pages.apac_dot_due_date._data_loader import load_datasets
+
+        df1, df2 = _make_sample_df(), _make_sample_df2()
+        mock_load_many.return_value = {"ds-1": df1, "ds-2": df2}
+        reader = MagicMock()
+
+        result = load_datasets(reader, "ds-1", "ds-2")
+
+        assert result[0] is df1
+        assert result[1] is df2
+        args, _ = mock_load_many.call_args
+        assert args[0] is reader
+        assert [(spec.dataset_id, spec.columns) for spec in args[1]] == [
+            ("ds-1", DATASET_COLUMNS),
+            ("ds-2", DATASET_COLUMNS_2),
+        ]
+
 
 # ---------------------------------------------------------------------------
 # Test data helpers for dataset 2 (change-issue)
@@ -708,7 +753,7 @@ class TestLoadAndFilterData2NoAmpAv:
         expected = [
             "reader", "dataset_id", "selected_months",
             "prc_filter_value", "area_values", "category_values",
-            "vendor_values", "order_type_values",
+            "vendor_values", "order_type_values", "df",
         ]
         assert param_names == expected
 
@@ -856,16 +901,29 @@ class TestLoadAndFilterData2Filters:
 # load_filter_options extended (dataset_id_2) tests
 # ===========================================================================
 
+def _by_dataset_id(df1, df2):
+    """get_cached_dataset stand-in for load_many, which loads in threads."""
+    frames = {"apac-dot-due-date": df1, "apac-dot-ddd-change-issue-sql": df2}
+
+    def _get(reader, dataset_id, **kwargs):
+        frame = frames[dataset_id]
+        if isinstance(frame, Exception):
+            raise frame
+        return frame
+
+    return _get
+
+
 class TestLoadFilterOptionsExtended:
     """load_filter_options with dataset_id_2 parameter."""
 
-    @patch("src.pages.apac_dot_due_date._data_loader.get_cached_dataset")
+    @patch("src.data.data_loader.get_cached_dataset")
     def test_months_union_from_both_datasets(self, mock_cache):
         from src.pages.apac_dot_due_date._data_loader import load_filter_options
 
         df1 = _make_sample_df()   # months: 2024-01, 2024-02, 2024-03
         df2 = _make_sample_df2()  # months: 2024-02, 2024-03, 2024-04
-        mock_cache.side_effect = [df1, df2]
+        mock_cache.side_effect = _by_dataset_id(df1, df2)
         reader = MagicMock()
 
         result = load_filter_options(
@@ -874,13 +932,13 @@ class TestLoadFilterOptionsExtended:
         # Union: 2024-01, 2024-02, 2024-03, 2024-04
         assert result["months"] == ["2024-01", "2024-02", "2024-03", "2024-04"]
 
-    @patch("src.pages.apac_dot_due_date._data_loader.get_cached_dataset")
+    @patch("src.data.data_loader.get_cached_dataset")
     def test_order_types_from_dataset_2(self, mock_cache):
         from src.pages.apac_dot_due_date._data_loader import load_filter_options
 
         df1 = _make_sample_df()   # order tags: TypeA, TypeB, TypeC
         df2 = _make_sample_df2()  # order types: OrderA, OrderB, OrderC
-        mock_cache.side_effect = [df1, df2]
+        mock_cache.side_effect = _by_dataset_id(df1, df2)
         reader = MagicMock()
 
         result = load_filter_options(
@@ -914,14 +972,14 @@ class TestLoadFilterOptionsExtended:
         assert result["months"] == ["2024-01", "2024-02", "2024-03"]
         assert result["order_types"] == ["TypeA", "TypeB", "TypeC"]
 
-    @patch("src.pages.apac_dot_due_date._data_loader.get_cached_dataset")
+    @patch("src.data.data_loader.get_cached_dataset")
     def test_other_fields_unchanged_with_dataset_id_2(self, mock_cache):
         """Fields other than months and order_types should come from dataset 1."""
         from src.pages.apac_dot_due_date._data_loader import load_filter_options
 
         df1 = _make_sample_df()
         df2 = _make_sample_df2()
-        mock_cache.side_effect = [df1, df2]
+        mock_cache.side_effect = _by_dataset_id(df1, df2)
         reader = MagicMock()
 
         result = load_filter_options(
@@ -936,3 +994,40 @@ class TestLoadFilterOptionsExtended:
         assert result["total_count"] == 5
         assert result["prc_count"] == 2
         assert result["non_prc_count"] == 3
+
+    @patch("src.pages.apac_dot_due_date._data_loader.get_cached_dataset")
+    @patch("src.data.data_loader.get_cached_dataset")
+    def test_dataset_2_failure_keeps_dataset_1_options(self, mock_many, mock_cache):
+        """A failing dataset 2 leaves months and order types from dataset 1."""
+        from src.pages.apac_dot_due_date._data_loader import load_filter_options
+
+        mock_many.side_effect = _by_dataset_id(_make_sample_df(), RuntimeError("S3 down"))
+        mock_cache.return_value = _make_sample_df()
+        reader = MagicMock()
+
+        result = load_filter_options(
+            reader, "apac-dot-due-date", dataset_id_2="apac-dot-ddd-change-issue-sql"
+        )
+        assert result["months"] == ["2024-01", "2024-02", "2024-03"]
+        assert result["order_types"] == ["TypeA", "TypeB", "TypeC"]
+        assert result["total_count"] == 5
+
+    @patch("src.pages.apac_dot_due_date._data_loader.load_many")
+    def test_loads_both_datasets_through_load_many(self, mock_load_many):
+        """Both datasets are requested in one concurrent load_many call."""
+        from src.pages.apac_dot_due_date._data_loader import load_filter_options
+
+        mock_load_many.return_value = {
+            "apac-dot-due-date": _make_sample_df(),
+            "apac-dot-ddd-change-issue-sql": _make_sample_df2(),
+        }
+        reader = MagicMock()
+
+        load_filter_options(
+            reader, "apac-dot-due-date", dataset_id_2="apac-dot-ddd-change-issue-sql"
+        )
+        mock_load_many.assert_called_once()
+        specs = mock_load_many.call_args.args[1]
+        assert [spec.dataset_id for spec in specs] == [
+            "apac-dot-due-date", "apac-dot-ddd-change-issue-sql",
+        ]
@@ -37,7 +37,7 @@ def _make_filter_options() -> dict:
 class TestBuildLayoutReturnType:
     """build_layout must return an html.Div component."""
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
     @patch("src.pages.apac_dot_due_date._layout.load_filter_options")
     def test_returns_html_div(self, mock_load_opts, mock_reader_cls):
         mock_load_opts.return_value = _make_filter_options()
@@ -47,7 +47,7 @@ class TestBuildLayoutReturnType:
         result = build_layout()
         assert isinstance(result, html.Div)
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
     @patch("src.pages.apac_dot_due_date._layout.load_filter_options")
     def test_has_page_container_class(self, mock_load_opts, mock_reader_cls):
         mock_load_opts.return_value = _make_filter_options()
@@ -65,7 +65,7 @@ class TestBuildLayoutReturnType:
 class TestPageTitle:
     """build_layout must include an H1 page title."""
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
     @patch("src.pages.apac_dot_due_date._layout.load_filter_options")
     def test_contains_h1_title(self, mock_load_opts, mock_reader_cls):
         mock_load_opts.return_value = _make_filter_options()
@@ -76,7 +76,7 @@ class TestPageTitle:
         h1_components = find_components_by_type(result, html.H1)
         assert len(h1_components) >= 1, "No H1 component found in layout"
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
     @patch("src.pages.apac_dot_due_date._layout.load_filter_options")
     def test_h1_contains_dashboard_text(self, mock_load_opts, mock_reader_cls):
         mock_load_opts.return_value = _make_filter_options()
@@ -98,7 +98,7 @@ class TestPageTitle:
 class TestFilterSection:
     """build_layout must include the filter rows from build_filter_layout."""
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
     @patch("src.pages.apac_dot_due_date._layout.load_filter_options")
     def test_contains_num_percent_toggle(self, mock_load_opts, mock_reader_cls):
         """Filter panel's num-percent-toggle must be present in the layout."""
@@ -110,7 +110,7 @@ class TestFilterSection:
         found = find_component_by_id(result, "apac-dot-ctrl-num-percent")
         assert found is not None, "apac-dot-ctrl-num-percent not found in layout"
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
     @patch("src.pages.apac_dot_due_date._layout.load_filter_options")
     def test_contains_breakdown_tabs(self, mock_load_opts, mock_reader_cls):
         """Filter panel's breakdown-tabs must be present in the layout."""
@@ -122,7 +122,7 @@ class TestFilterSection:
         found = find_component_by_id(result, "apac-dot-ctrl-breakdown")
         assert found is not None, "apac-dot-ctrl-breakdown not found in layout"
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
     @patch("src.pages.apac_dot_due_date._layout.load_filter_options")
     def test_contains_filter_month(self, mock_load_opts, mock_reader_cls):
         """Filter panel's filter-month must be present in the layout."""
@@ -134,7 +134,7 @@ class TestFilterSection:
         found = find_component_by_id(result, "apac-dot-filter-month")
         assert found is not None, "apac-dot-filter-month not found in layout"
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
     @patch("src.pages.apac_dot_due_date._layout.load_filter_options")
     def test_contains_prc_filter(self, mock_load_opts, mock_reader_cls):
         """Filter panel's prc-filter must be present in the layout."""
@@ -154,7 +154,7 @@ class TestFilterSection:
 class TestChartSection:
     """build_layout must include the chart/table section (apac-dot-chart-00)."""
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
     @patch("src.pages.apac_dot_due_date._layout.load_filter_options")
     def test_contains_table_title_id(self, mock_load_opts, mock_reader_cls):
         """Table section must have an element with id='apac-dot-chart-00-title'."""
@@ -166,7 +166,7 @@ class TestChartSection:
         found = find_component_by_id(result, "apac-dot-chart-00-title")
         assert found is not None, "apac-dot-chart-00-title element not found in layout"
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
     @patch("src.pages.apac_dot_due_date._layout.load_filter_options")
     def test_table_title_is_h3(self, mock_load_opts, mock_reader_cls):
         """apac-dot-chart-00-title should be an H3 element."""
@@ -180,7 +180,7 @@ class TestChartSection:
             f"Expected html.H3, got {type(found).__name__}"
         )
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
     @patch("src.pages.apac_dot_due_date._layout.load_filter_options")
     def test_contains_apac_table_id(self, mock_load_opts, mock_reader_cls):
         """Table section must have an element with id='apac-dot-chart-00'."""
@@ -192,7 +192,7 @@ class TestChartSection:
         found = find_component_by_id(result, "apac-dot-chart-00")
         assert found is not None, "apac-dot-chart-00 element not found in layout"
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
     @patch("src.pages.apac_dot_due_date._layout.load_filter_options")
     def test_apac_table_is_div(self, mock_load_opts, mock_reader_cls):
         """apac-dot-chart-00 should be an html.Div element."""
@@ -208,7 +208,7 @@ class TestChartSection:
 
     # --- Chart 01 (DDD Change + Issue Table) ---
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
     @patch("src.pages.apac_dot_due_date._layout.load_filter_options")
     def test_contains_chart_01_title_id(self, mock_load_opts, mock_reader_cls):
         """Chart 01 section must have an element with id='apac-dot-chart-01-title'."""
@@ -220,7 +220,7 @@ class TestChartSection:
         found = find_component_by_id(result, "apac-dot-chart-01-title")
         assert found is not None, "apac-dot-chart-01-title element not found in layout"
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
     @patch("src.pages.apac_dot_due_date._layout.load_filter_options")
     def test_chart_01_title_is_h3(self, mock_load_opts, mock_reader_cls):
         """apac-dot-chart-01-title should be an H3 element."""
@@ -234,7 +234,7 @@ class TestChartSection:
             f"Expected html.H3, got {type(found).__name__}"
         )
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
     @patch("src.pages.apac_dot_due_date._layout.load_filter_options")
     def test_contains_chart_01_id(self, mock_load_opts, mock_reader_cls):
         """Chart 01 section must have an element with id='apac-dot-chart-01'."""
@@ -246,7 +246,7 @@ class TestChartSection:
         found = find_component_by_id(result, "apac-dot-chart-01")
         assert found is not None, "apac-dot-chart-01 element not found in layout"
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
     @patch("src.pages.apac_dot_due_date._layout.load_filter_options")
     def test_chart_01_is_div(self, mock_load_opts, mock_reader_cls):
         """apac-dot-chart-01 should be an html.Div element."""
@@ -268,7 +268,7 @@ class TestChartSection:
 class TestLayoutStructureOrder:
     """Verify the overall structure: title -> filters -> chart section."""
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
     @patch("src.pages.apac_dot_due_date._layout.load_filter_options")
     def test_layout_children_count(self, mock_load_opts, mock_reader_cls):
         """Layout should have at least 8 children: H1 + 5 filter rows + 2 chart rows."""
@@ -283,7 +283,7 @@ class TestLayoutStructureOrder:
             f"Expected at least 8 children, got {len(children)}"
         )
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
     @patch("src.pages.apac_dot_due_date._layout.load_filter_options")
     def test_first_child_is_h1(self, mock_load_opts, mock_reader_cls):
         """First child of layout should be the H1 title."""
@@ -294,7 +294,7 @@ class TestLayoutStructureOrder:
         result = build_layout()
         assert isinstance(result.children[0], html.H1)
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
     @patch("src.pages.apac_dot_due_date._layout.load_filter_options")
     def test_last_child_is_chart_01_section_row(self, mock_load_opts, mock_reader_cls):
         """Last child should be the dbc.Row containing the chart-01 section."""
@@ -319,7 +319,7 @@ class TestLayoutStructureOrder:
 class TestBuildLayoutCallsFilterLayout:
     """build_layout must delegate filter construction to build_filter_layout."""
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
     @patch("src.pages.apac_dot_due_date._layout.load_filter_options")
     @patch("src.pages.apac_dot_due_date._layout.build_filter_layout")
     def test_calls_build_filter_layout_with_options(
@@ -12,7 +12,7 @@ def _make_empty_df() -> pd.DataFrame:
 
 @patch("src.pages.cursor_usage._callbacks.load_and_filter_data")
 @patch("src.pages.cursor_usage._callbacks.resolve_dataset_id_for_dashboard")
-@patch("src.pages.cursor_usage._callbacks.ParquetReader")
+@patch("src.pages.cursor_usage._callbacks.get_reader")
 def test_update_dashboard_uses_registry_dataset_id(
     mock_reader_cls, mock_resolve, mock_load
 ):
@@ -48,6 +48,12 @@ def _make_empty_df() -> pd.DataFrame:
     })
 
 
+def _as_cached(df: pd.DataFrame) -> pd.DataFrame:
+    """What get_cached_dataset returns for the page's prepared view."""
+    from src.pages.cursor_usage._data_loader import _prepare_usage_df
+    return _prepare_usage_df(df)
+
+
 # ===========================================================================
 # load_filter_options tests
 # ===========================================================================
@@ -59,7 +65,7 @@ class TestLoadFilterOptionsReturnStructure:
     def test_returns_dict(self, mock_cache):
         from src.pages.cursor_usage._data_loader import load_filter_options
 
-        mock_cache.return_value = _make_sample_df()
+        mock_cache.return_value = _as_cached(_make_sample_df())
         reader = MagicMock()
 
         result = load_filter_options(reader, "cursor-usage")
@@ -69,7 +75,7 @@ class TestLoadFilterOptionsReturnStructure:
     def test_has_all_required_keys(self, mock_cache):
         from src.pages.cursor_usage._data_loader import load_filter_options
 
-        mock_cache.return_value = _make_sample_df()
+        mock_cache.return_value = _as_cached(_make_sample_df())
         reader = MagicMock()
 
         result = load_filter_options(reader, "cursor-usage")
@@ -84,7 +90,7 @@ class TestLoadFilterOptionsValues:
     def test_models_sorted_unique(self, mock_cache):
         from src.pages.cursor_usage._data_loader import load_filter_options
 
-        mock_cache.return_value = _make_sample_df()
+        mock_cache.return_value = _as_cached(_make_sample_df())
         reader = MagicMock()
 
         result = load_filter_options(reader, "cursor-usage")
@@ -94,7 +100,7 @@ class TestLoadFilterOptionsValues:
     def test_models_is_list(self, mock_cache):
         from src.pages.cursor_usage._data_loader import load_filter_options
 
-        mock_cache.return_value = _make_sample_df()
+        mock_cache.return_value = _as_cached(_make_sample_df())
         reader = MagicMock()
 
         result = load_filter_options(reader, "cursor-usage")
@@ -104,7 +110,7 @@ class TestLoadFilterOptionsValues:
     def test_min_date_is_string(self, mock_cache):
         from src.pages.cursor_usage._data_loader import load_filter_options
 
-        mock_cache.return_value = _make_sample_df()
+        mock_cache.return_value = _as_cached(_make_sample_df())
         reader = MagicMock()
 
         result = load_filter_options(reader, "cursor-usage")
@@ -114,7 +120,7 @@ class TestLoadFilterOptionsValues:
     def test_max_date_is_string(self, mock_cache):
         from src.pages.cursor_usage._data_loader import load_filter_options
 
-        mock_cache.return_value = _make_sample_df()
+        mock_cache.return_value = _as_cached(_make_sample_df())
         reader = MagicMock()
 
         result = load_filter_options(reader, "cursor-usage")
@@ -124,7 +130,7 @@ class TestLoadFilterOptionsValues:
     def test_min_date_value(self, mock_cache):
         from src.pages.cursor_usage._data_loader import load_filter_options
 
-        mock_cache.return_value = _make_sample_df()
+        mock_cache.return_value = _as_cached(_make_sample_df())
         reader = MagicMock()
 
         result = load_filter_options(reader, "cursor-usage")
@@ -135,13 +141,29 @@ class TestLoadFilterOptionsValues:
     def test_max_date_value(self, mock_cache):
         from src.pages.cursor_usage._data_loader import load_filter_options
 
-        mock_cache.return_value = _make_sample_df()
+        mock_cache.return_value = _as_cached(_make_sample_df())
         reader = MagicMock()
 
         result = load_filter_options(reader, "cursor-usage")
         # Latest date in sample: 2024-03-01
         assert result["max_date"] == "2024-03-01"
 
+    @patch("src.pages.cursor_usage._data_loader.get_cached_dataset")
+    def test_reads_only_option_columns(self, mock_cache):
+        """Options are built from a projection without the measure columns."""
+        from src.pages.cursor_usage._data_loader import load_filter_options
+
+        df = _make_sample_df().drop(columns=["Cost", "Total Tokens"])
+        mock_cache.return_value = _as_cached(df)
+        reader = MagicMock()
+
+        result = load_filter_options(reader, "cursor-usage")
+        _, kwargs = mock_cache.call_args
+        assert kwargs["columns"] == ["Date", "Model", "User", "Kind"]
+        assert kwargs["date_range"] is None
+        assert set(kwargs["categories"] or []) <= set(kwargs["columns"])
+        assert result["users"] == ["alice", "bob", "charlie"]
+
 
 class TestLoadFilterOptionsException:
     """load_filter_options must return defaults on exception."""
@@ -168,7 +190,7 @@ class TestLoadFilterOptionsEdgeCases:
 
         df = _make_sample_df()
         df.loc[0, "Model"] = None
-        mock_cache.return_value = df
+        mock_cache.return_value = _as_cached(df)
         reader = MagicMock()
 
         result = load_filter_options(reader, "cursor-usage")
@@ -182,7 +204,7 @@ class TestLoadFilterOptionsEdgeCases:
     def test_empty_dataframe_returns_empty_models(self, mock_cache):
         from src.pages.cursor_usage._data_loader import load_filter_options
 
-        mock_cache.return_value = _make_empty_df()
+        mock_cache.return_value = _as_cached(_make_empty_df())
         reader = MagicMock()
 
         result = load_filter_options(reader, "cursor-usage")
@@ -192,7 +214,7 @@ class TestLoadFilterOptionsEdgeCases:
     def test_empty_dataframe_returns_none_dates(self, mock_cache):
         from src.pages.cursor_usage._data_loader import load_filter_options
 
-        mock_cache.return_value = _make_empty_df()
+        mock_cache.return_value = _as_cached(_make_empty_df())
         reader = MagicMock()
 
         result = load_filter_options(reader, "cursor-usage")
@@ -204,7 +226,7 @@ class TestLoadFilterOptionsEdgeCases:
         from src.pages.cursor_usage._data_loader import load_filter_options
 
         df = _make_sample_df().drop(columns=["Model"])
-        mock_cache.return_value = df
+        mock_cache.return_value = _as_cached(df)
         reader = MagicMock()
 
         result = load_filter_options(reader, "cursor-usage")
@@ -222,7 +244,7 @@ class TestLoadAndFilterDataBasic:
     def test_returns_dataframe(self, mock_cache):
         from src.pages.cursor_usage._data_loader import load_and_filter_data
 
-        mock_cache.return_value = _make_sample_df()
+        mock_cache.return_value = _as_cached(_make_sample_df())
         reader = MagicMock()
 
         result = load_and_filter_data(
@@ -237,7 +259,7 @@ class TestLoadAndFilterDataBasic:
     def test_no_filters_returns_all_rows(self, mock_cache):
         from src.pages.cursor_usage._data_loader import load_and_filter_data
 
-        mock_cache.return_value = _make_sample_df()
+        mock_cache.return_value = _as_cached(_make_sample_df())
         reader = MagicMock()
 
         result = load_and_filter_data(
@@ -256,7 +278,7 @@ class TestLoadAndFilterDataTimezone:
     def test_date_column_is_timezone_naive(self, mock_cache):
         from src.pages.cursor_usage._data_loader import load_and_filter_data
 
-        mock_cache.return_value = _make_sample_df()
+        mock_cache.return_value = _as_cached(_make_sample_df())
         reader = MagicMock()
 
         result = load_and_filter_data(
@@ -277,7 +299,7 @@ class TestLoadAndFilterDataTimezone:
         # Confirm input IS timezone-aware
         assert df["Date"].dt.tz is not None
 
-        mock_cache.return_value = df
+        mock_cache.return_value = _as_cached(df)
         reader = MagicMock()
 
         result = load_and_filter_data(
@@ -297,7 +319,7 @@ class TestLoadAndFilterDataDateFilter:
     def test_start_and_end_date_filter(self, mock_cache):
         from src.pages.cursor_usage._data_loader import load_and_filter_data
 
-        mock_cache.return_value = _make_sample_df()
+        mock_cache.return_value = _as_cached(_make_sample_df())
         reader = MagicMock()
 
         result = load_and_filter_data(
@@ -313,7 +335,7 @@ class TestLoadAndFilterDataDateFilter:
     def test_start_date_boundary_inclusive(self, mock_cache):
         from src.pages.cursor_usage._data_loader import load_and_filter_data
 
-        mock_cache.return_value = _make_sample_df()
+        mock_cache.return_value = _as_cached(_make_sample_df())
         reader = MagicMock()
 
         result = load_and_filter_data(
@@ -329,7 +351,7 @@ class TestLoadAndFilterDataDateFilter:
     def test_end_date_boundary_inclusive(self, mock_cache):
         from src.pages.cursor_usage._data_loader import load_and_filter_data
 
-        mock_cache.return_value = _make_sample_df()
+        mock_cache.return_value = _as_cached(_make_sample_df())
         reader = MagicMock()
 
         result = load_and_filter_data(
@@ -345,7 +367,7 @@ class TestLoadAndFilterDataDateFilter:
     def test_narrow_date_range_excludes_out_of_range(self, mock_cache):
         from src.pages.cursor_usage._data_loader import load_and_filter_data
 
-        mock_cache.return_value = _make_sample_df()
+        mock_cache.return_value = _as_cached(_make_sample_df())
         reader = MagicMock()
 
         result = load_and_filter_data(
@@ -357,6 +379,45 @@ class TestLoadAndFilterDataDateFilter:
         # February rows: 2024-02-05 and 2024-02-20
         assert len(result) == 2
 
+    @patch("src.pages.cursor_usage._data_loader.get_cached_dataset")
+    def test_date_range_pushed_down_to_cache(self, mock_cache):
+        """The date window (widened by a day for timezones) reaches the cache."""
+        from src.pages.cursor_usage._data_loader import load_and_filter_data
+
+        mock_cache.return_value = _as_cached(_make_sample_df())
+        reader = MagicMock()
+
+        result = load_and_filter_data(
+            reader, "cursor-usage",
+            start_date="2024-02-01",
+            end_date="2024-02-28",
+            model_values=None,
+            user_values=None,
+            kind_values=None,
+        )
+        _, kwargs = mock_cache.call_args
+        assert kwargs["date_range"] == ("2024-01-31", "2024-02-29")
+        assert kwargs["view"] == "cursor_usage"
+        assert len(result) == 2
+
+    @patch("src.pages.cursor_usage._data_loader.get_cached_dataset")
+    def test_no_date_range_without_both_dates(self, mock_cache):
+        from src.pages.cursor_usage._data_loader import load_and_filter_data
+
+        mock_cache.return_value = _as_cached(_make_sample_df())
+        reader = MagicMock()
+
+        load_and_filter_data(
+            reader, "cursor-usage",
+            start_date="2024-02-01",
+            end_date=None,
+            model_values=None,
+            user_values=None,
+            kind_values=None,
+        )
+        _, kwargs = mock_cache.call_args
+        assert kwargs["date_range"] is None
+
 
 class TestLoadAndFilterDataModelFilter:
     """load_and_filter_data model filter logic."""
@@ -365,7 +426,7 @@ class TestLoadAndFilterDataModelFilter:
     def test_single_model_filter(self, mock_cache):
         from src.pages.cursor_usage._data_loader import load_and_filter_data
 
-        mock_cache.return_value = _make_sample_df()
+        mock_cache.return_value = _as_cached(_make_sample_df())
         reader = MagicMock()
 
         result = load_and_filter_data(
@@ -381,7 +442,7 @@ class TestLoadAndFilterDataModelFilter:
     def test_multiple_model_filter(self, mock_cache):
         from src.pages.cursor_usage._data_loader import load_and_filter_data
 
-        mock_cache.return_value = _make_sample_df()
+        mock_cache.return_value = _as_cached(_make_sample_df())
         reader = MagicMock()
 
         result = load_and_filter_data(
@@ -397,7 +458,7 @@ class TestLoadAndFilterDataModelFilter:
     def test_nonexistent_model_returns_empty(self, mock_cache):
         from src.pages.cursor_usage._data_loader import load_and_filter_data
 
-        mock_cache.return_value = _make_sample_df()
+        mock_cache.return_value = _as_cached(_make_sample_df())
         reader = MagicMock()
 
         result = load_and_filter_data(
@@ -416,7 +477,7 @@ class TestLoadAndFilterDataCombinedFilters:
     def test_date_plus_model_combined(self, mock_cache):
         from src.pages.cursor_usage._data_loader import load_and_filter_data
 
-        mock_cache.return_value = _make_sample_df()
+        mock_cache.return_value = _as_cached(_make_sample_df())
         reader = MagicMock()
 
         result = load_and_filter_data(
@@ -433,7 +494,7 @@ class TestLoadAndFilterDataCombinedFilters:
     def test_combined_filters_no_match_returns_empty(self, mock_cache):
         from src.pages.cursor_usage._data_loader import load_and_filter_data
 
-        mock_cache.return_value = _make_sample_df()
+        mock_cache.return_value = _as_cached(_make_sample_df())
         reader = MagicMock()
 
         result = load_and_filter_data(
@@ -454,7 +515,7 @@ class TestLoadAndFilterDataEdgeCases:
         """Empty list [] should not filter (same as None)."""
         from src.pages.cursor_usage._data_loader import load_and_filter_data
 
-        mock_cache.return_value = _make_sample_df()
+        mock_cache.return_value = _as_cached(_make_sample_df())
         reader = MagicMock()
 
         result = load_and_filter_data(
@@ -471,7 +532,7 @@ class TestLoadAndFilterDataEdgeCases:
         """If only start_date is provided (end_date is None), no date filter applied."""
         from src.pages.cursor_usage._data_loader import load_and_filter_data
 
-        mock_cache.return_value = _make_sample_df()
+        mock_cache.return_value = _as_cached(_make_sample_df())
         reader = MagicMock()
 
         result = load_and_filter_data(
@@ -488,7 +549,7 @@ class TestLoadAndFilterDataEdgeCases:
         """If only end_date is provided (start_date is None), no date filter applied."""
         from src.pages.cursor_usage._data_loader import load_and_filter_data
 
-        mock_cache.return_value = _make_sample_df()
+        mock_cache.return_value = _as_cached(_make_sample_df())
         reader = MagicMock()
 
         result = load_and_filter_data(
@@ -505,7 +566,7 @@ class TestLoadAndFilterDataEdgeCases:
         """DateOnly column should be created for date-based grouping."""
         from src.pages.cursor_usage._data_loader import load_and_filter_data
 
-        mock_cache.return_value = _make_sample_df()
+        mock_cache.return_value = _as_cached(_make_sample_df())
         reader = MagicMock()
 
         result = load_and_filter_data(
@@ -520,7 +581,7 @@ class TestLoadAndFilterDataEdgeCases:
     def test_empty_dataframe_returns_empty(self, mock_cache):
         from src.pages.cursor_usage._data_loader import load_and_filter_data
 
-        mock_cache.return_value = _make_empty_df()
+        mock_cache.return_value = _as_cached(_make_empty_df())
         reader = MagicMock()
 
         result = load_and_filter_data(
@@ -531,3 +592,38 @@ class TestLoadAndFilterDataEdgeCases:
         )
         assert len(result) == 0
         assert isinstance(result, pd.DataFrame)
+
+
+class TestPreparedView:
+    """The Date normalization runs in the cache's prepare step, not per call."""
+
+    def test_prepare_usage_df_strips_timezone_and_adds_date_only(self):
+        from src.pages.cursor_usage._data_loader import _prepare_usage_df
+
+        raw = _make_sample_df()
+        result = _prepare_usage_df(raw)
+
+        assert result["Date"].dt.tz is None
+        assert result["DateOnly"].iloc[0].isoformat() == "2024-01-10"
+        assert raw["Date"].dt.tz is not None
+
+    @patch("src.pages.cursor_usage._data_loader.get_cached_dataset")
+    def test_cached_frame_is_not_modified(self, mock_cache):
+        from src.pages.cursor_usage._data_loader import load_and_filter_data, load_filter_options
+
+        cached = _as_cached(_make_sample_df())
+        before = cached.copy()
+        mock_cache.return_value = cached
+        reader = MagicMock()
+
+        load_filter_options(reader, "cursor-usage")
+        load_and_filter_data(
+            reader, "cursor-usage",
+            start_date="2024-02-01",
+            end_date="2024-02-28",
+            model_values=["gpt-4"],
+            user_values=None,
+            kind_values=None,
+        )
+
+        pd.testing.assert_frame_equal(cached, before)
@@ -24,9 +24,9 @@ def _make_sample_df() -> pd.DataFrame:
 
 @patch("src.pages.hamm_overview._data_loader.get_cached_dataset")
 def test_load_filter_options_returns_expected_keys(mock_cache):
-    from src.pages.hamm_overview._data_loader import load_filter_options
+    from src.pages.hamm_overview._data_loader import _prepare_base_df, load_filter_options
 
-    mock_cache.return_value = _make_sample_df()
+    mock_cache.return_value = _prepare_base_df(_make_sample_df())
     reader = MagicMock()
 
     result = load_filter_options(reader, "hamm-dashboard")
@@ -46,11 +46,60 @@ def test_load_filter_options_returns_expected_keys(mock_cache):
     assert set(result.keys()) == expected
 
 
+
+@patch("src.core.callback_memo.get_cached_version", return_value="v1")
+@patch("src.pages.hamm_overview._data_loader.get_cached_dataset")
+def test_load_filter_options_computed_once_per_dataset_version(mock_cache, mock_version):
+    from flask import Flask
+    from src.core.callback_memo import reset_callback_memo
+    from src.pages.hamm_overview._data_loader import _prepare_base_df, load_filter_options
+
+    # Given: A cached dataset version
+    reset_callback_memo()
+    mock_cache.return_value = _prepare_base_df(_make_sample_df())
+    reader = MagicMock()
+
+    with Flask(__name__).app_context():
+        # When: Visiting the page twice, then after the dataset changed
+        first = load_filter_options(reader, "hamm-dashboard")
+        second = load_filter_options(reader, "hamm-dashboard")
+        mock_version.return_value = "v2"
+        load_filter_options(reader, "hamm-dashboard")
+    reset_callback_memo()
+
+    # Then: The data was scanned once per version
+    assert first == second
+    assert first["regions"] == ["APAC"]
+    assert mock_cache.call_count == 2
+
+
+@patch("src.core.callback_memo.get_cached_version", return_value="v1")
+@patch("src.pages.hamm_overview._data_loader.get_cached_dataset")
+def test_load_filter_options_defaults_are_not_memoized(mock_cache, mock_version):
+    from flask import Flask
+    from src.core.callback_memo import reset_callback_memo
+    from src.pages.hamm_overview._data_loader import _prepare_base_df, load_filter_options
+
+    # Given: A dataset read that fails once
+    reset_callback_memo()
+    mock_cache.side_effect = [RuntimeError("S3 unavailable"), _prepare_base_df(_make_sample_df())]
+    reader = MagicMock()
+
+    with Flask(__name__).app_context():
+        # When: Visiting the page twice
+        failed = load_filter_options(reader, "hamm-dashboard")
+        recovered = load_filter_options(reader, "hamm-dashboard")
+    reset_callback_memo()
+
+    # Then: The defaults were not served again
+    assert failed["regions"] == []
+    assert recovered["regions"] == ["APAC"]
+
 @patch("src.pages.hamm_overview._data_loader.get_cached_dataset")
 def test_load_and_filter_data_filters_by_region_and_year(mock_cache):
-    from src.pages.hamm_overview._data_loader import load_and_filter_data
+    from src.pages.hamm_overview._data_loader import _prepare_base_df, load_and_filter_data
 
-    mock_cache.return_value = _make_sample_df()
+    mock_cache.return_value = _prepare_base_df(_make_sample_df())
     reader = MagicMock()
 
     df = load_and_filter_data(
@@ -70,6 +119,7 @@ def test_load_and_filter_data_filters_by_region_and_year(mock_cache):
 
     assert len(df) == 2
     assert set(df["_year"].unique()) == {"2026"}
+    assert mock_cache.call_args.kwargs["view"] == "hamm_overview"
 
 
 @patch("src.pages.hamm_overview._data_loader.get_cached_dataset")
@@ -132,3 +182,30 @@ def test_prepare_base_df_preserves_original_video_duration():
 
     assert "video_duration" in result.columns
     assert result["video_duration"].iloc[0] == "00:10:00"
+
+
+def test_prepare_base_df_returns_materialized_frame_unchanged():
+    from src.data.derived_columns import add_hamm_derived_columns
+    from src.pages.hamm_overview._data_loader import _prepare_base_df
+
+    df = add_hamm_derived_columns(_make_sample_df())
+
+    result = _prepare_base_df(df)
+
+    assert result is df
+
+
+def test_add_cadence_columns_uses_materialized_labels():
+    from src.data.derived_columns import add_hamm_derived_columns
+    from src.pages.hamm_overview._data_loader import _prepare_base_df, add_cadence_columns
+
+    raw = _make_sample_df()
+    materialized = add_hamm_derived_columns(raw)
+
+    for cadence in ("weekly", "monthly", "quarterly", "yearly"):
+        expected = add_cadence_columns(_prepare_base_df(raw), cadence)
+        with patch("src.pages.hamm_overview._data_loader.hamm_period_labels") as mock_labels:
+            result = add_cadence_columns(materialized, cadence)
+        mock_labels.assert_not_called()
+        for column in ("_fiscal_year", "_fiscal_quarter", "_iso_week", "_start_date", "_end_date"):
+            assert result[column].astype(str).tolist() == expected[column].astype(str).tolist()
@@ -52,8 +52,8 @@ class TestLayoutFilterOptionsWithNaN:
     """Test that layout() correctly generates filter options when DataFrame
     columns contain NaN values mixed with valid strings."""
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
-    @patch("src.pages.apac_dot_due_date._data_loader.get_cached_dataset")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
+    @patch("src.data.data_loader.get_cached_dataset")
     def test_nan_mixed_data_does_not_raise(self, mock_get_cached, _mock_reader):
         """layout() must not raise TypeError when NaN values are present
         in filter columns.
@@ -78,8 +78,8 @@ class TestLayoutFilterOptionsWithNaN:
             "the except-all fallback swallowed the TypeError"
         )
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
-    @patch("src.pages.apac_dot_due_date._data_loader.get_cached_dataset")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
+    @patch("src.data.data_loader.get_cached_dataset")
     def test_nan_excluded_from_month_filter(self, mock_get_cached, _mock_reader):
         """NaN must not appear in the month filter dropdown options."""
         mock_get_cached.return_value = _make_nan_df()
@@ -99,8 +99,8 @@ class TestLayoutFilterOptionsWithNaN:
         # Should contain the 3 valid months
         assert sorted(option_values) == ["2024-01", "2024-02", "2024-03"]
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
-    @patch("src.pages.apac_dot_due_date._data_loader.get_cached_dataset")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
+    @patch("src.data.data_loader.get_cached_dataset")
     def test_nan_excluded_from_area_filter(self, mock_get_cached, _mock_reader):
         """NaN must not appear in the business area filter dropdown options."""
         mock_get_cached.return_value = _make_nan_df()
@@ -118,8 +118,8 @@ class TestLayoutFilterOptionsWithNaN:
             )
         assert sorted(option_values) == ["APAC", "EMEA"]
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
-    @patch("src.pages.apac_dot_due_date._data_loader.get_cached_dataset")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
+    @patch("src.data.data_loader.get_cached_dataset")
     def test_nan_excluded_from_workstream_filter(self, mock_get_cached, _mock_reader):
         """NaN must not appear in the Metric Workstream filter options."""
         mock_get_cached.return_value = _make_nan_df()
@@ -137,8 +137,8 @@ class TestLayoutFilterOptionsWithNaN:
             )
         assert sorted(option_values) == ["WS-A", "WS-B"]
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
-    @patch("src.pages.apac_dot_due_date._data_loader.get_cached_dataset")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
+    @patch("src.data.data_loader.get_cached_dataset")
     def test_nan_excluded_from_vendor_filter(self, mock_get_cached, _mock_reader):
         """NaN must not appear in the Vendor filter options."""
         mock_get_cached.return_value = _make_nan_df()
@@ -156,8 +156,8 @@ class TestLayoutFilterOptionsWithNaN:
             )
         assert sorted(option_values) == ["Vendor X", "Vendor Y"]
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
-    @patch("src.pages.apac_dot_due_date._data_loader.get_cached_dataset")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
+    @patch("src.data.data_loader.get_cached_dataset")
     def test_nan_excluded_from_amp_av_filter(self, mock_get_cached, _mock_reader):
         """NaN must not appear in the AMP VS AV Scope filter options."""
         mock_get_cached.return_value = _make_nan_df()
@@ -175,8 +175,8 @@ class TestLayoutFilterOptionsWithNaN:
             )
         assert sorted(option_values) == ["AMP", "AV"]
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
-    @patch("src.pages.apac_dot_due_date._data_loader.get_cached_dataset")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
+    @patch("src.data.data_loader.get_cached_dataset")
     def test_nan_excluded_from_order_type_filter(self, mock_get_cached, _mock_reader):
         """NaN must not appear in the order tags filter options."""
         mock_get_cached.return_value = _make_nan_df()
@@ -194,8 +194,8 @@ class TestLayoutFilterOptionsWithNaN:
             )
         assert sorted(option_values) == ["Type A", "Type B"]
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
-    @patch("src.pages.apac_dot_due_date._data_loader.get_cached_dataset")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
+    @patch("src.data.data_loader.get_cached_dataset")
     def test_month_filter_default_value_excludes_nan(self, mock_get_cached, _mock_reader):
         """The default value of the month filter (all months selected)
         must not include NaN."""
@@ -213,8 +213,8 @@ class TestLayoutFilterOptionsWithNaN:
             )
         assert sorted(default_months) == ["2024-01", "2024-02", "2024-03"]
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
-    @patch("src.pages.apac_dot_due_date._data_loader.get_cached_dataset")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
+    @patch("src.data.data_loader.get_cached_dataset")
     def test_filter_options_sorted_alphabetically(self, mock_get_cached, _mock_reader):
         """Filter options should be sorted even when NaN values are present."""
         mock_get_cached.return_value = _make_nan_df()
@@ -247,8 +247,8 @@ class TestLayoutFilterOptionsWithNaN:
 class TestLayoutFilterOptionsCleanData:
     """Baseline: layout() works correctly with clean data (no NaN)."""
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
-    @patch("src.pages.apac_dot_due_date._data_loader.get_cached_dataset")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
+    @patch("src.data.data_loader.get_cached_dataset")
     def test_clean_data_produces_correct_options(self, mock_get_cached, _mock_reader):
         """With no NaN values, all filter options should be populated correctly."""
         mock_get_cached.return_value = _make_clean_df()
@@ -268,8 +268,8 @@ class TestLayoutFilterOptionsCleanData:
         area_values = [o["value"] for o in area_options]
         assert sorted(area_values) == ["APAC", "EMEA"]
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
-    @patch("src.pages.apac_dot_due_date._data_loader.get_cached_dataset")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
+    @patch("src.data.data_loader.get_cached_dataset")
     def test_prc_count_correct_with_clean_data(self, mock_get_cached, _mock_reader):
         """PRC filter counts should be correct with clean data."""
         mock_get_cached.return_value = _make_clean_df()
@@ -286,8 +286,8 @@ class TestLayoutFilterOptionsCleanData:
 class TestLayoutFilterOptionsAllNaN:
     """Edge case: a column where ALL values are NaN."""
 
-    @patch("src.pages.apac_dot_due_date._layout.ParquetReader")
-    @patch("src.pages.apac_dot_due_date._data_loader.get_cached_dataset")
+    @patch("src.pages.apac_dot_due_date._layout.get_reader")
+    @patch("src.data.data_loader.get_cached_dataset")
     def test_all_nan_column_produces_empty_options(self, mock_get_cached, _mock_reader):
         """If a column is entirely NaN, its filter should have zero options
         (not raise an error)."""